@@ -0,0 +1,104 @@
+"""Compare page-load time and Chrome memory between the default and lean browser modes.
+
+Starts one browser per mode, loads each URL a few times and reports the load time
+(navigation start to load event) and the resident memory of the whole Chrome
+process tree, measured with ps:
+
+    python -m benchmarks.browser_footprint --repeat 3 https://www.linkedin.com/jobs/
+    python -m benchmarks.browser_footprint --fake-linkedin   # against benchmarks.fake_linkedin
+"""
+import time
+import argparse
+import statistics
+import subprocess
+
+from config.config import LINKEDIN_JOBS_URL
+from linkedin.browser_manager import BrowserManager
+
+
+def process_tree_rss_mb(root_pid):
+    """Total RSS in MB of a process and all of its descendants."""
+    output = subprocess.run(["ps", "-A", "-o", "pid=,ppid=,rss="], capture_output=True, text=True, check=True).stdout
+    children = {}
+    rss = {}
+    for line in output.splitlines():
+        pid, ppid, kb = (int(value) for value in line.split())
+        children.setdefault(ppid, []).append(pid)
+        rss[pid] = kb
+
+    total = 0
+    stack = [root_pid]
+    while stack:
+        pid = stack.pop()
+        total += rss.get(pid, 0)
+        stack.extend(children.get(pid, []))
+    return total / 1024
+
+
+def page_load_seconds(driver, url):
+    """Load url and return (wall seconds, navigation-timing load seconds)."""
+    started = time.monotonic()
+    driver.get(url)
+    wall = time.monotonic() - started
+    timing = driver.execute_script("""
+        var nav = performance.getEntriesByType('navigation')[0];
+        return nav ? nav.loadEventEnd - nav.startTime : null;
+    """)
+    return wall, (timing / 1000 if timing else wall)
+
+
+def measure(lean, urls, repeat):
+    """Load every URL repeat times in a fresh browser and return the measurements."""
+    browser = BrowserManager()
+    driver = browser.initialize_browser(profile_dir=None, lean=lean)
+    try:
+        loads = []
+        peak_rss = 0.0
+        for _ in range(repeat):
+            for url in urls:
+                loads.append(page_load_seconds(driver, url)[1])
+                peak_rss = max(peak_rss, process_tree_rss_mb(browser.driver.service.process.pid))
+        return {
+            "mode": "lean" if lean else "default",
+            "pages": len(loads),
+            "load_median": statistics.median(loads),
+            "load_max": max(loads),
+            "rss_end_mb": process_tree_rss_mb(browser.driver.service.process.pid),
+            "rss_peak_mb": peak_rss
+        }
+    finally:
+        browser.quit()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure page-load time and Chrome RSS for default vs lean mode")
+    parser.add_argument("urls", nargs="*", help=f"Pages to load (default: {LINKEDIN_JOBS_URL})")
+    parser.add_argument("--repeat", type=int, default=3, help="Times each URL is loaded per mode")
+    parser.add_argument("--fake-linkedin", action="store_true", help="Serve the pages from benchmarks.fake_linkedin")
+    args = parser.parse_args()
+
+    server = None
+    urls = args.urls or [LINKEDIN_JOBS_URL]
+    if args.fake_linkedin:
+        from .fake_linkedin import FakeLinkedInServer
+        server = FakeLinkedInServer()
+        base_url = server.start()
+        urls = [f"{base_url}/jobs/view/{job_id}/" for job_id in server.jobs]
+
+    try:
+        results = [measure(lean, urls, args.repeat) for lean in (False, True)]
+    finally:
+        if server:
+            server.stop()
+
+    print(f"{'mode':<8} {'pages':>5} {'load p50':>9} {'load max':>9} {'RSS end':>9} {'RSS peak':>9}")
+    for row in results:
+        print(f"{row['mode']:<8} {row['pages']:>5} {row['load_median']:>8.2f}s {row['load_max']:>8.2f}s "
+              f"{row['rss_end_mb']:>7.0f}MB {row['rss_peak_mb']:>7.0f}MB")
+    default, lean = results
+    if default["rss_peak_mb"]:
+        print(f"Lean mode peak RSS: {100 * lean['rss_peak_mb'] / default['rss_peak_mb']:.0f}% of default")
+
+
+if __name__ == "__main__":
+    main()
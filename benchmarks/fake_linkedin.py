@@ -0,0 +1,399 @@
+"""Local stand-in for the LinkedIn pages the scraper reads.
+
+Serves job search result pages, job posting fragments (JOB_POSTING_PATH),
+/jobs/view pages and a signed-in feed for the fixtures in benchmarks/fixtures,
+so the bot can be exercised without a LinkedIn account or network access:
+
+    python -m benchmarks.fake_linkedin --port 8200 --delay 0.2 --jobs 200
+    LINKEDIN_BASE_URL=http://127.0.0.1:8200 python main.py
+
+Recorded pages in fixtures/job_postings/<job id>.html are served as-is; jobs
+listed in fixtures/jobs.json (plus --jobs generated ones) are rendered from
+templates with the markup SELECTORS targets. Search results list the templated
+jobs 25 per page, load cards as the list is scrolled and fill the detail pane
+pane_delay seconds after a card is clicked, like the real page.
+"""
+import re
+import json
+import time
+import html
+import random
+import argparse
+import threading
+from pathlib import Path
+from collections import Counter
+from urllib.parse import urlsplit, parse_qsl, urlencode
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+
+JOB_POSTING_TEMPLATE = """<section class="core-rail mx-auto">
+  <div class="details mx-details-container-padding">
+    <section class="top-card-layout container-lined overflow-hidden">
+      <div class="top-card-layout__entity-info flex-grow">
+        <a href="{base_url}/jobs/view/{slug}-{job_id}?trk=public_jobs_topcard-title" class="topcard__link">
+          <h2 class="top-card-layout__title font-sans text-lg font-bold topcard__title">{title}</h2>
+        </a>
+        <h4 class="top-card-layout__second-subline font-sans text-sm">
+          <span class="topcard__flavor">
+            <a href="{base_url}/company/{company_slug}?trk=public_jobs_topcard-org-name" class="topcard__org-name-link topcard__flavor--black-link">{company}</a>
+          </span>
+          <span class="topcard__flavor topcard__flavor--bullet">{location}</span>
+        </h4>
+      </div>
+    </section>
+    <section class="core-section-container my-3 description">
+      <section class="show-more-less-html" data-max-lines="5">
+        <div class="show-more-less-html__markup show-more-less-html__markup--clamp-after-5 relative overflow-hidden">{description}</div>
+      </section>
+    </section>
+  </div>
+</section>
+"""
+
+JOB_VIEW_TEMPLATE = """<!DOCTYPE html>
+<html><head><title>{title} | {company} | LinkedIn</title></head>
+<body>
+  <div class="job-details-jobs-unified-top-card__company-name">
+    <a href="{base_url}/company/{company_slug}/life">{company}</a>
+  </div>
+  <div class="job-details-jobs-unified-top-card__job-title"><h1>{title}</h1></div>
+  <div class="jobs-description-content__text">{description}</div>
+</body></html>
+"""
+
+
+SEARCH_PAGE_TEMPLATE = """<!DOCTYPE html>
+<html><head><title>Jobs | LinkedIn</title>
+<style>
+  .jobs-search-results-list {{ float: left; width: 40%; height: 600px; overflow-y: auto; }}
+  .job-card-container {{ height: 110px; border-bottom: 1px solid #ddd; cursor: pointer; }}
+  .jobs-search__job-details {{ margin-left: 42%; }}
+</style></head>
+<body>
+  <div class="jobs-search-results-list__subtitle"><span>{total} results</span></div>
+  <div class="jobs-search-results-list">
+    <div data-results-list-top-scroll-sentinel=""></div>
+    <ul class="scaffold-layout__list-container"></ul>
+  </div>
+  <div class="jobs-search__job-details"></div>
+  {next_button}
+  <script>
+    var JOBS = {jobs_json};
+    var FIRST_CARDS = 7, CARDS_PER_LOAD = 6, CARD_DELAY_MS = {card_delay_ms}, PANE_DELAY_MS = {pane_delay_ms};
+    var list = document.querySelector('.scaffold-layout__list-container');
+    var container = list.parentElement;
+    var pane = document.querySelector('.jobs-search__job-details');
+    var shown = 0, loading = false;
+
+    function showJob(job) {{
+      pane.innerHTML = '';
+      setTimeout(function() {{
+        pane.innerHTML =
+          '<div class="job-details-jobs-unified-top-card__company-name"><a href="/company/' + job.company_slug + '/life">' + job.company + '</a></div>' +
+          '<div class="job-details-jobs-unified-top-card__job-title"><h1><a href="/jobs/view/' + job.id + '/">' + job.title + '</a></h1></div>' +
+          '<div class="jobs-description-content__text">' + job.description + '</div>';
+      }}, PANE_DELAY_MS);
+    }}
+    function addCards(count) {{
+      JOBS.slice(shown, shown + count).forEach(function(job) {{
+        var item = document.createElement('li');
+        item.setAttribute('data-job-id', job.id);
+        item.innerHTML = '<div class="job-card-container job-card-list--underline-title-on-hover">' +
+          '<a class="job-card-list__title" href="/jobs/view/' + job.id + '/">' + job.title + '</a>' +
+          '<div class="artdeco-entity-lockup__subtitle">' + job.company + '</div></div>';
+        item.firstChild.addEventListener('click', function(event) {{
+          event.preventDefault();
+          showJob(job);
+        }});
+        list.appendChild(item);
+      }});
+      shown = Math.min(JOBS.length, shown + count);
+    }}
+    container.addEventListener('scroll', function() {{
+      var nearBottom = container.scrollTop + container.clientHeight >= container.scrollHeight - 150;
+      if (nearBottom && !loading && shown < JOBS.length) {{
+        loading = true;
+        setTimeout(function() {{ addCards(CARDS_PER_LOAD); loading = false; }}, CARD_DELAY_MS);
+      }}
+    }});
+    addCards(FIRST_CARDS);
+  </script>
+</body></html>
+"""
+
+NEXT_BUTTON_TEMPLATE = """<button class="artdeco-button jobs-search-pagination__button--next" aria-label="View next page"
+    onclick="window.location.href = '{next_url}'">Next</button>"""
+
+FEED_PAGE = """<!DOCTYPE html>
+<html><head><title>Feed | LinkedIn</title></head>
+<body><nav><a href="/feed/">Home</a> <a href="/jobs/">Jobs</a></nav><main>Signed in</main></body></html>
+"""
+
+RESULTS_PAGE_SIZE = 25
+
+# Building blocks for generated jobs: (title, skills) roles, a mix of relevant and unrelated ones
+SYNTHETIC_ROLES = [
+    ("Machine Learning Engineer", ["PyTorch", "MLflow", "feature engineering", "model serving", "AWS SageMaker"]),
+    ("Data Scientist", ["Python", "Pandas", "scikit-learn", "A/B testing", "SQL"]),
+    ("LLM Engineer", ["LangChain", "retrieval-augmented generation", "prompt engineering", "vector databases", "OpenAI APIs"]),
+    ("NLP Engineer", ["Hugging Face Transformers", "named entity recognition", "fine-tuning", "text classification", "spaCy"]),
+    ("Backend Engineer", ["Go", "PostgreSQL", "Kubernetes", "gRPC", "distributed systems"]),
+    ("Frontend Engineer", ["React", "TypeScript", "CSS", "accessibility", "web performance"]),
+    ("Data Engineer", ["Spark", "Airflow", "dbt", "ETL pipelines", "data warehousing"]),
+    ("Registered Nurse", ["patient care", "BLS certification", "charting", "medication administration", "night shifts"]),
+    ("Sales Development Representative", ["cold calling", "CRM hygiene", "pipeline generation", "quota attainment", "Salesforce"]),
+    ("Accountant", ["month-end close", "reconciliations", "GAAP", "accounts payable", "Excel"]),
+]
+SYNTHETIC_COMPANIES = ["Contoso", "Northwind Traders", "Fabrikam", "Litware", "Tailspin Toys", "Woodgrove Bank",
+                       "Proseware", "Wide World Importers", "Alpine Ski House", "Lamna Healthcare"]
+SYNTHETIC_LOCATIONS = ["Toronto, ON", "Halifax, NS", "Remote", "New York, NY", "Austin, TX", "Vancouver, BC"]
+SYNTHETIC_SENIORITY = ["", "Senior ", "Junior ", "Staff ", "Lead "]
+
+
+def synthetic_jobs(count, seed=0, first_id=4100000000):
+    """Generate count varied job dicts (same shape as fixtures/jobs.json), deterministically."""
+    generator = random.Random(seed)
+    jobs = {}
+    for index in range(count):
+        title, skills = generator.choice(SYNTHETIC_ROLES)
+        company = f"{generator.choice(SYNTHETIC_COMPANIES)} {generator.choice(['Labs', 'Inc.', 'Group', 'Digital', 'Systems'])}"
+        chosen = generator.sample(skills, 3)
+        years = generator.randint(1, 8)
+        job_id = str(first_id + index)
+        jobs[job_id] = {
+            "linkedin_job_id": job_id,
+            "job_title": f"{generator.choice(SYNTHETIC_SENIORITY)}{title}",
+            "company_name": company,
+            "location": generator.choice(SYNTHETIC_LOCATIONS),
+            "job_description": (
+                f"{company} is hiring a {title} (req {job_id}) to join a growing team.\n\n"
+                "Responsibilities\n" + "".join(f"- Own our work on {skill}\n" for skill in chosen) +
+                f"\nRequirements\n- {years}+ years of experience with {chosen[0]} and {chosen[1]}\n"
+                "- Clear written communication\n\n"
+                f"{company} is an equal opportunity employer. We offer health insurance, a 401(k) match and flexible PTO."
+            )
+        }
+    return jobs
+
+
+def slugify(text):
+    return re.sub(r"[^a-z0-9]+", "-", text.lower()).strip("-")
+
+
+def description_html(text):
+    """Render a plain-text description the way LinkedIn marks it up (paragraphs, <br>, <li>)."""
+    parts = []
+    items = []
+    for line in text.split("\n"):
+        if line.startswith("- "):
+            items.append(f"<li>{html.escape(line[2:])}</li>")
+            continue
+        if items:
+            parts.append(f"<ul>{''.join(items)}</ul>")
+            items = []
+        parts.append(f"{html.escape(line)}<br>" if line else "<br>")
+    if items:
+        parts.append(f"<ul>{''.join(items)}</ul>")
+    return "".join(parts)
+
+
+def load_fixtures(fixtures_dir=FIXTURES_DIR):
+    """Return ({job id: recorded posting html}, {job id: job dict}) from a fixtures directory."""
+    fixtures_dir = Path(fixtures_dir)
+    recorded = {path.stem: path.read_text() for path in sorted((fixtures_dir / "job_postings").glob("*.html"))}
+    jobs_file = fixtures_dir / "jobs.json"
+    jobs = {}
+    if jobs_file.exists():
+        jobs = {str(job["linkedin_job_id"]): job for job in json.loads(jobs_file.read_text())}
+    return recorded, jobs
+
+
+class FakeLinkedInServer:
+    """Threaded HTTP server serving search, job posting, job view and feed pages from fixtures.
+
+    Args:
+        delay: Seconds to wait before answering each page request.
+        error_rate: Fraction of job posting requests answered with a 429 or 500.
+        job_count: Generated jobs added to the fixtures (see synthetic_jobs).
+        pane_delay: Seconds the search page takes to show a clicked job's details.
+        card_delay: Seconds the search page takes to load more cards when scrolled down.
+    """
+
+    def __init__(self, host='127.0.0.1', port=0, delay=0.0, error_rate=0.0, fixtures_dir=FIXTURES_DIR, seed=None,
+                 job_count=0, pane_delay=0.0, card_delay=0.1):
+        self.delay = delay
+        self.error_rate = error_rate
+        self.pane_delay = pane_delay
+        self.card_delay = card_delay
+        self.random = random.Random(seed)
+        self.recorded, self.jobs = load_fixtures(fixtures_dir)
+        self.jobs.update(synthetic_jobs(job_count, seed or 0))
+        self.stats = Counter()
+        self._lock = threading.Lock()
+        self.httpd = ThreadingHTTPServer((host, port), self._make_handler())
+        self.httpd.daemon_threads = True
+        self._thread = None
+
+    @property
+    def base_url(self):
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    @property
+    def job_ids(self):
+        return sorted(set(self.recorded) | set(self.jobs))
+
+    def start(self):
+        """Serve in a background thread and return the base URL."""
+        self._thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self.base_url
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def _count(self, key):
+        with self._lock:
+            self.stats[key] += 1
+
+    def _should_fail(self):
+        with self._lock:
+            return self.random.random() < self.error_rate
+
+    def _template_fields(self, job_id):
+        job = self.jobs[job_id]
+        return {
+            "base_url": self.base_url,
+            "job_id": job_id,
+            "slug": slugify(f"{job['job_title']} at {job['company_name']}"),
+            "title": html.escape(job["job_title"]),
+            "company": html.escape(job["company_name"]),
+            "company_slug": job.get("company_slug") or slugify(job["company_name"]),
+            "location": html.escape(job.get("location", "")),
+            "description": description_html(job["job_description"])
+        }
+
+    def render_job_posting(self, job_id):
+        """Posting fragment for a job id, or None if there is no fixture for it."""
+        if job_id in self.recorded:
+            return self.recorded[job_id]
+        if job_id in self.jobs:
+            return JOB_POSTING_TEMPLATE.format(**self._template_fields(job_id))
+        return None
+
+    def render_job_view(self, job_id):
+        """Full /jobs/view page for a job id, or None if it has no template fixture."""
+        if job_id not in self.jobs:
+            return None
+        return JOB_VIEW_TEMPLATE.format(**self._template_fields(job_id))
+
+    def render_search_page(self, path_and_query):
+        """Results page for a search URL; every templated job matches every search."""
+        parts = urlsplit(path_and_query)
+        query = [(key, value) for key, value in parse_qsl(parts.query) if key != "start"]
+        start = int(dict(parse_qsl(parts.query)).get("start", 0) or 0)
+        job_ids = sorted(self.jobs)
+        page_ids = job_ids[start:start + RESULTS_PAGE_SIZE]
+
+        next_button = ""
+        if start + RESULTS_PAGE_SIZE < len(job_ids):
+            next_url = f"{parts.path}?{urlencode(query + [('start', start + RESULTS_PAGE_SIZE)])}"
+            next_button = NEXT_BUTTON_TEMPLATE.format(next_url=html.escape(next_url))
+
+        page_jobs = []
+        for job_id in page_ids:
+            fields = self._template_fields(job_id)
+            page_jobs.append({
+                "id": job_id,
+                "title": fields["title"],
+                "company": fields["company"],
+                "company_slug": fields["company_slug"],
+                "description": fields["description"]
+            })
+        return SEARCH_PAGE_TEMPLATE.format(
+            total=f"{len(job_ids):,}",
+            next_button=next_button,
+            jobs_json=json.dumps(page_jobs).replace("</", "<\\/"),
+            card_delay_ms=int(self.card_delay * 1000),
+            pane_delay_ms=int(self.pane_delay * 1000)
+        )
+
+    def _make_handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, format, *args):
+                pass
+
+            def _send_html(self, status, page):
+                data = page.encode()
+                self.send_response(status)
+                self.send_header("Content-Type", "text/html; charset=utf-8")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def do_GET(self):
+                path = self.path.split("?", 1)[0]
+                if server.delay:
+                    time.sleep(server.delay)
+
+                match = re.fullmatch(r"/jobs-guest/jobs/api/jobPosting/(\d+)", path)
+                if match:
+                    server._count("job_postings")
+                    if server._should_fail():
+                        server._count("injected_errors")
+                        return self._send_html(server.random.choice([429, 500]), "<h1>Injected failure</h1>")
+                    page = server.render_job_posting(match.group(1))
+                    if page is None:
+                        return self._send_html(404, "<h1>Not found</h1>")
+                    return self._send_html(200, page)
+
+                match = re.fullmatch(r"/jobs/view/(?:[^/]*-)?(\d+)/?", path)
+                if match:
+                    server._count("job_views")
+                    page = server.render_job_view(match.group(1))
+                    if page is None:
+                        return self._send_html(404, "<h1>Not found</h1>")
+                    return self._send_html(200, page)
+
+                if path.rstrip("/") == "/jobs/search":
+                    server._count("search_pages")
+                    return self._send_html(200, server.render_search_page(self.path))
+
+                if path.rstrip("/") == "/feed":
+                    server._count("feed")
+                    return self._send_html(200, FEED_PAGE)
+
+                self._send_html(404, "<h1>Not found</h1>")
+
+        return Handler
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve recorded LinkedIn job pages locally")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8200)
+    parser.add_argument("--delay", type=float, default=0.0, help="Seconds before each page is answered")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Fraction of job posting requests that fail with 429/500")
+    parser.add_argument("--fixtures", default=str(FIXTURES_DIR), help="Directory with job_postings/*.html and jobs.json")
+    parser.add_argument("--jobs", type=int, default=0, help="Generated jobs to serve in addition to the fixtures")
+    parser.add_argument("--pane-delay", type=float, default=0.0, help="Seconds before a clicked job's details show")
+    args = parser.parse_args()
+
+    server = FakeLinkedInServer(args.host, args.port, args.delay, args.error_rate, args.fixtures,
+                                job_count=args.jobs, pane_delay=args.pane_delay)
+    print(f"Fake LinkedIn listening on {server.base_url} with {len(server.job_ids)} jobs")
+    try:
+        server.httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        print(f"Requests served: {dict(server.stats)}")
+        server.httpd.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,296 @@
+"""Local stand-in for the parts of the OpenAI API this project uses.
+
+Serves chat completions, file upload/download and the Batch API endpoints so the
+scoring code can be exercised without network access or API spend:
+
+    python -m benchmarks.fake_openai --port 8100 --delay 0.5 --error-rate 0.05
+    OPENAI_BASE_URL=http://127.0.0.1:8100/v1 OPENAI_API_KEY=fake python -c "..."
+"""
+import re
+import json
+import time
+import random
+import hashlib
+import argparse
+import threading
+from collections import Counter
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+
+def fake_match_score(prompt):
+    """Deterministic 0-10 score derived from the prompt text."""
+    return int(hashlib.sha256(prompt.encode()).hexdigest(), 16) % 11
+
+
+def fake_completion(body):
+    """Build a chat completion response for a request body.
+
+    Multi-job prompts ("### Job <label>" sections) get a {"results": [...]} reply.
+    """
+    prompt = body["messages"][-1]["content"]
+    sections = re.split(r"^### Job (\S+)\n", prompt, flags=re.MULTILINE)
+    if len(sections) > 1:
+        labels = sections[1::2]
+        descriptions = sections[2::2]
+        content = json.dumps({"results": [
+            {"job_id": label, "match_score": fake_match_score(description.strip())}
+            for label, description in zip(labels, descriptions)
+        ]})
+    else:
+        content = json.dumps({"match_score": fake_match_score(prompt)})
+    prompt_tokens = sum(len(m["content"]) for m in body["messages"]) // 4
+    return {
+        "id": f"chatcmpl-{hashlib.md5(prompt.encode()).hexdigest()[:12]}",
+        "object": "chat.completion",
+        "created": int(time.time()),
+        "model": body.get("model", "gpt-4o"),
+        "choices": [{
+            "index": 0,
+            "finish_reason": "stop",
+            "message": {"role": "assistant", "content": content}
+        }],
+        "usage": {
+            "prompt_tokens": prompt_tokens,
+            "completion_tokens": 8,
+            "total_tokens": prompt_tokens + 8
+        }
+    }
+
+
+class FakeOpenAIServer:
+    """Threaded HTTP server mimicking the OpenAI chat, files and batches endpoints.
+
+    Args:
+        delay: Seconds to wait before answering each chat completion.
+        error_rate: Fraction of chat completions answered with a 429 or 500.
+        batch_delay: Seconds before a created batch reports as completed.
+        batch_outcomes: Final statuses for the next batches created, in order (e.g.
+            ["failed"]); "expired" and "cancelled" batches answer half their requests
+            first. Batches beyond the list complete normally.
+    """
+
+    def __init__(self, host='127.0.0.1', port=0, delay=0.0, error_rate=0.0, batch_delay=1.0, seed=None,
+                 batch_outcomes=()):
+        self.delay = delay
+        self.error_rate = error_rate
+        self.batch_delay = batch_delay
+        self.batch_outcomes = list(batch_outcomes)
+        self.random = random.Random(seed)
+        self.stats = Counter()
+        self.files = {}
+        self.batches = {}
+        self._lock = threading.Lock()
+        self._ids = Counter()
+        self.httpd = ThreadingHTTPServer((host, port), self._make_handler())
+        self.httpd.daemon_threads = True
+        self._thread = None
+
+    @property
+    def base_url(self):
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}/v1"
+
+    def start(self):
+        """Serve in a background thread and return the base URL."""
+        self._thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self.base_url
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def _new_id(self, prefix):
+        with self._lock:
+            self._ids[prefix] += 1
+            return f"{prefix}-{self._ids[prefix]:06d}"
+
+    def _count(self, key):
+        with self._lock:
+            self.stats[key] += 1
+
+    def _should_fail(self):
+        with self._lock:
+            return self.random.random() < self.error_rate
+
+    def _store_file(self, filename, purpose, data):
+        file_id = self._new_id("file")
+        self.files[file_id] = {
+            "id": file_id,
+            "object": "file",
+            "bytes": len(data),
+            "created_at": int(time.time()),
+            "filename": filename,
+            "purpose": purpose,
+            "status": "processed",
+            "data": data
+        }
+        return file_id
+
+    def _public_file(self, file_id):
+        return {k: v for k, v in self.files[file_id].items() if k != "data"}
+
+    def _run_batch(self, batch_id):
+        """Finish a batch by answering the requests in its input file (all of them unless told otherwise)."""
+        batch = self.batches[batch_id]
+        with self._lock:
+            outcome = self.batch_outcomes.pop(0) if self.batch_outcomes else "completed"
+        batch["status"] = "in_progress"
+        batch["in_progress_at"] = int(time.time())
+        time.sleep(self.batch_delay)
+        if outcome == "failed":
+            batch["status"] = "failed"
+            batch["failed_at"] = int(time.time())
+            return
+
+        output_lines = []
+        lines = [line for line in self.files[batch["input_file_id"]]["data"].decode().splitlines() if line.strip()]
+        if outcome != "completed":
+            lines = lines[:len(lines) // 2]
+        for line in lines:
+            request = json.loads(line)
+            self._count("batch_requests")
+            output_lines.append(json.dumps({
+                "id": self._new_id("batch_req"),
+                "custom_id": request["custom_id"],
+                "response": {"status_code": 200, "request_id": self._new_id("req"), "body": fake_completion(request["body"])},
+                "error": None
+            }))
+            batch["request_counts"]["completed"] += 1
+
+        batch["output_file_id"] = self._store_file(f"{batch_id}_output.jsonl", "batch_output", '\n'.join(output_lines).encode())
+        batch["status"] = outcome
+        batch[f"{outcome}_at"] = int(time.time())
+
+    def _make_handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, format, *args):
+                pass
+
+            def _send_json(self, status, payload):
+                data = json.dumps(payload).encode()
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def _read_body(self):
+                length = int(self.headers.get("Content-Length", 0))
+                return self.rfile.read(length)
+
+            def do_POST(self):
+                body = self._read_body()
+                if self.path == "/v1/chat/completions":
+                    server._count("chat_completions")
+                    if server.delay:
+                        time.sleep(server.delay)
+                    if server._should_fail():
+                        server._count("injected_errors")
+                        status = server.random.choice([429, 500])
+                        return self._send_json(status, {"error": {"message": "Injected failure", "type": "fake_error"}})
+                    return self._send_json(200, fake_completion(json.loads(body)))
+
+                if self.path == "/v1/files":
+                    server._count("file_uploads")
+                    fields = parse_multipart(self.headers["Content-Type"], body)
+                    file_id = server._store_file(
+                        fields.get("file_name", "upload.jsonl"),
+                        fields.get("purpose", b"batch").decode(),
+                        fields["file"]
+                    )
+                    return self._send_json(200, server._public_file(file_id))
+
+                if self.path == "/v1/batches":
+                    server._count("batch_creates")
+                    request = json.loads(body)
+                    input_file = server.files.get(request["input_file_id"])
+                    if input_file is None:
+                        return self._send_json(404, {"error": {"message": "No such file"}})
+                    batch_id = server._new_id("batch")
+                    total = sum(1 for line in input_file["data"].splitlines() if line.strip())
+                    server.batches[batch_id] = {
+                        "id": batch_id,
+                        "object": "batch",
+                        "endpoint": request["endpoint"],
+                        "input_file_id": request["input_file_id"],
+                        "completion_window": request["completion_window"],
+                        "status": "validating",
+                        "created_at": int(time.time()),
+                        "output_file_id": None,
+                        "error_file_id": None,
+                        "request_counts": {"total": total, "completed": 0, "failed": 0}
+                    }
+                    threading.Thread(target=server._run_batch, args=(batch_id,), daemon=True).start()
+                    return self._send_json(200, server.batches[batch_id])
+
+                self._send_json(404, {"error": {"message": f"Unknown endpoint {self.path}"}})
+
+            def do_GET(self):
+                match = re.fullmatch(r"/v1/batches/([\w-]+)", self.path)
+                if match:
+                    server._count("batch_polls")
+                    batch = server.batches.get(match.group(1))
+                    if batch is None:
+                        return self._send_json(404, {"error": {"message": "No such batch"}})
+                    return self._send_json(200, batch)
+
+                match = re.fullmatch(r"/v1/files/([\w-]+)/content", self.path)
+                if match and match.group(1) in server.files:
+                    server._count("file_downloads")
+                    data = server.files[match.group(1)]["data"]
+                    self.send_response(200)
+                    self.send_header("Content-Type", "application/octet-stream")
+                    self.send_header("Content-Length", str(len(data)))
+                    self.end_headers()
+                    self.wfile.write(data)
+                    return
+
+                self._send_json(404, {"error": {"message": f"Unknown endpoint {self.path}"}})
+
+        return Handler
+
+
+def parse_multipart(content_type, body):
+    """Minimal multipart/form-data parser returning {field name: bytes}."""
+    boundary = re.search(r'boundary="?([^";]+)"?', content_type).group(1).encode()
+    fields = {}
+    for part in body.split(b"--" + boundary):
+        if b"\r\n\r\n" not in part:
+            continue
+        headers, value = part.split(b"\r\n\r\n", 1)
+        name = re.search(rb'name="([^"]+)"', headers)
+        if not name:
+            continue
+        name = name.group(1).decode()
+        fields[name] = value[:-2] if value.endswith(b"\r\n") else value
+        filename = re.search(rb'filename="([^"]*)"', headers)
+        if filename:
+            fields[f"{name}_name"] = filename.group(1).decode()
+    return fields
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run a local stand-in for the OpenAI API")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8100)
+    parser.add_argument("--delay", type=float, default=0.0, help="Seconds before each chat completion is answered")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Fraction of chat completions that fail with 429/500")
+    parser.add_argument("--batch-delay", type=float, default=1.0, help="Seconds before a batch completes")
+    args = parser.parse_args()
+
+    server = FakeOpenAIServer(args.host, args.port, args.delay, args.error_rate, args.batch_delay)
+    print(f"Fake OpenAI API listening on {server.base_url}")
+    try:
+        server.httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        print(f"Requests served: {dict(server.stats)}")
+        server.httpd.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,233 @@
+"""End-to-end throughput benchmark against local stand-ins for LinkedIn and OpenAI.
+
+Starts benchmarks.fake_linkedin (search, job and feed pages with configurable
+latency) and benchmarks.fake_openai (chat completions with configurable delay
+and error rate), then:
+
+1. scrape: drives LinkedInBot through login, one search and every result page,
+   scoring as it goes exactly like python main.py scrape;
+2. score: re-scores the scraped jobs with JobScorer, with the score cache off.
+
+Everything runs in a temporary directory (DATA_DIR and the working directory),
+so real run files, caches and indexes are untouched. Reports jobs/minute, the
+latency of each stage (p50/p95/max) and the requests each server answered:
+
+    python -m benchmarks.run_offline --jobs 100 --pane-delay 0.2 --openai-delay 0.3
+    python -m benchmarks.run_offline --score-only --jobs 500 --error-rate 0.05
+
+The scrape phase needs Chrome and ChromeDriver (see README); --score-only does not.
+"""
+import os
+import sys
+import json
+import time
+import shutil
+import asyncio
+import argparse
+import tempfile
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from benchmarks.fake_linkedin import FakeLinkedInServer
+from benchmarks.fake_openai import FakeOpenAIServer
+
+
+class StageTimer:
+    """Collects call durations per stage by wrapping methods.
+
+    Methods are wrapped on the class, so copies of an instance (e.g. the bot's
+    per-browser workers) are timed too. Samples and percentiles come from the
+    bot's own RunMetrics, with its file output off.
+    """
+
+    def __init__(self):
+        from linkedin.metrics import RunMetrics
+        self.metrics = RunMetrics(json_path=None, prometheus_path=None)
+
+    def add(self, stage, seconds):
+        self.metrics.observe(stage, seconds)
+
+    def wrap(self, cls, name, stage):
+        original = getattr(cls, name)
+        timer = self
+
+        if asyncio.iscoroutinefunction(original):
+            async def timed(*args, **kwargs):
+                started = time.monotonic()
+                try:
+                    return await original(*args, **kwargs)
+                finally:
+                    timer.add(stage, time.monotonic() - started)
+        else:
+            def timed(*args, **kwargs):
+                started = time.monotonic()
+                try:
+                    return original(*args, **kwargs)
+                finally:
+                    timer.add(stage, time.monotonic() - started)
+
+        setattr(cls, name, timed)
+
+    def print_report(self):
+        print(f"  {'stage':<24} {'calls':>6} {'p50':>8} {'p95':>8} {'max':>8} {'total':>9}")
+        for stage, stats in self.metrics.summary()["stages"].items():
+            print(f"  {stage:<24} {stats['count']:>6} {stats['p50']:>7.3f}s {stats['p95']:>7.3f}s "
+                  f"{stats['max']:>7.3f}s {stats['total_seconds']:>8.1f}s")
+
+
+def prepare_workdir(linkedin_url, openai_url):
+    """Create the temporary working directory and point the bot at the fake servers.
+
+    Must run before anything from config or linkedin is imported, since the
+    config module reads these environment variables at import time.
+    """
+    workdir = tempfile.mkdtemp(prefix="linkedin-bot-benchmark-")
+    os.makedirs(os.path.join(workdir, "config"))
+    for name in ("settings.json", "Settings.json"):
+        shutil.copy(os.path.join(ROOT, "config", "settings.json"), os.path.join(workdir, "config", name))
+    os.environ.update({
+        "DATA_DIR": os.path.join(workdir, "data"),
+        "LINKEDIN_BASE_URL": linkedin_url,
+        "OPENAI_BASE_URL": openai_url,
+        "OPENAI_API_KEY": "benchmark"
+    })
+    # config/Settings.json and logs/ are still read and written relative to the working directory
+    os.chdir(workdir)
+    return workdir
+
+
+def run_scrape(args, timer):
+    """Scrape and score every job from one search. Returns (raw jobs file, seconds)."""
+    from linkedin.linkedin_bot import LinkedInBot
+    from linkedin.ai_matcher import JobMatcher
+    from linkedin.job_fetcher import JobDetailFetcher
+    from linkedin.job_store import latest_jobs_file
+
+    timer.wrap(LinkedInBot, "_search_by_url", "open search")
+    timer.wrap(LinkedInBot, "_get_job_cards_on_current_page", "load cards")
+    timer.wrap(LinkedInBot, "_scrape_job_card", "job detail (click)")
+    timer.wrap(LinkedInBot, "_view_job_page", "job detail (job page)")
+    timer.wrap(JobDetailFetcher, "fetch", "job detail (http)")
+    timer.wrap(JobMatcher, "_complete", "openai request")
+    timer.wrap(JobMatcher, "_complete_async", "openai request")
+
+    bot = LinkedInBot()
+    bot.settings = {
+        **bot.settings,
+        "keyword_groups": [["Machine Learning"]],
+        "locations": ["Worldwide"],
+        "date_ranges": ["any_time"]
+    }
+    try:
+        bot.driver = bot.browser.initialize_browser(profile_dir=None, lean=args.lean)
+        if not bot.ensure_logged_in():
+            raise RuntimeError("Could not open the fake LinkedIn feed")
+        started = time.monotonic()
+        if not bot.run_all_searches(pipeline=args.pipeline, fetch_mode=args.fetch_mode):
+            raise RuntimeError("Job processing failed")
+        return latest_jobs_file(), time.monotonic() - started
+    finally:
+        bot.quit()
+
+
+def write_jobs_file(server, path):
+    """Write the fake server's jobs as a raw run file, as a scrape would have."""
+    from linkedin.job_store import JobStore
+
+    store = JobStore(path)
+    try:
+        for linkedin_job_id, job in server.jobs.items():
+            store.append(linkedin_job_id, {
+                "company_name": job["company_name"],
+                "company_url": None,
+                "job_title": job["job_title"],
+                "job_url": f"{server.base_url}/jobs/view/{linkedin_job_id}/",
+                "linkedin_job_id": linkedin_job_id,
+                "job_description": job["job_description"]
+            })
+    finally:
+        store.close()
+    return path
+
+
+def run_score(jobs_file, args, timer):
+    """Re-score a raw jobs file with JobScorer. Returns (jobs scored, seconds)."""
+    from config.config import DATA_DIR
+    from linkedin.ai_matcher import JobMatcher
+    from linkedin.job_scorer import JobScorer
+    from linkedin.job_store import read_jobs
+
+    if "openai request" not in timer.metrics.summary()["stages"]:
+        timer.wrap(JobMatcher, "_complete", "openai request")
+        timer.wrap(JobMatcher, "_complete_async", "openai request")
+
+    rescore_file = os.path.join(DATA_DIR, "job_descriptions_benchmark.jsonl")
+    shutil.copy(jobs_file, rescore_file)
+    scorer = JobScorer()
+    scorer.job_matcher.score_cache = None
+    started = time.monotonic()
+    scorer.process_new_jobs(rescore_file, concurrency=args.concurrency)
+    return len(read_jobs(scorer._get_scored_filename(rescore_file))), time.monotonic() - started
+
+
+def print_phase(name, jobs, seconds, timer, before, openai_server, linkedin_server):
+    rate = jobs / (seconds / 60) if seconds else 0.0
+    print(f"\n{name}: {jobs} jobs in {seconds:.1f}s ({rate:.1f} jobs/min)")
+    timer.print_report()
+    openai_stats = {key: value - before[0].get(key, 0) for key, value in openai_server.stats.items()}
+    linkedin_stats = {key: value - before[1].get(key, 0) for key, value in linkedin_server.stats.items()}
+    print(f"  OpenAI requests: {json.dumps({k: v for k, v in openai_stats.items() if v})}")
+    print(f"  LinkedIn requests: {json.dumps({k: v for k, v in linkedin_stats.items() if v})}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Offline end-to-end throughput benchmark")
+    parser.add_argument("--jobs", type=int, default=50, help="Generated jobs served by the fake LinkedIn")
+    parser.add_argument("--page-delay", type=float, default=0.05, help="Seconds before each LinkedIn page is answered")
+    parser.add_argument("--pane-delay", type=float, default=0.2, help="Seconds before a clicked job's details show")
+    parser.add_argument("--fetch-error-rate", type=float, default=0.0, help="Fraction of job posting fetches that fail")
+    parser.add_argument("--openai-delay", type=float, default=0.3, help="Seconds before each chat completion is answered")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Fraction of chat completions that fail with 429/500")
+    parser.add_argument("--fetch-mode", choices=["click", "direct"], help="Job detail fetch mode (default: config)")
+    parser.add_argument("--pipeline", action=argparse.BooleanOptionalAction, default=None,
+                        help="Score on background workers while scraping (default: config)")
+    parser.add_argument("--concurrency", type=int, help="Concurrent requests in the score phase (default: config)")
+    parser.add_argument("--lean", action="store_true", help="Use the headless lean browser mode")
+    parser.add_argument("--score-only", action="store_true", help="Skip the browser and only run the score phase")
+    parser.add_argument("--keep", action="store_true", help="Keep the temporary working directory")
+    args = parser.parse_args()
+
+    linkedin_server = FakeLinkedInServer(delay=args.page_delay, error_rate=args.fetch_error_rate, seed=0,
+                                         job_count=args.jobs, pane_delay=args.pane_delay)
+    openai_server = FakeOpenAIServer(delay=args.openai_delay, error_rate=args.error_rate, seed=0)
+    workdir = prepare_workdir(linkedin_server.start(), openai_server.start())
+    print(f"Fake LinkedIn at {linkedin_server.base_url} with {len(linkedin_server.jobs)} jobs, "
+          f"fake OpenAI at {openai_server.base_url}; working in {workdir}")
+
+    try:
+        if args.score_only:
+            from config.config import DATA_DIR
+            jobs_file = write_jobs_file(linkedin_server, os.path.join(DATA_DIR, "job_descriptions_fixtures.jsonl"))
+        else:
+            timer = StageTimer()
+            before = (dict(openai_server.stats), dict(linkedin_server.stats))
+            jobs_file, seconds = run_scrape(args, timer)
+            from linkedin.job_store import read_jobs
+            print_phase("Scrape + score", len(read_jobs(jobs_file)), seconds, timer, before,
+                        openai_server, linkedin_server)
+
+        timer = StageTimer()
+        before = (dict(openai_server.stats), dict(linkedin_server.stats))
+        jobs, seconds = run_score(jobs_file, args, timer)
+        print_phase("Score (JobScorer, no cache)", jobs, seconds, timer, before, openai_server, linkedin_server)
+    finally:
+        linkedin_server.stop()
+        openai_server.stop()
+        os.chdir(ROOT)
+        if not args.keep:
+            shutil.rmtree(workdir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""Measure how long each main.py subcommand takes to import what it needs.
+
+Every measurement runs in a fresh interpreter that imports main and calls
+main.import_command(name), so it covers exactly the imports the command does
+before any work starts. Reports the wall time (median and min over the repeats),
+the import time from python -X importtime, the slowest top-level imports and
+which heavy packages got loaded:
+
+    python -m benchmarks.startup_time --repeat 10
+    python -m benchmarks.startup_time score export
+"""
+import os
+import sys
+import json
+import time
+import argparse
+import statistics
+import subprocess
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from main import COMMANDS
+
+HEAVY_PACKAGES = ("selenium", "openai", "httpx", "pdfplumber", "numpy", "dotenv")
+
+PROBE = """
+import sys, json, main
+main.import_command(sys.argv[1])
+print(json.dumps(sorted(name for name in {heavy!r} if name in sys.modules)))
+""".format(heavy=HEAVY_PACKAGES)
+
+
+def parse_importtime(stderr):
+    """Return {top-level module: cumulative microseconds} from -X importtime output."""
+    modules = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        if not name.startswith("  "):  # Nested imports are indented
+            modules[name.strip()] = int(cumulative)
+    return modules
+
+
+def measure(command, repeat):
+    """Time importing a subcommand's modules in repeat fresh interpreters."""
+    env = {**os.environ, "OPENAI_API_KEY": os.environ.get("OPENAI_API_KEY", "startup-benchmark")}
+    walls = []
+    for _ in range(repeat):
+        started = time.monotonic()
+        subprocess.run([sys.executable, "-c", PROBE, command], cwd=ROOT, env=env,
+                       capture_output=True, text=True, check=True)
+        walls.append(time.monotonic() - started)
+
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", PROBE, command], cwd=ROOT, env=env,
+                            capture_output=True, text=True, check=True)
+    modules = parse_importtime(result.stderr)
+    return {
+        "command": command,
+        "wall_median": statistics.median(walls),
+        "wall_min": min(walls),
+        "import_seconds": sum(modules.values()) / 1e6,
+        "slowest": sorted(modules.items(), key=lambda item: item[1], reverse=True)[:3],
+        "heavy": json.loads(result.stdout.strip().splitlines()[-1])
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure import and startup time of each main.py subcommand")
+    parser.add_argument("commands", nargs="*", help=f"Subcommands to measure (default: all of {', '.join(COMMANDS)})")
+    parser.add_argument("--repeat", type=int, default=5, help="Fresh interpreters started per command")
+    args = parser.parse_args()
+
+    started = time.monotonic()
+    subprocess.run([sys.executable, "-c", "pass"], check=True)
+    print(f"Bare interpreter start: {time.monotonic() - started:.3f}s")
+
+    print(f"{'command':<8} {'wall p50':>9} {'wall min':>9} {'imports':>8}  heavy packages loaded")
+    results = [measure(command, args.repeat) for command in (args.commands or COMMANDS)]
+    for row in results:
+        print(f"{row['command']:<8} {row['wall_median']:>8.3f}s {row['wall_min']:>8.3f}s "
+              f"{row['import_seconds']:>7.3f}s  {', '.join(row['heavy']) or '-'}")
+    for row in results:
+        slowest = ", ".join(f"{name} {microseconds / 1000:.0f}ms" for name, microseconds in row["slowest"])
+        print(f"  {row['command']}: slowest imports: {slowest}")
+
+
+if __name__ == "__main__":
+    main()
@@ -8,22 +8,153 @@ load_dotenv()
 # Base paths
 BASE_DIR = Path(__file__).parent.parent
 BROWSER_DIR = BASE_DIR.parent / "browser"
+DATA_DIR = Path(os.getenv("DATA_DIR", BASE_DIR / "data"))  # Overridable, e.g. to keep benchmark runs apart
 
 # Browser paths
 CHROME_BINARY_PATH = str(BROWSER_DIR / "chrome-mac-arm64/Google Chrome for Testing.app/Contents/MacOS/Google Chrome for Testing")
 CHROMEDRIVER_PATH = str(BROWSER_DIR / "chromedriver-mac-arm64/chromedriver")
+CHROME_PROFILE_DIR = os.getenv("CHROME_PROFILE_DIR")  # Persistent Chrome profile for the main browser; None uses a fresh one
+
+# Lean browser mode: headless Chrome that does not download images, media, fonts or analytics
+BROWSER_LEAN_MODE = False  # Opt-in until measured with benchmarks.browser_footprint; see README
+BROWSER_WINDOW_SIZE = "1920,1080"  # Headless viewport; the results list needs a desktop-sized window
+BROWSER_DISK_CACHE_MB = 32  # Chrome's HTTP disk cache limit in lean mode
+BROWSER_JS_HEAP_MB = 512  # V8 old-space limit per renderer in lean mode
+BROWSER_RENDERER_PROCESS_LIMIT = 2  # Max renderer processes in lean mode
+BLOCKED_URL_PATTERNS = [  # Blocked through DevTools Network.setBlockedURLs in lean mode
+    "*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.svg", "*.ico",
+    "*.mp4", "*.webm", "*.m3u8", "*.mp3",
+    "*.woff", "*.woff2", "*.ttf", "*.otf",
+    "*media.licdn.com*",
+    "*google-analytics.com*", "*googletagmanager.com*", "*doubleclick.net*",
+    "*px.ads.linkedin.com*", "*snap.licdn.com*", "*bat.bing.com*", "*connect.facebook.net*",
+    "*/li/track*"
+]
 
 # LinkedIn credentials
 LINKEDIN_EMAIL = os.getenv("LINKEDIN_EMAIL")
 LINKEDIN_PASSWORD = os.getenv("LINKEDIN_PASSWORD")
 
 # URLs
-LINKEDIN_LOGIN_URL = "https://www.linkedin.com/login"
-LINKEDIN_JOBS_URL = "https://www.linkedin.com/jobs/"
+LINKEDIN_BASE_URL = os.getenv("LINKEDIN_BASE_URL", "https://www.linkedin.com").rstrip("/")
+LINKEDIN_LOGIN_URL = f"{LINKEDIN_BASE_URL}/login"
+LINKEDIN_JOBS_URL = f"{LINKEDIN_BASE_URL}/jobs/"
+LINKEDIN_FEED_URL = f"{LINKEDIN_BASE_URL}/feed/"
+LINKEDIN_JOB_SEARCH_URL = f"{LINKEDIN_BASE_URL}/jobs/search/"
+JOB_POSTING_PATH = "/jobs-guest/jobs/api/jobPosting/{job_id}"  # Server-rendered job detail fragment
+JOB_VIEW_PATH = "/jobs/view/{job_id}/"
 
 # Timeouts (in seconds)
 DEFAULT_TIMEOUT = 10
 LOGIN_TIMEOUT = 30
+DETAIL_PANE_TIMEOUT = 5  # Max wait for the job detail pane to show a clicked card
+CARD_LOAD_QUIET_MS = 600  # Card count must stay unchanged this long at the bottom of the list
+CARD_LOAD_TIMEOUT = 20  # Max time for loading all cards on a results page
+SESSION_PROBE_TIMEOUT = 5  # Max wait for the feed when checking a saved session
+
+# Job search: "url" opens a search URL built from the settings, "ui" types into the search form
+SEARCH_MODE = "url"  # The form is still used as a fallback if the URL search finds no results list
+DATE_POSTED_URL_PARAMS = {  # date_posted_filter setting -> f_TPR query parameter
+    "past_24_hours": "r86400",
+    "past_week": "r604800",
+    "past_month": "r2592000",
+    "any_time": ""
+}
+
+# Multi-query search (keyword groups x locations x date ranges from Settings.json)
+QUERY_STATS_PATH = str(DATA_DIR / "query_stats.json")  # Per-query yield history used to order searches
+QUERY_YIELD_SMOOTHING = 0.5  # Weight of the latest run in a query's moving-average yield
+
+# Incremental mode: sort results newest first and stop paginating once results are already known
+INCREMENTAL_MODE = False  # Also enabled per run with python main.py --incremental
+INCREMENTAL_SEEN_THRESHOLD = 10  # Stop after this many already-seen jobs in a row (or a page with only seen jobs)
+HIGH_WATER_MARK_SIZE = 100  # Newest job ids remembered per search query
+
+# Checkpoints for resuming interrupted runs (python main.py --resume)
+CHECKPOINT_PATH = str(DATA_DIR / "checkpoint.json")
+CHECKPOINT_INTERVAL = 30  # Seconds between checkpoint saves while a page is being processed
+
+# Session reuse: skip the login form when a saved session is still valid
+SESSION_REUSE = True
+SESSION_COOKIES_PATH = str(DATA_DIR / "linkedin_cookies.json")  # Cookie jar saved after a successful login
+
+# OpenAI scoring
+OPENAI_MODEL = "gpt-4o"
+OPENAI_REQUESTS_PER_MINUTE = 500  # Requests-per-minute budget for the scoring model
+OPENAI_TOKENS_PER_MINUTE = 30000  # Tokens-per-minute budget for the scoring model
+OPENAI_MAX_RETRIES = 5  # Retries for 429 and 5xx responses, with jittered backoff
+SCORING_CONCURRENCY = 8  # Concurrent requests for async batch scoring (JobMatcher.score_many)
+SCORING_BATCH_SIZE = 5  # Jobs scored per request; 1 sends every job on its own
+OPENAI_BUDGET_USD = None  # Stop scoring once a run's API cost reaches this many dollars; None means no limit
+# USD per 1M tokens, used for the per-run cost report
+MODEL_PRICING = {
+    "gpt-4o": {"input": 2.50, "cached_input": 1.25, "output": 10.00},
+    "gpt-4o-mini": {"input": 0.15, "cached_input": 0.075, "output": 0.60}
+}
+
+# Description compaction: strip EEO, benefits and "about us" boilerplate before scoring
+DESCRIPTION_COMPACTION = True
+DESCRIPTION_MAX_CHARS = 4000  # Longer descriptions are cut, keeping requirement sections whole
+
+# OpenAI Batch API scoring
+BATCH_POLL_INTERVAL = 30  # Seconds between batch status checks
+BATCH_COMPLETION_WINDOW = "24h"
+BATCH_MAX_RESUBMITS = 1  # Times the unscored jobs of a failed, expired or cancelled batch are resubmitted
+
+# Resume: the extracted text and derived profile are cached by the PDF's content hash
+RESUME_PATH = str(BASE_DIR / "config" / "resume.pdf")
+RESUME_CACHE_PATH = str(DATA_DIR / "resume_cache.json")
+
+# Relevance pre-filter (local TF-IDF similarity between resume and job description)
+PREFILTER_ENABLED = True
+PREFILTER_THRESHOLD = 0.05  # Jobs below this similarity are recorded but not sent to the LLM (with PREFILTER_SKIP)
+# Off until the threshold is calibrated (python -m linkedin.prefilter): jobs below it are only counted, and still scored
+PREFILTER_SKIP = False
+PREFILTER_HISTORY_FILES = 5  # Recent raw job files used to seed the IDF statistics
+
+# Score cache
+SCORE_CACHE_ENABLED = True  # Reuse scores for jobs already scored against the same resume, needs and model
+SCORE_CACHE_PATH = str(DATA_DIR / "score_cache.sqlite3")
+SCORE_CACHE_MAX_ENTRIES = 50000  # Least recently used entries beyond this are evicted
+SCORE_CACHE_MAX_AGE_DAYS = 90  # Entries older than this are evicted
+
+# Near-duplicate detection (reposts and location variants reuse the first posting's cached score)
+NEAR_DUPLICATES_ENABLED = True
+NEAR_DUPLICATE_PATH = str(DATA_DIR / "near_duplicates.sqlite3")
+NEAR_DUPLICATE_THRESHOLD = 0.9  # Estimated Jaccard similarity of description shingles to join a cluster
+NEAR_DUPLICATE_NUM_PERM = 128  # MinHash permutations; more is more accurate but slower
+NEAR_DUPLICATE_SHINGLE_SIZE = 5  # Words per shingle
+
+# Job storage
+JOB_STORE_FSYNC = False  # fsync after every appended job record (slower, but survives power loss)
+
+# Seen-job index (skips job cards already scraped in earlier runs before clicking them)
+SEEN_JOBS_ENABLED = True
+SEEN_JOBS_PATH = str(DATA_DIR / "seen_jobs.sqlite3")
+SEEN_JOB_TTL_DAYS = None  # Re-scrape jobs last seen more than this many days ago; None never re-checks
+
+# Job detail fetching: "click" opens each card in the results list, "direct" collects the
+# job ids from the list and fetches each job's details over HTTP with the session cookies
+JOB_FETCH_MODE = "click"
+JOB_FETCH_WORKERS = 4  # Concurrent detail requests in direct mode
+JOB_FETCH_TIMEOUT = 15  # Seconds per detail request
+
+# Browser pool: shard result pages across several Chrome instances sharing one login
+BROWSER_POOL_SIZE = 1  # Number of browsers; 1 walks the result pages in order with the main browser
+BROWSER_PAGE_RETRIES = 2  # Times a page is handed out again after its browser crashed or processing it failed
+RESULTS_PAGE_SIZE = 25  # Job cards per search results page (the start= offset step)
+MAX_RESULT_PAGES = 40  # LinkedIn stops serving results after 1000 jobs
+
+# Scoring pipeline
+PIPELINE_SCORING = True  # Score jobs on background workers while the browser keeps scraping
+SCORING_WORKERS = 4  # Number of concurrent scoring threads
+SCORING_QUEUE_SIZE = 50  # Max jobs waiting to be scored before the scraper blocks
+
+# Run metrics: per-stage timings written as JSON and as a Prometheus textfile while a run goes on
+METRICS_ENABLED = True
+METRICS_JSON_PATH = str(DATA_DIR / "metrics.json")
+METRICS_PROMETHEUS_PATH = str(DATA_DIR / "metrics" / "linkedin_bot.prom")  # Point node exporter's --collector.textfile.directory at this directory
+METRICS_INTERVAL = 30  # Minimum seconds between metric writes during a run
 
 # Selectors
 SELECTORS = {
@@ -55,6 +186,15 @@ SELECTORS = {
         "job_description": "//div[contains(@class, 'jobs-description-content__text')]",  # XPath for job description text
         "company_name": "//div[contains(@class, 'job-details-jobs-unified-top-card__company-name')]//a",  # XPath for company name link
         "job_title": "//div[contains(@class, 'job-details-jobs-unified-top-card__job-title')]//a",  # XPath for job title link
-        "results_count": "//div[contains(@class, 'jobs-search-results-list__subtitle')]//span"  # XPath for total results count
+        "results_count": "//div[contains(@class, 'jobs-search-results-list__subtitle')]//span",  # XPath for total results count
+        "no_results": "//*[contains(@class, 'jobs-search-no-results-banner')]",  # XPath for the banner of a search without results
+        "job_view_title": "//div[contains(@class, 'job-details-jobs-unified-top-card__job-title')]//h1"  # XPath for title on /jobs/view pages
+    },
+    # Class names in the server-rendered job posting fragment (JOB_POSTING_PATH), parsed without a browser
+    "job_posting": {
+        "job_title": "top-card-layout__title",  # Job title heading
+        "job_url": "topcard__link",  # Link wrapping the title
+        "company_name": "topcard__org-name-link",  # Company name link
+        "job_description": "show-more-less-html__markup"  # Job description body
     }
 } 
\ No newline at end of file
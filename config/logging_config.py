@@ -13,7 +13,8 @@ class LogManager:
             cls._instance = super(LogManager, cls).__new__(cls)
         return cls._instance
 
-    def __init__(self):
+    def _ensure_initialized(self):
+        """Set up logging on first use, so importing a module does not create a log file."""
         if not self._initialized:
             self._timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             self._setup_logging()
@@ -21,6 +22,7 @@ class LogManager:
 
     @property
     def timestamp(self) -> str:
+        self._ensure_initialized()
         return self._timestamp
 
     def _setup_logging(self):
@@ -61,9 +63,9 @@ class LogManager:
         # Log the start of a new session
         root_logger.info(f"=== New Session Started at {datetime.now().strftime('%Y-%m-%d %H:%M:%S')} ===")
 
-    @staticmethod
-    def get_logger(name: Optional[str] = None) -> logging.Logger:
+    def get_logger(self, name: Optional[str] = None) -> logging.Logger:
         """Get a logger instance for a module"""
+        self._ensure_initialized()
         return logging.getLogger(name)
 
 # Create a global instance
@@ -1,29 +1,108 @@
 import os
 import json
-import pdfplumber
-from openai import OpenAI
+import time
+import asyncio
+import threading
+from collections import OrderedDict
+from openai import OpenAI, AsyncOpenAI, APIConnectionError, APIStatusError, RateLimitError
 from dotenv import load_dotenv
 
+from config.config import (
+    OPENAI_MODEL,
+    OPENAI_REQUESTS_PER_MINUTE,
+    OPENAI_TOKENS_PER_MINUTE,
+    OPENAI_MAX_RETRIES,
+    SCORING_CONCURRENCY,
+    SCORING_BATCH_SIZE,
+    SCORE_CACHE_ENABLED,
+    SCORE_CACHE_PATH,
+    SCORE_CACHE_MAX_ENTRIES,
+    SCORE_CACHE_MAX_AGE_DAYS,
+    DESCRIPTION_COMPACTION,
+    NEAR_DUPLICATES_ENABLED,
+    NEAR_DUPLICATE_PATH
+)
+from .rate_limiter import RateLimiter, backoff_delay
+from .score_cache import ScoreCache, content_hash
+from .resume_profile import load_resume
+from .usage import UsageTracker
+from .description_compactor import compact_description
+from .near_duplicates import NearDuplicateIndex
+
+SYSTEM_PROMPT = "You are a job matching expert. Analyze the following resume, job description, and candidate's needs to determine the likelihood of the candidate getting this job."
+
+# Rough upper bound for the JSON reply per job, used when reserving tokens-per-minute budget
+EXPECTED_COMPLETION_TOKENS = 20
+# Descriptions whose compacted text and cluster id are remembered, so a long run doesn't keep every one
+MEMO_MAX_ENTRIES = 2000
+
+
+class BoundedMemo:
+    """Thread-safe dict that only keeps the max_entries most recently added items."""
+
+    def __init__(self, max_entries=MEMO_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self._items = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._items)
+
+    def get(self, key):
+        with self._lock:
+            return self._items.get(key)
+
+    def put(self, key, value):
+        with self._lock:
+            self._items[key] = value
+            while len(self._items) > self.max_entries:
+                self._items.popitem(last=False)
+        return value
+
+
 class JobMatcher:
     def __init__(self):
         load_dotenv()
-        self.client = OpenAI(api_key=os.getenv('OPENAI_API_KEY'))
+        # Retries are handled here so they can share the rate limiter's budget
+        self.client = OpenAI(api_key=os.getenv('OPENAI_API_KEY'), max_retries=0)
+        self._async_client = None
+        self.model = OPENAI_MODEL
+        self.rate_limiter = RateLimiter(OPENAI_REQUESTS_PER_MINUTE, OPENAI_TOKENS_PER_MINUTE)
         self._resume_text = None
         self._my_needs = None
-        
+        self._profile_hashes = None
+        self._static_prefix = None
+        self._compacted = BoundedMemo()
+        self.usage = UsageTracker(self.model)
+        self.score_cache = ScoreCache(
+            SCORE_CACHE_PATH,
+            max_entries=SCORE_CACHE_MAX_ENTRIES,
+            max_age_days=SCORE_CACHE_MAX_AGE_DAYS
+        ) if SCORE_CACHE_ENABLED else None
+        # Only useful together with the score cache, whose entries it points near-duplicates at
+        self.near_duplicates = NearDuplicateIndex(
+            NEAR_DUPLICATE_PATH,
+            max_age_days=SCORE_CACHE_MAX_AGE_DAYS
+        ) if NEAR_DUPLICATES_ENABLED and SCORE_CACHE_ENABLED else None
+        self._clusters = BoundedMemo()
+
+    @property
+    def async_client(self):
+        """Async OpenAI client, created on first use."""
+        if self._async_client is None:
+            self._async_client = AsyncOpenAI(api_key=os.getenv('OPENAI_API_KEY'), max_retries=0)
+        return self._async_client
+
     def _load_resume_text(self):
         """Load resume text from PDF, only once."""
         if self._resume_text is None:
-            resume_path = os.path.join('config', 'resume.pdf')
-            all_text = []
-            with pdfplumber.open(resume_path) as pdf:
-                for page in pdf.pages:
-                    text = page.extract_text()
-                    if text:
-                        all_text.append(text)
-            self._resume_text = '\n'.join(all_text)
+            self._resume_text = load_resume()["text"]
         return self._resume_text
-    
+
+    def candidate_profile(self):
+        """Skills, years of experience and titles derived from the resume."""
+        return load_resume()["profile"]
+
     def _load_my_needs(self):
         """Load my_needs from settings, only once."""
         if self._my_needs is None:
@@ -31,23 +110,24 @@ class JobMatcher:
                 settings = json.load(f)
                 self._my_needs = settings.get('my_needs', '')
         return self._my_needs
-    
-    def create_matching_prompt(self, job_description):
-        """Create the prompt for job matching."""
-        resume_text = self._load_resume_text()
-        my_needs = self._load_my_needs()
-        
-        return f"""
+
+    def create_static_prefix(self):
+        """Create the part of the prompt shared by every request: instructions, resume and needs.
+
+        It goes first and never changes between jobs, so the provider can cache it.
+        """
+        if self._static_prefix is None:
+            resume_text = self._load_resume_text()
+            my_needs = self._load_my_needs()
+            self._static_prefix = f"""{SYSTEM_PROMPT}
+
 Resume:
 {resume_text}
 
-Job Description:
-{job_description}
-
 What I'm Looking For:
 {my_needs}
 
-Based on the above information, provide a match score from 0-10 where:
+For each job description you are given, provide a match score from 0-10 where:
 - 0 means extremely unlikely to get the job (major mismatches in requirements, experience, or qualifications)
 - 10 means extremely likely to get the job (perfect match in skills, experience, and qualifications)
 
@@ -57,24 +137,370 @@ Consider factors like:
 - Education and qualifications alignment
 - Industry experience relevance
 - Location and work arrangement preferences
-- Overall fit with company culture and role expectations
+- Overall fit with company culture and role expectations"""
+        return self._static_prefix
+
+    def compact(self, job_description):
+        """Job description with boilerplate removed (see description_compactor), computed once per text."""
+        if not DESCRIPTION_COMPACTION or not job_description:
+            return job_description
+        compacted = self._compacted.get(job_description)
+        if compacted is None:
+            compacted = self._compacted.put(job_description, compact_description(job_description))
+        return compacted
+
+    def _prompt_description(self, job_description):
+        """Compacted description for a prompt, counting what compaction saved on this request."""
+        compacted = self.compact(job_description)
+        if DESCRIPTION_COMPACTION and job_description:
+            self.usage.record_compaction(len(job_description), len(compacted))
+        return compacted
+
+    def create_matching_prompt(self, job_description):
+        """Create the job-specific part of the prompt for job matching."""
+        return f"""Job Description:
+{self._prompt_description(job_description)}
 
 Respond ONLY with a JSON object containing a single key "match_score" with a number between 0 and 10."""
 
+    def create_batch_matching_prompt(self, job_descriptions):
+        """Create the job-specific part of the prompt for scoring several jobs at once.
+
+        Args:
+            job_descriptions (dict): Mapping of a short job label to its description.
+        """
+        sections = '\n\n'.join(
+            f"### Job {label}\n{self._prompt_description(job_description)}"
+            for label, job_description in job_descriptions.items()
+        )
+        return f"""Score each of the following {len(job_descriptions)} jobs independently.
+
+{sections}
+
+Respond ONLY with a JSON object containing a single key "results": an array with exactly one entry per job, each a JSON object {{"job_id": "<the label after ### Job>", "match_score": <a number between 0 and 10>}}."""
+
+    def cluster_id(self, job_description):
+        """Near-duplicate cluster of a job description: the content hash of the first posting like it.
+
+        Postings are compared on their compacted text, but the id is always the hash
+        of a raw description. Without the near-duplicate index this is simply the
+        description's own content hash.
+        """
+        cluster_id = self._clusters.get(job_description)
+        if cluster_id is None:
+            cluster_id = content_hash(job_description)
+            if self.near_duplicates:
+                cluster_id = self.near_duplicates.assign(cluster_id, self.compact(job_description))
+            self._clusters.put(job_description, cluster_id)
+        return cluster_id
+
+    def _cache_key(self, job_hash):
+        """Cache key: a description's content hash, hashes of the resume text and my_needs, plus the model."""
+        if self._profile_hashes is None:
+            self._profile_hashes = (
+                content_hash(self._load_resume_text()),
+                content_hash(self._load_my_needs())
+            )
+        return (job_hash, *self._profile_hashes, self.model)
+
+    def cache_stats(self):
+        """Score cache hit/miss counters, or None when the cache is disabled."""
+        return self.score_cache.stats() if self.score_cache else None
+
+    def near_duplicate_stats(self):
+        """How many descriptions were checked and how many joined an earlier posting's cluster, or None."""
+        return dict(self.near_duplicates.stats) if self.near_duplicates else None
+
+    def _build_request(self, job_description):
+        """Build the chat completion arguments for one job description."""
+        return {
+            "model": self.model,
+            "response_format": {"type": "json_object"},
+            "messages": [
+                {"role": "system", "content": self.create_static_prefix()},
+                {"role": "user", "content": self.create_matching_prompt(job_description)}
+            ]
+        }
+
+    def _build_batch_request(self, job_descriptions):
+        """Build the chat completion arguments for scoring several labelled jobs in one request."""
+        return {
+            "model": self.model,
+            "response_format": {"type": "json_object"},
+            "messages": [
+                {"role": "system", "content": self.create_static_prefix()},
+                {"role": "user", "content": self.create_batch_matching_prompt(job_descriptions)}
+            ]
+        }
+
+    @staticmethod
+    def _estimate_tokens(request, jobs=1):
+        """Cheap token estimate (~4 characters per token) used to reserve TPM budget."""
+        characters = sum(len(message["content"]) for message in request["messages"])
+        return characters // 4 + EXPECTED_COMPLETION_TOKENS * jobs
+
+    @staticmethod
+    def _retry_delay(error, attempt):
+        """Return how long to wait before retrying `error`, or None if it is not retryable."""
+        if isinstance(error, RateLimitError):
+            retry_after = error.response.headers.get('retry-after')
+        elif isinstance(error, APIStatusError) and error.status_code >= 500:
+            retry_after = None
+        elif isinstance(error, APIConnectionError):
+            retry_after = None
+        else:
+            return None
+
+        delay = backoff_delay(attempt)
+        try:
+            return max(delay, float(retry_after)) if retry_after else delay
+        except ValueError:
+            return delay
+
+    def _record_usage(self, response, estimated_tokens):
+        """Reconcile the rate limiter with the real usage of a response and add it to the run's cost."""
+        usage = getattr(response, 'usage', None)
+        self.rate_limiter.record_usage(estimated_tokens, usage.total_tokens if usage else None)
+        self.usage.record(usage)
+
+    @staticmethod
+    def parse_match_score(content):
+        """Parse the match score out of the model's JSON reply."""
+        result = json.loads(content)
+        return result.get('match_score', 0)
+
+    @staticmethod
+    def parse_batch_scores(content, labels):
+        """Parse a multi-job reply into {label: score}, keeping only well-formed entries.
+
+        Entries with unknown or repeated labels, or with a score that is not a number
+        between 0 and 10, are dropped so the caller can re-score those jobs one by one.
+        """
+        try:
+            results = json.loads(content).get('results')
+        except (TypeError, ValueError, AttributeError):
+            return {}
+        if not isinstance(results, list):
+            return {}
+
+        scores = {}
+        duplicates = set()
+        for entry in results:
+            if not isinstance(entry, dict):
+                continue
+            label = str(entry.get('job_id'))
+            score = entry.get('match_score')
+            if label not in labels or isinstance(score, bool) or not isinstance(score, (int, float)):
+                continue
+            if not 0 <= score <= 10:
+                continue
+            if label in scores:
+                duplicates.add(label)
+            scores[label] = score
+        for label in duplicates:
+            del scores[label]
+        return scores
+
+    def get_cached_score(self, job_description):
+        """Return the cached score for a job description, or None.
+
+        Scores are cached per exact description. On a miss, a near-duplicate reuses
+        the score of the first posting in its cluster.
+        """
+        if not self.score_cache:
+            return None
+        return self.score_cache.get_first(self._lookup_keys(job_description))
+
+    def _lookup_keys(self, job_description):
+        """Cache keys to try for a description: its own, then its cluster's (computed only if needed)."""
+        job_hash = content_hash(job_description)
+        yield self._cache_key(job_hash)
+        if self.near_duplicates:
+            cluster_id = self.cluster_id(job_description)
+            if cluster_id != job_hash:
+                yield self._cache_key(cluster_id)
+
+    def cache_score(self, job_description, match_score):
+        """Store a score obtained outside get_match_score (e.g. from the Batch API)."""
+        if self.score_cache:
+            self.score_cache.put(self._cache_key(content_hash(job_description)), match_score)
+
+    def _complete(self, request, estimated_tokens):
+        """Send a chat completion within the rate limits, retrying 429/5xx responses.
+
+        Raises BudgetExceededError instead of sending once the run's budget is spent.
+        """
+        for attempt in range(OPENAI_MAX_RETRIES + 1):
+            self.usage.check_budget()
+            self.rate_limiter.acquire(estimated_tokens)
+            try:
+                response = self.client.chat.completions.create(**request)
+            except Exception as e:
+                delay = self._retry_delay(e, attempt)
+                if delay is None or attempt == OPENAI_MAX_RETRIES:
+                    raise
+                time.sleep(delay)
+                continue
+            self._record_usage(response, estimated_tokens)
+            return response
+
+    async def _complete_async(self, request, estimated_tokens):
+        """Async version of _complete built on the async OpenAI client."""
+        for attempt in range(OPENAI_MAX_RETRIES + 1):
+            self.usage.check_budget()
+            await self.rate_limiter.acquire_async(estimated_tokens)
+            try:
+                response = await self.async_client.chat.completions.create(**request)
+            except Exception as e:
+                delay = self._retry_delay(e, attempt)
+                if delay is None or attempt == OPENAI_MAX_RETRIES:
+                    raise
+                await asyncio.sleep(delay)
+                continue
+            self._record_usage(response, estimated_tokens)
+            return response
+
     def get_match_score(self, job_description):
         """Get match score for a job description."""
-        # Create and send prompt
-        prompt = self.create_matching_prompt(job_description)
-        
-        response = self.client.chat.completions.create(
-            model="gpt-4o",
-            response_format={"type": "json_object"},
-            messages=[
-                {"role": "system", "content": "You are a job matching expert. Analyze the following resume, job description, and candidate's needs to determine the likelihood of the candidate getting this job."},
-                {"role": "user", "content": prompt}
-            ]
+        cached = self.get_cached_score(job_description)
+        if cached is not None:
+            return cached
+        return self._request_score(job_description)
+
+    def _request_score(self, job_description):
+        """Score one job with the API (no cache lookup) and cache the result."""
+        request = self._build_request(job_description)
+        response = self._complete(request, self._estimate_tokens(request))
+        match_score = self.parse_match_score(response.choices[0].message.content)
+        self.cache_score(job_description, match_score)
+        return match_score
+
+    async def get_match_score_async(self, job_description):
+        """Async version of get_match_score built on the async OpenAI client."""
+        cached = self.get_cached_score(job_description)
+        if cached is not None:
+            return cached
+        return await self._request_score_async(job_description)
+
+    async def _request_score_async(self, job_description):
+        """Async version of _request_score."""
+        request = self._build_request(job_description)
+        response = await self._complete_async(request, self._estimate_tokens(request))
+        match_score = self.parse_match_score(response.choices[0].message.content)
+        self.cache_score(job_description, match_score)
+        return match_score
+
+    def _split_cached(self, job_descriptions):
+        """Split {job_id: description} into (cached scores, jobs that still need scoring)."""
+        cached, uncached = {}, {}
+        for job_id, job_description in job_descriptions.items():
+            score = self.get_cached_score(job_description)
+            if score is not None:
+                cached[job_id] = score
+            else:
+                uncached[job_id] = job_description
+        return cached, uncached
+
+    def _prepare_batch(self, job_descriptions):
+        """Label jobs J1..Jk for a multi-job prompt and build the request."""
+        labels = {f"J{i}": job_id for i, job_id in enumerate(job_descriptions, start=1)}
+        request = self._build_batch_request(
+            {label: job_descriptions[job_id] for label, job_id in labels.items()}
         )
-        
-        # Parse and return the match score
-        result = json.loads(response.choices[0].message.content)
-        return result.get('match_score', 0) 
\ No newline at end of file
+        return labels, request
+
+    def _merge_batch_reply(self, content, labels, job_descriptions):
+        """Map a multi-job reply back to job ids, cache the valid scores and return them."""
+        scores = {}
+        for label, score in self.parse_batch_scores(content, labels).items():
+            job_id = labels[label]
+            scores[job_id] = score
+            self.cache_score(job_descriptions[job_id], score)
+        return scores
+
+    def get_match_scores(self, job_descriptions):
+        """Score several jobs with a single request.
+
+        Jobs missing from the reply, or whose entry is malformed, fall back to
+        individual requests. If the request itself fails, every job
+        not found in the cache gets that error instead.
+
+        Args:
+            job_descriptions (dict): Mapping of job_id to job description text.
+
+        Returns:
+            dict: Mapping of job_id to its match score, or to the exception that made it fail.
+        """
+        results, uncached = self._split_cached(job_descriptions)
+        if len(uncached) > 1:
+            labels, request = self._prepare_batch(uncached)
+            try:
+                response = self._complete(request, self._estimate_tokens(request, len(uncached)))
+            except Exception as e:
+                # Out of retries (rate limit, server error) or budget: one request per job would only add load
+                results.update((job_id, e) for job_id in uncached)
+                return results
+            results.update(self._merge_batch_reply(response.choices[0].message.content, labels, uncached))
+
+        for job_id, job_description in uncached.items():
+            if job_id not in results:
+                try:
+                    # Already looked up in the cache by _split_cached
+                    results[job_id] = self._request_score(job_description)
+                except Exception as e:
+                    results[job_id] = e
+        return results
+
+    async def get_match_scores_async(self, job_descriptions):
+        """Async version of get_match_scores built on the async OpenAI client."""
+        results, uncached = self._split_cached(job_descriptions)
+        if len(uncached) > 1:
+            labels, request = self._prepare_batch(uncached)
+            try:
+                response = await self._complete_async(request, self._estimate_tokens(request, len(uncached)))
+            except Exception as e:
+                # Out of retries (rate limit, server error) or budget: one request per job would only add load
+                results.update((job_id, e) for job_id in uncached)
+                return results
+            results.update(self._merge_batch_reply(response.choices[0].message.content, labels, uncached))
+
+        for job_id, job_description in uncached.items():
+            if job_id not in results:
+                try:
+                    results[job_id] = await self._request_score_async(job_description)
+                except Exception as e:
+                    results[job_id] = e
+        return results
+
+    async def score_many(self, job_descriptions, concurrency=None, on_result=None, batch_size=None):
+        """Score many job descriptions concurrently.
+
+        Args:
+            job_descriptions (dict): Mapping of job_id to job description text.
+            concurrency (int, optional): Max requests in flight. Defaults to SCORING_CONCURRENCY.
+            on_result (callable, optional): Called as on_result(job_id, result) as each job finishes.
+            batch_size (int, optional): Jobs per request. Defaults to SCORING_BATCH_SIZE.
+
+        Returns:
+            dict: Mapping of job_id to its match score, or to the exception that made it fail.
+        """
+        semaphore = asyncio.Semaphore(concurrency or SCORING_CONCURRENCY)
+        batch_size = max(1, batch_size or SCORING_BATCH_SIZE)
+        job_ids = list(job_descriptions)
+        results = {}
+
+        async def score_group(group_ids):
+            async with semaphore:
+                group_results = await self.get_match_scores_async(
+                    {job_id: job_descriptions[job_id] for job_id in group_ids}
+                )
+            for job_id in group_ids:
+                results[job_id] = group_results[job_id]
+                if on_result:
+                    on_result(job_id, group_results[job_id])
+
+        await asyncio.gather(*(
+            score_group(job_ids[i:i + batch_size])
+            for i in range(0, len(job_ids), batch_size)
+        ))
+        return results
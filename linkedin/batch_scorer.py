@@ -0,0 +1,231 @@
+import os
+import json
+import time
+from datetime import datetime
+
+from config.config import BATCH_POLL_INTERVAL, BATCH_COMPLETION_WINDOW, BATCH_MAX_RESUBMITS
+from .ai_matcher import EXPECTED_COMPLETION_TOKENS
+from .usage import BudgetExceededError, CHARS_PER_TOKEN
+
+BATCH_ENDPOINT = "/v1/chat/completions"
+FINISHED_STATUSES = {"completed", "failed", "expired", "cancelled"}
+
+
+class BatchScoringError(Exception):
+    """Raised when a scoring batch cannot be submitted or does not complete"""
+    pass
+
+
+class BatchScorer:
+    """Score jobs through the OpenAI Batch API.
+
+    Progress is written to a small state file after every step (request file
+    written, file uploaded, batch created), so a process that dies while polling
+    picks the same batch back up on the next run instead of paying for it twice.
+    A batch that ends failed, expired or cancelled is dropped from the state (its
+    partial results merged first) and the jobs left unscored are resubmitted.
+    """
+
+    def __init__(self, job_matcher, state_file, poll_interval=BATCH_POLL_INTERVAL, max_resubmits=BATCH_MAX_RESUBMITS):
+        self.job_matcher = job_matcher
+        self.client = job_matcher.client
+        self.state_file = state_file
+        self.poll_interval = poll_interval
+        self.max_resubmits = max_resubmits
+
+    def _load_state(self):
+        if not os.path.exists(self.state_file):
+            return None
+        with open(self.state_file, 'r') as f:
+            return json.load(f)
+
+    def _save_state(self, state):
+        tmp_path = self.state_file + '.tmp'
+        with open(tmp_path, 'w') as f:
+            json.dump(state, f, indent=2)
+        os.replace(tmp_path, self.state_file)
+
+    def _clear_state(self, state):
+        """Forget a finished batch: remove the state file and its request file."""
+        for path in (self.state_file, state["request_file"]):
+            if os.path.exists(path):
+                os.remove(path)
+
+    def _write_request_file(self, requests, request_file):
+        """Write one Batch API request line per job, keyed by job_id."""
+        with open(request_file, 'w', encoding='utf-8') as f:
+            for job_id, body in requests.items():
+                f.write(json.dumps({
+                    "custom_id": job_id,
+                    "method": "POST",
+                    "url": BATCH_ENDPOINT,
+                    "body": body
+                }) + '\n')
+
+    def _estimate_cost(self, requests):
+        """Estimated cost of a batch, at the same rates UsageTracker bills its results."""
+        characters = sum(len(message["content"]) for body in requests.values() for message in body["messages"])
+        return self.job_matcher.usage.cost(
+            characters // CHARS_PER_TOKEN, 0, EXPECTED_COMPLETION_TOKENS * len(requests)
+        )
+
+    def _submit(self, state):
+        """Upload the request file and create the batch, resuming whichever step is missing."""
+        if not state.get("input_file_id"):
+            with open(state["request_file"], 'rb') as f:
+                uploaded = self.client.files.create(file=f, purpose="batch")
+            state["input_file_id"] = uploaded.id
+            self._save_state(state)
+            print(f"Uploaded batch request file: {uploaded.id}")
+
+        if not state.get("batch_id"):
+            batch = self.client.batches.create(
+                input_file_id=state["input_file_id"],
+                endpoint=BATCH_ENDPOINT,
+                completion_window=BATCH_COMPLETION_WINDOW
+            )
+            state["batch_id"] = batch.id
+            state["status"] = batch.status
+            self._save_state(state)
+            print(f"Created batch: {batch.id}")
+
+    def _poll(self, state):
+        """Poll the batch until it reaches a final status and return it."""
+        while True:
+            batch = self.client.batches.retrieve(state["batch_id"])
+            if batch.status != state.get("status"):
+                state["status"] = batch.status
+                self._save_state(state)
+            counts = batch.request_counts
+            if counts:
+                print(f"Batch {batch.id}: {batch.status} ({counts.completed}/{counts.total} done, {counts.failed} failed)")
+            else:
+                print(f"Batch {batch.id}: {batch.status}")
+            if batch.status in FINISHED_STATUSES:
+                return batch
+            time.sleep(self.poll_interval)
+
+    def _read_output(self, file_id):
+        """Yield (job_id, result line) pairs from a batch output or error file."""
+        if not file_id:
+            return
+        content = self.client.files.content(file_id).text
+        for line in content.splitlines():
+            if line.strip():
+                record = json.loads(line)
+                yield record["custom_id"], record
+
+    def _new_state(self, jobs, on_result):
+        """Write the request file for the jobs that aren't cached yet and save a fresh state.
+
+        Cached jobs are passed to on_result right away. When the batch's estimated cost
+        would take the run over its budget, nothing is submitted and every uncached job
+        gets the BudgetExceededError instead. Returns None when there is nothing to submit.
+        """
+        uncached = {}
+        for job_id, job_data in jobs.items():
+            cached = self.job_matcher.get_cached_score(job_data['job_description'])
+            if cached is not None:
+                on_result(job_id, cached)
+            else:
+                uncached[job_id] = job_data
+        if not uncached:
+            return None
+
+        requests = {
+            job_id: self.job_matcher._build_request(job_data['job_description'])
+            for job_id, job_data in uncached.items()
+        }
+        try:
+            self.job_matcher.usage.check_budget(self._estimate_cost(requests))
+        except BudgetExceededError as e:
+            for job_id in uncached:
+                on_result(job_id, e)
+            return None
+
+        request_file = os.path.splitext(self.state_file)[0] + '_requests.jsonl'
+        self._write_request_file(requests, request_file)
+        state = {
+            "request_file": request_file,
+            "job_count": len(uncached),
+            "created_at": datetime.now().isoformat()
+        }
+        self._save_state(state)
+        print(f"Wrote {len(uncached)} batch requests to {request_file}")
+        return state
+
+    def _merge_output(self, batch, jobs, on_result, report_errors=True):
+        """Pass the batch's results to on_result and return the ids of the jobs that got one.
+
+        With report_errors=False (a batch that did not complete) only successful
+        results are merged, so the failed jobs can be resubmitted.
+        """
+        handled = set()
+        for job_id, record in self._read_output(batch.output_file_id):
+            if job_id not in jobs:
+                continue
+            response = record.get("response") or {}
+            if record.get("error") or response.get("status_code") != 200:
+                if report_errors:
+                    on_result(job_id, BatchScoringError(str(record.get("error") or response.get("body"))))
+                    handled.add(job_id)
+                continue
+            try:
+                self.job_matcher.usage.record(response["body"].get("usage"))
+                content = response["body"]["choices"][0]["message"]["content"]
+                match_score = self.job_matcher.parse_match_score(content)
+            except (KeyError, IndexError, ValueError) as e:
+                if report_errors:
+                    on_result(job_id, e)
+                    handled.add(job_id)
+                continue
+            self.job_matcher.cache_score(jobs[job_id]['job_description'], match_score)
+            on_result(job_id, match_score)
+            handled.add(job_id)
+
+        if report_errors:
+            for job_id, record in self._read_output(batch.error_file_id):
+                if job_id in jobs and job_id not in handled:
+                    on_result(job_id, BatchScoringError(str(record.get("error"))))
+                    handled.add(job_id)
+        return handled
+
+    def score(self, jobs, on_result):
+        """Score jobs through a batch and call on_result(job_id, result) for each of them.
+
+        Args:
+            jobs (dict): Mapping of job_id to job data with a 'job_description'.
+            on_result (callable): Receives the match score, or the exception for a failed job.
+
+        Raises:
+            BatchScoringError: If the batch still does not complete after max_resubmits resubmissions.
+        """
+        state = self._load_state()
+        if state:
+            print(f"Resuming batch state from {self.state_file}")
+        remaining = dict(jobs)
+
+        for attempt in range(self.max_resubmits + 1):
+            if state is None:
+                state = self._new_state(remaining, on_result)
+                if state is None:
+                    return
+
+            self._submit(state)
+            batch = self._poll(state)
+            completed = batch.status == "completed"
+            handled = self._merge_output(batch, remaining, on_result, report_errors=completed)
+            # Everything usable is merged into the scored store; the batch is done with
+            self._clear_state(state)
+            if completed:
+                return
+
+            remaining = {job_id: job_data for job_id, job_data in remaining.items() if job_id not in handled}
+            if not remaining:
+                return
+            if attempt == self.max_resubmits:
+                raise BatchScoringError(
+                    f"Batch {batch.id} finished with status {batch.status}; {len(remaining)} jobs left unscored"
+                )
+            print(f"Batch {batch.id} finished with status {batch.status}; resubmitting {len(remaining)} unscored jobs")
+            state = None
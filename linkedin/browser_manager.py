@@ -4,18 +4,153 @@ from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException
-from config.config import CHROME_BINARY_PATH, CHROMEDRIVER_PATH, DEFAULT_TIMEOUT
+from config.config import (
+    CHROME_BINARY_PATH,
+    CHROMEDRIVER_PATH,
+    CHROME_PROFILE_DIR,
+    BROWSER_LEAN_MODE,
+    BROWSER_WINDOW_SIZE,
+    BROWSER_DISK_CACHE_MB,
+    BROWSER_JS_HEAP_MB,
+    BROWSER_RENDERER_PROCESS_LIMIT,
+    BLOCKED_URL_PATTERNS,
+    LINKEDIN_BASE_URL,
+    DEFAULT_TIMEOUT,
+    DETAIL_PANE_TIMEOUT,
+    CARD_LOAD_QUIET_MS,
+    CARD_LOAD_TIMEOUT
+)
+import os
+import json
 import time
 
+# Defines extractJobDetails(selectors): reads all job detail fields via XPath in one call
+JOB_DETAILS_SCRIPT = """
+    function extractJobDetails(selectors) {
+        function first(xpath) {
+            return document.evaluate(xpath, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+        }
+        function text(node) {
+            var value = node ? node.innerText.trim() : '';
+            return value || null;
+        }
+        function link(node) {
+            return node && node.href ? node.href : null;
+        }
+        var company = first(selectors.company_name);
+        var title = first(selectors.job_title);
+        var description = first(selectors.job_description);
+        var jobUrl = link(title);
+        var match = jobUrl && (jobUrl.match(/\\/jobs\\/view\\/(?:[^\\/?#]*-)?(\\d+)/) || jobUrl.match(/[?&]currentJobId=(\\d+)/));
+        return {
+            company_name: text(company),
+            company_url: link(company),
+            job_title: text(title),
+            job_url: jobUrl,
+            job_description: text(description),
+            linkedin_job_id: match ? match[1] : null
+        };
+    }
+"""
+
+# Scrolls the results list and watches it with a MutationObserver until the card count
+# settles at the bottom of the list; resolves with the count and the cards' job ids
+LOAD_CARDS_SCRIPT = """
+    var done = arguments[arguments.length - 1];
+    var sentinelXpath = arguments[0], cardXpath = arguments[1], quietMs = arguments[2], timeoutMs = arguments[3];
+
+    function snapshot(xpath) {
+        var result = document.evaluate(xpath, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+        var nodes = [];
+        for (var i = 0; i < result.snapshotLength; i++) {
+            nodes.push(result.snapshotItem(i));
+        }
+        return nodes;
+    }
+    function jobId(card) {
+        var holder = card.closest('[data-job-id]') || card.querySelector('[data-job-id]');
+        if (holder && holder.getAttribute('data-job-id')) {
+            return holder.getAttribute('data-job-id');
+        }
+        var link = card.querySelector('a[href*="/jobs/view/"]');
+        var match = link && link.href.match(/\\/jobs\\/view\\/(?:[^\\/?#]*-)?(\\d+)/);
+        return match ? match[1] : null;
+    }
+
+    var sentinel = snapshot(sentinelXpath)[0];
+    if (!sentinel || !sentinel.parentElement) {
+        done({error: 'scroll sentinel not found'});
+        return;
+    }
+    var container = sentinel.parentElement;
+    var started = Date.now();
+    var count = snapshot(cardXpath).length;
+    var lastChange = Date.now();
+
+    var observer = new MutationObserver(function() {
+        var current = snapshot(cardXpath).length;
+        if (current !== count) {
+            count = current;
+            lastChange = Date.now();
+        }
+    });
+    observer.observe(container, {childList: true, subtree: true});
+
+    function finish(timedOut) {
+        observer.disconnect();
+        container.scrollTo(0, 0);
+        var cards = snapshot(cardXpath);
+        done({count: cards.length, job_ids: cards.map(jobId), timed_out: timedOut});
+    }
+
+    function step() {
+        var atBottom = container.scrollTop + container.clientHeight >= container.scrollHeight - 5;
+        if (atBottom && Date.now() - lastChange >= quietMs) {
+            finish(false);
+            return;
+        }
+        if (Date.now() - started >= timeoutMs) {
+            finish(true);
+            return;
+        }
+        if (!atBottom) {
+            // Scroll by 80% of the visible height so every card passes through the viewport
+            container.scrollTo(0, container.scrollTop + Math.round(container.clientHeight * 0.8));
+        }
+        setTimeout(step, 100);
+    }
+    step();
+"""
+
+def _detail_selectors(selectors):
+    """Pick the detail-pane XPaths the extraction script needs."""
+    return {key: selectors[key] for key in ("company_name", "job_title", "job_description")}
+
+# Cookie fields WebDriver's add_cookie() accepts
+COOKIE_FIELDS = ("name", "value", "path", "domain", "secure", "httpOnly", "expiry", "sameSite")
+
+class StaleDetailPaneError(Exception):
+    """Raised when the job detail pane does not switch to the clicked job in time"""
+    pass
+
 class BrowserManager:
     def __init__(self):
         self.driver = None
         self.wait = None
 
-    def initialize_browser(self):
-        """Initialize the Chrome browser with custom options."""
+    def initialize_browser(self, profile_dir=CHROME_PROFILE_DIR, lean=BROWSER_LEAN_MODE):
+        """Initialize the Chrome browser with custom options.
+
+        Args:
+            profile_dir: Persistent Chrome user data directory, so cookies and the
+                login survive restarts. None starts with a fresh temporary profile.
+            lean: Run headless with capped memory and cache, and block images, media,
+                fonts and analytics requests (BLOCKED_URL_PATTERNS).
+        """
         options = Options()
         options.binary_location = CHROME_BINARY_PATH
+        if profile_dir:
+            options.add_argument(f"--user-data-dir={os.path.abspath(profile_dir)}")
         options.add_argument("--no-sandbox")
         options.add_argument("--disable-dev-shm-usage")
         
@@ -34,11 +169,34 @@ class BrowserManager:
         # - Using WebKit/537.36 rendering engine
         options.add_argument("user-agent=Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/122.0.0.0 Safari/537.36")
 
+        if lean:
+            self._add_lean_options(options)
+
         service = Service(executable_path=CHROMEDRIVER_PATH)
         self.driver = webdriver.Chrome(service=service, options=options)
         self.wait = WebDriverWait(self.driver, DEFAULT_TIMEOUT)
+        if lean:
+            self.block_urls(BLOCKED_URL_PATTERNS)
         return self.driver
 
+    def _add_lean_options(self, options):
+        """Headless, low-memory Chrome flags for small servers."""
+        options.add_argument("--headless=new")
+        options.add_argument(f"--window-size={BROWSER_WINDOW_SIZE}")
+        options.add_argument("--disable-gpu")
+        options.add_argument("--disable-extensions")
+        options.add_argument("--mute-audio")
+        options.add_argument("--blink-settings=imagesEnabled=false")
+        options.add_argument(f"--disk-cache-size={BROWSER_DISK_CACHE_MB * 1024 * 1024}")
+        options.add_argument(f"--js-flags=--max-old-space-size={BROWSER_JS_HEAP_MB}")
+        options.add_argument(f"--renderer-process-limit={BROWSER_RENDERER_PROCESS_LIMIT}")
+        options.add_argument("--disable-features=Translate,MediaRouter,OptimizationHints")
+
+    def block_urls(self, patterns):
+        """Block requests matching the URL patterns (wildcards allowed) via DevTools."""
+        self.driver.execute_cdp_cmd("Network.enable", {})
+        self.driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": list(patterns)})
+
     def wait_for_element(self, locator, timeout=DEFAULT_TIMEOUT):
         """Wait for an element to be present in the DOM."""
         try:
@@ -103,6 +261,125 @@ class BrowserManager:
         except Exception as e:
             print(f"Error ensuring element in viewport: {str(e)}")
 
+    def get_card_job_id(self, card):
+        """Read LinkedIn's job id from a job card's data attributes or job link."""
+        try:
+            return self.driver.execute_script("""
+                var card = arguments[0];
+                var holder = card.closest('[data-job-id]') || card.querySelector('[data-job-id]');
+                if (holder && holder.getAttribute('data-job-id')) {
+                    return holder.getAttribute('data-job-id');
+                }
+                var link = card.querySelector('a[href*="/jobs/view/"]');
+                var match = link && link.href.match(/\\/jobs\\/view\\/(?:[^\\/?#]*-)?(\\d+)/);
+                return match ? match[1] : null;
+            """, card)
+        except Exception as e:
+            print(f"Error reading job id from card: {str(e)}")
+            return None
+
+    def load_all_job_cards(self, sentinel_xpath, card_xpath, quiet_ms=CARD_LOAD_QUIET_MS, timeout=CARD_LOAD_TIMEOUT):
+        """Load every card in the results list with a single in-page script.
+
+        The script scrolls the list container and uses a MutationObserver to notice new
+        cards, resolving once the bottom is reached and the count has been stable for
+        quiet_ms (or after timeout seconds).
+
+        Returns:
+            dict: 'count', 'job_ids' (one per card, None where unknown) and 'timed_out',
+                or 'error' if the list container could not be found.
+        """
+        # The script timeout is driver-wide; put the previous one back for later async scripts
+        previous_timeout = self.driver.timeouts.script
+        self.driver.set_script_timeout(timeout + 5)
+        try:
+            return self.driver.execute_async_script(
+                LOAD_CARDS_SCRIPT, sentinel_xpath, card_xpath, quiet_ms, int(timeout * 1000)
+            )
+        finally:
+            self.driver.set_script_timeout(previous_timeout)
+
+    def extract_job_details(self, selectors):
+        """Extract every job detail field in one round trip.
+
+        Args:
+            selectors (dict): XPaths for 'company_name', 'job_title' and 'job_description'
+                (e.g. SELECTORS["jobs"]).
+
+        Returns:
+            dict: company_name, company_url, job_title, job_url, job_description and
+                linkedin_job_id; fields that are not on the page are None.
+        """
+        return self.driver.execute_script(
+            JOB_DETAILS_SCRIPT + "return extractJobDetails(arguments[0]);",
+            _detail_selectors(selectors)
+        )
+
+    def wait_for_job_detail(self, linkedin_job_id, selectors, timeout=DETAIL_PANE_TIMEOUT):
+        """Wait until the job detail pane shows the given job and return its details.
+
+        Returns as soon as the title link points at linkedin_job_id and the description
+        has text, instead of sleeping a fixed amount after clicking a card. The final
+        poll doubles as the extraction, so no further round trips are needed.
+
+        Raises:
+            StaleDetailPaneError: If the pane still shows another job (or nothing) after timeout.
+        """
+        script = JOB_DETAILS_SCRIPT + """
+            var details = extractJobDetails(arguments[0]);
+            if (details.linkedin_job_id !== arguments[1] || !details.job_description) {
+                return null;
+            }
+            return details;
+        """
+        try:
+            return WebDriverWait(self.driver, timeout, poll_frequency=0.1).until(
+                lambda driver: driver.execute_script(script, _detail_selectors(selectors), str(linkedin_job_id))
+            )
+        except TimeoutException:
+            raise StaleDetailPaneError(
+                f"Detail pane did not show job {linkedin_job_id} within {timeout}s"
+            )
+
+    def save_cookies(self, path):
+        """Write the browser's cookies to a JSON cookie jar readable only by the current user."""
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp_path = f"{path}.tmp"
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, 'w') as f:
+            json.dump(self.driver.get_cookies(), f)
+        os.replace(tmp_path, path)
+
+    def add_cookies(self, cookies, url=LINKEDIN_BASE_URL):
+        """Add cookies to the browser, skipping expired ones. Returns how many were added."""
+        # Cookies can only be set for the domain that is currently open
+        self.driver.get(url)
+        now = time.time()
+        added = 0
+        for cookie in cookies:
+            if cookie.get("expiry") and cookie["expiry"] < now:
+                continue
+            try:
+                self.driver.add_cookie({key: cookie[key] for key in COOKIE_FIELDS if key in cookie})
+                added += 1
+            except Exception as e:
+                print(f"Could not add cookie {cookie.get('name')}: {str(e)}")
+        return added
+
+    def load_cookies(self, path, url=LINKEDIN_BASE_URL):
+        """Load a cookie jar written by save_cookies(). Returns how many cookies were added."""
+        try:
+            with open(path, 'r') as f:
+                cookies = json.load(f)
+        except FileNotFoundError:
+            return 0
+        except json.JSONDecodeError as e:
+            print(f"Ignoring unreadable cookie jar {path}: {str(e)}")
+            return 0
+        return self.add_cookies(cookies, url)
+
     def quit(self):
         """Close the browser and clean up."""
         if self.driver:
@@ -0,0 +1,144 @@
+import threading
+from collections import deque
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+
+from config.config import RESULTS_PAGE_SIZE, MAX_RESULT_PAGES, BROWSER_PAGE_RETRIES
+from config.logging_config import log_manager
+from .browser_manager import BrowserManager
+
+
+def results_page_url(search_url, offset):
+    """Return the search results URL for the page starting at the given offset."""
+    parts = urlsplit(search_url)
+    query = [(key, value) for key, value in parse_qsl(parts.query) if key != "start"]
+    if offset:
+        query.append(("start", str(offset)))
+    return urlunsplit(parts._replace(query=urlencode(query)))
+
+
+class PageScheduler:
+    """Hands out result page offsets to browser workers.
+
+    Pages are served in order, skipping skip_offsets; a page that failed (e.g. its browser crashed) is
+    handed out again (up to max_retries times) before any new page. When the total result count is
+    unknown, workers call mark_end() once they reach a short or empty page.
+    """
+
+    def __init__(self, total_jobs=None, page_size=RESULTS_PAGE_SIZE,
+                 max_pages=MAX_RESULT_PAGES, max_retries=BROWSER_PAGE_RETRIES, skip_offsets=()):
+        self.page_size = page_size
+        self.max_retries = max_retries
+        self._end = page_size * max_pages
+        if total_jobs:
+            self._end = min(self._end, total_jobs)
+        self._next = 0
+        self._skip = set(skip_offsets)  # Pages already completed, e.g. before a resumed run
+        self._retry = deque()
+        self._attempts = {}
+        self._cancelled = False
+        self._lock = threading.Lock()
+
+    @property
+    def cancelled(self):
+        return self._cancelled
+
+    def next_offset(self):
+        """Return the next page offset to process, or None when every page is handed out."""
+        with self._lock:
+            if self._cancelled:
+                return None
+            while self._retry:
+                offset = self._retry.popleft()
+                if offset < self._end:
+                    return offset
+            while self._next in self._skip:
+                self._next += self.page_size
+            if self._next >= self._end:
+                return None
+            offset = self._next
+            self._next += self.page_size
+            return offset
+
+    def retry(self, offset):
+        """Queue a page again after a failure. Returns False once it is out of retries."""
+        with self._lock:
+            self._attempts[offset] = self._attempts.get(offset, 0) + 1
+            if self._attempts[offset] > self.max_retries:
+                return False
+            self._retry.append(offset)
+            return True
+
+    def mark_end(self, offset):
+        """Record that there are no results at or beyond offset."""
+        with self._lock:
+            self._end = min(self._end, offset)
+
+    def cancel(self):
+        """Stop handing out pages, e.g. after a KeyboardInterrupt."""
+        with self._lock:
+            self._cancelled = True
+
+
+class BrowserPool:
+    """Several Chrome instances sharing one authenticated LinkedIn session.
+
+    The first browser is the already logged-in one; the others are started on
+    demand and given its cookies, so only one login is needed. A crashed browser
+    can be replaced with restart() without affecting the others.
+    """
+
+    def __init__(self, primary, size):
+        self.logger = log_manager.get_logger(__name__)
+        self.size = max(1, size)
+        self.cookies = primary.driver.get_cookies()
+        self.browsers = [primary]
+        self._lock = threading.Lock()
+
+    def _start_browser(self):
+        browser = BrowserManager()
+        # Chrome locks a profile directory to one instance, so pooled browsers use fresh ones
+        browser.initialize_browser(profile_dir=None)
+        browser.add_cookies(self.cookies)
+        return browser
+
+    def start(self):
+        """Start the additional browsers in parallel and return the full list."""
+        extra = self.size - len(self.browsers)
+        started = [None] * extra
+
+        def start_one(index):
+            try:
+                started[index] = self._start_browser()
+            except Exception as e:
+                self.logger.error(f"Failed to start pooled browser: {str(e)}")
+
+        threads = [threading.Thread(target=start_one, args=(i,)) for i in range(extra)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.browsers.extend(browser for browser in started if browser)
+        self.logger.info(f"Browser pool running with {len(self.browsers)} browsers")
+        return list(self.browsers)
+
+    def restart(self, index):
+        """Replace the browser at index with a fresh one carrying the shared session."""
+        try:
+            self.browsers[index].quit()
+        except Exception:
+            pass
+        browser = self._start_browser()
+        with self._lock:
+            self.browsers[index] = browser
+        self.logger.info(f"Restarted browser {index + 1}")
+        return browser
+
+    def quit(self):
+        """Close every browser except the primary one (index 0)."""
+        for browser in self.browsers[1:]:
+            try:
+                browser.quit()
+            except Exception as e:
+                self.logger.error(f"Error while closing pooled browser: {str(e)}")
+        del self.browsers[1:]
@@ -0,0 +1,123 @@
+import os
+import json
+import time
+import threading
+from datetime import datetime
+
+from config.config import CHECKPOINT_PATH, CHECKPOINT_INTERVAL
+
+CHECKPOINT_VERSION = 1
+
+
+class RunCheckpoint:
+    """Progress of an in-progress scraping run, saved atomically to a JSON file.
+
+    Records the run's file timestamp, which searches are finished, the search in
+    progress and its completed result pages, and the LinkedIn job ids already
+    recorded. A resumed run reuses the same run files and continues from there;
+    which jobs still need scoring is worked out from those files.
+    """
+
+    def __init__(self, path=CHECKPOINT_PATH, run_timestamp=None, interval=CHECKPOINT_INTERVAL):
+        self.path = path
+        self.interval = interval
+        self.run_timestamp = run_timestamp
+        self.completed_searches = []
+        self.current_search = None
+        self.completed_offsets = set()
+        self.processed_job_ids = set()
+        self.resumed = False  # True when loaded from a previous run's file
+        self._lock = threading.Lock()
+        self._last_save = 0.0
+
+    @classmethod
+    def load(cls, path=CHECKPOINT_PATH):
+        """Load a saved checkpoint, or return None if there is none (or it is unreadable)."""
+        try:
+            with open(path, 'r') as f:
+                state = json.load(f)
+        except FileNotFoundError:
+            return None
+        except json.JSONDecodeError:
+            return None
+        if state.get("version") != CHECKPOINT_VERSION:
+            return None
+
+        checkpoint = cls(path, state["run_timestamp"])
+        checkpoint.resumed = True
+        checkpoint.completed_searches = state.get("completed_searches", [])
+        checkpoint.current_search = state.get("current_search")
+        checkpoint.completed_offsets = set(state.get("completed_offsets", []))
+        checkpoint.processed_job_ids = set(state.get("processed_job_ids", []))
+        return checkpoint
+
+    def _state(self):
+        return {
+            "version": CHECKPOINT_VERSION,
+            "run_timestamp": self.run_timestamp,
+            "completed_searches": self.completed_searches,
+            "current_search": self.current_search,
+            "completed_offsets": sorted(self.completed_offsets),
+            "processed_job_ids": sorted(self.processed_job_ids),
+            "updated_at": datetime.now().isoformat()
+        }
+
+    def save(self):
+        """Write the checkpoint atomically."""
+        with self._lock:
+            state = self._state()
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            tmp_path = f"{self.path}.tmp"
+            with open(tmp_path, 'w') as f:
+                json.dump(state, f)
+            os.replace(tmp_path, self.path)
+            self._last_save = time.monotonic()
+
+    def save_if_due(self):
+        """Save if the last save was more than interval seconds ago."""
+        if time.monotonic() - self._last_save >= self.interval:
+            self.save()
+
+    def job_recorded(self, linkedin_job_id):
+        """Note a job saved to the run store."""
+        with self._lock:
+            if linkedin_job_id:
+                self.processed_job_ids.add(linkedin_job_id)
+        self.save_if_due()
+
+    def start_search(self, task):
+        """Begin a search; its completed pages are kept when resuming the same search."""
+        with self._lock:
+            if not self.current_search or self.current_search.get("key") != task.get("key"):
+                self.completed_offsets = set()
+            self.current_search = task
+        self.save()
+
+    def page_done(self, offset):
+        with self._lock:
+            self.completed_offsets.add(offset)
+        self.save()
+
+    def search_done(self, task):
+        with self._lock:
+            if task["key"] not in self.completed_searches:
+                self.completed_searches.append(task["key"])
+            self.current_search = None
+            self.completed_offsets = set()
+        self.save()
+
+    def resume_offset(self, page_size):
+        """Offset of the first result page of the current search that was not completed."""
+        offset = 0
+        while offset in self.completed_offsets:
+            offset += page_size
+        return offset
+
+    def clear(self):
+        """Remove the checkpoint once the run has finished."""
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
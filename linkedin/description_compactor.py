@@ -0,0 +1,127 @@
+import re
+
+from config.config import DESCRIPTION_MAX_CHARS
+
+# Section headings whose whole section is boilerplate for matching purposes
+BOILERPLATE_HEADINGS = re.compile(
+    r"^(about (us|the company|the team)|who we are|our (story|mission|values|culture)|"
+    r"(what we offer|benefits|perks)( and perks| & perks)?|why (join|work)( (us|with us|at .+))?|"
+    r"equal (employment )?opportunity.*|eeo.*|diversity.*|accommodations?.*|"
+    r"privacy.*|how to apply|additional information)\s*:?$",
+    re.IGNORECASE
+)
+# Headings of sections that are always kept, even when the description has to be cut.
+# Checked before BOILERPLATE_HEADINGS, so a requirements section is never dropped.
+REQUIREMENT_HEADINGS = re.compile(
+    r"(requirement|qualification|what you.?ll need|what you bring|what we.?re looking for|what we look for|"
+    r"must have|nice to have|skills|experience|you have|about you|responsibilit|what you.?ll do|the role)",
+    re.IGNORECASE
+)
+# Sentences that are boilerplate wherever they appear
+BOILERPLATE_SENTENCES = re.compile(
+    r"[^.\n]*(equal (employment )?opportunity|without regard to|regardless of (race|age|gender)|"
+    r"reasonable accommodation|e-verify|affirmative action|protected veteran|"
+    r"we offer (competitive|a competitive|health|medical)|401\(?k\)?|flexible pto)[^.\n]*(\.|$)",
+    re.IGNORECASE
+)
+# With fewer words left the headings were probably misread, so the original text is used
+MIN_COMPACTED_WORDS = 25
+TRUNCATION_MARK = " ..."
+
+
+def _is_heading(line):
+    """Short line that introduces a section, e.g. "Requirements" or "About Contoso:"."""
+    stripped = line.strip()
+    return (0 < len(stripped) <= 60 and not stripped.startswith(("-", "*", "•")) and
+            (stripped.endswith(":") or not stripped.endswith((".", ",", ";"))) and len(stripped.split()) <= 8)
+
+
+def _sections(text):
+    """Split a description into (heading or None, lines) sections."""
+    sections = [(None, [])]
+    previous_blank = True
+    for line in text.splitlines():
+        if previous_blank and _is_heading(line):
+            sections.append((line.strip(), []))
+        else:
+            sections[-1][1].append(line)
+        previous_blank = not line.strip()
+    return [(heading, lines) for heading, lines in sections if heading or any(line.strip() for line in lines)]
+
+
+def _render(heading, lines):
+    body = "\n".join(lines).strip()
+    body = re.sub(r"\n{3,}", "\n\n", body)
+    return f"{heading}\n{body}".strip() if heading else body
+
+
+def _cut(section, limit):
+    """The section cut at a word boundary to at most limit characters, or "" if nothing fits."""
+    if len(section) <= limit:
+        return section
+    limit -= len(TRUNCATION_MARK)
+    if limit <= 0:
+        return ""
+    return section[:limit].rsplit(" ", 1)[0] + TRUNCATION_MARK
+
+
+def _fit(sections, max_chars):
+    """Join sections in order, cutting the first one that doesn't fit and dropping the rest."""
+    parts = []
+    room = max_chars
+    for section in sections:
+        cut = _cut(section, room)
+        if not cut:
+            break
+        parts.append(cut)
+        room -= len(cut) + 2
+        if cut is not section:
+            break
+    return "\n\n".join(parts)
+
+
+def compact_description(text, max_chars=DESCRIPTION_MAX_CHARS):
+    """Strip boilerplate from a job description and cap its length.
+
+    Sections headed like "About us", "Benefits" or "Equal Opportunity" are dropped,
+    as are EEO and benefits sentences anywhere else. If the rest is still longer than
+    max_chars, requirement and responsibility sections are kept whole and the other
+    sections are cut, in their original order, to fit; requirement sections are only
+    cut when they alone are longer than max_chars. If almost nothing is left
+    (fewer than MIN_COMPACTED_WORDS words), the original text is returned, cut to
+    max_chars.
+    """
+    if not text:
+        return text
+
+    kept = []
+    for heading, lines in _sections(text):
+        required = bool(heading and REQUIREMENT_HEADINGS.search(heading))
+        if heading and not required and BOILERPLATE_HEADINGS.match(heading):
+            continue
+        lines = [BOILERPLATE_SENTENCES.sub("", line).rstrip() for line in lines]
+        rendered = _render(heading, lines)
+        if rendered:
+            kept.append((required, rendered))
+
+    compacted = "\n\n".join(section for _, section in kept)
+    if len(compacted.split()) < MIN_COMPACTED_WORDS:
+        return text[:max_chars] if max_chars else text
+    if not max_chars or len(compacted) <= max_chars:
+        return compacted
+
+    # Room left for the other sections, counting the separator after each part
+    required_sections = [section for required, section in kept if required]
+    budget = max_chars - sum(len(section) + 2 for section in required_sections)
+    if budget < -2:
+        return _fit(required_sections, max_chars)
+    parts = []
+    for required, section in kept:
+        if required:
+            parts.append(section)
+        elif budget > 0:
+            cut = _cut(section, budget)
+            if cut:
+                parts.append(cut)
+                budget -= len(cut) + 2
+    return "\n\n".join(parts)
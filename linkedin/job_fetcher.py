@@ -0,0 +1,159 @@
+import re
+import html
+from html.parser import HTMLParser
+from contextlib import nullcontext
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from urllib.parse import urljoin
+
+import httpx
+
+from config.config import (
+    LINKEDIN_BASE_URL,
+    JOB_POSTING_PATH,
+    JOB_FETCH_WORKERS,
+    JOB_FETCH_TIMEOUT,
+    SELECTORS
+)
+
+VOID_ELEMENTS = {"area", "base", "br", "col", "embed", "hr", "img", "input", "link", "meta", "source", "track", "wbr"}
+BLOCK_ELEMENTS = {"br", "p", "div", "li", "ul", "ol", "h1", "h2", "h3", "h4", "h5", "h6", "tr", "section"}
+
+
+class JobFetchError(Exception):
+    """Raised when a job's details cannot be fetched or parsed"""
+    pass
+
+
+class _JobPostingParser(HTMLParser):
+    """Collects the text and href of the first element carrying each target class."""
+
+    def __init__(self, class_names):
+        super().__init__(convert_charrefs=True)
+        self.class_names = class_names  # {field: css class}
+        self.text = {}
+        self.href = {}
+        self._open = []  # [field, depth] for fields currently being captured
+        self._depth = 0
+
+    def handle_starttag(self, tag, attrs):
+        attrs = dict(attrs)
+        classes = (attrs.get("class") or "").split()
+        for field, class_name in self.class_names.items():
+            if field not in self.text and class_name in classes:
+                self.text[field] = []
+                self.href[field] = attrs.get("href")
+                self._open.append([field, self._depth])
+        if tag in BLOCK_ELEMENTS:
+            self._append("\n")
+        if tag not in VOID_ELEMENTS:
+            self._depth += 1
+
+    def handle_endtag(self, tag):
+        if tag in VOID_ELEMENTS:
+            return
+        self._depth -= 1
+        if tag in BLOCK_ELEMENTS:
+            self._append("\n")
+        self._open = [entry for entry in self._open if entry[1] < self._depth]
+
+    def handle_data(self, data):
+        self._append(data)
+
+    def _append(self, data):
+        for field, _ in self._open:
+            self.text[field].append(data)
+
+
+def _clean_text(parts):
+    """Collapse whitespace like a browser's innerText would."""
+    if parts is None:
+        return None
+    lines = [re.sub(r"[ \t\r\f\v]+", " ", line).strip() for line in "".join(parts).split("\n")]
+    text = re.sub(r"\n{3,}", "\n\n", "\n".join(lines)).strip()
+    return text or None
+
+
+def parse_job_posting(page, linkedin_job_id, base_url=LINKEDIN_BASE_URL):
+    """Parse a job posting page into the dict shape BrowserManager.extract_job_details returns."""
+    parser = _JobPostingParser(SELECTORS["job_posting"])
+    parser.feed(page)
+    parser.close()
+
+    def absolute(url):
+        return urljoin(base_url + "/", html.unescape(url)) if url else None
+
+    return {
+        "company_name": _clean_text(parser.text.get("company_name")),
+        "company_url": absolute(parser.href.get("company_name")),
+        "job_title": _clean_text(parser.text.get("job_title")),
+        "job_url": absolute(parser.href.get("job_url")),
+        "job_description": _clean_text(parser.text.get("job_description")),
+        "linkedin_job_id": str(linkedin_job_id)
+    }
+
+
+class JobDetailFetcher:
+    """Fetches job details by LinkedIn job id over a pooled HTTP client.
+
+    Reuses the logged-in browser session's cookies, so no clicking, scrolling or
+    detail-pane rendering is involved, and several jobs can be fetched at once.
+    """
+
+    def __init__(self, cookies=None, user_agent=None, base_url=LINKEDIN_BASE_URL,
+                 workers=JOB_FETCH_WORKERS, timeout=JOB_FETCH_TIMEOUT, metrics=None):
+        self.base_url = base_url
+        self.workers = workers
+        self.metrics = metrics
+        headers = {"Accept": "text/html,application/xhtml+xml"}
+        if user_agent:
+            headers["User-Agent"] = user_agent
+        self.client = httpx.Client(
+            base_url=base_url,
+            cookies=cookies or {},
+            headers=headers,
+            timeout=timeout,
+            follow_redirects=True,
+            limits=httpx.Limits(max_connections=workers, max_keepalive_connections=workers)
+        )
+
+    @classmethod
+    def from_driver(cls, driver, **kwargs):
+        """Create a fetcher that shares the Selenium session's cookies and user agent."""
+        cookies = {cookie["name"]: cookie["value"] for cookie in driver.get_cookies()}
+        user_agent = driver.execute_script("return navigator.userAgent;")
+        return cls(cookies=cookies, user_agent=user_agent, **kwargs)
+
+    def _span(self, stage):
+        return self.metrics.span(stage) if self.metrics else nullcontext()
+
+    def fetch(self, linkedin_job_id):
+        """Fetch and parse one job's details.
+
+        Raises:
+            JobFetchError: On HTTP errors or when the page has no job description.
+        """
+        try:
+            with self._span("fetch_request"):
+                response = self.client.get(JOB_POSTING_PATH.format(job_id=linkedin_job_id))
+                response.raise_for_status()
+        except httpx.HTTPError as e:
+            raise JobFetchError(f"Failed to fetch job {linkedin_job_id}: {str(e)}")
+
+        with self._span("extract"):
+            details = parse_job_posting(response.text, linkedin_job_id, self.base_url)
+        if not details["job_description"]:
+            raise JobFetchError(f"No job description in the page for job {linkedin_job_id}")
+        return details
+
+    def fetch_many(self, linkedin_job_ids):
+        """Fetch several jobs concurrently, yielding (job id, details or JobFetchError) as they finish."""
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            futures = {executor.submit(self.fetch, job_id): job_id for job_id in linkedin_job_ids}
+            for future in as_completed(futures):
+                try:
+                    yield futures[future], future.result()
+                except JobFetchError as e:
+                    yield futures[future], e
+
+    def close(self):
+        self.client.close()
@@ -1,32 +1,72 @@
 import os
-import json
-import time
+import asyncio
 from datetime import datetime
+from config.config import DATA_DIR, SCORING_CONCURRENCY, JOB_STORE_FSYNC, PREFILTER_ENABLED
 from .ai_matcher import JobMatcher
+from .job_store import JobStore, read_jobs, latest_jobs_file, scored_jobs_file
+from .batch_scorer import BatchScorer
+from .prefilter import RelevancePrefilter
+from .usage import BudgetExceededError
 
 class JobScorer:
-    def __init__(self):
+    def __init__(self, data_dir=DATA_DIR):
         self.job_matcher = JobMatcher()
+        self.data_dir = data_dir
         self.scored_jobs = {}
     
     def _get_latest_jobs_file(self):
-        """Get the most recent jobs file."""
-        job_files = [f for f in os.listdir('.') if f.startswith('job_descriptions_') and f.endswith('.json')]
-        if not job_files:
-            return None
-        return max(job_files)  # This works because of the timestamp format YYYYMMDD_HHMMSS
+        """Get the most recent raw jobs file (JSON Lines store or legacy JSON)."""
+        return latest_jobs_file(self.data_dir)
     
     def _get_scored_filename(self, jobs_file):
-        """Generate scored filename based on jobs file."""
-        # Extract timestamp from jobs file
-        timestamp = jobs_file.replace('job_descriptions_', '').replace('.json', '')
-        return f"job_descriptions_scored_{timestamp}.json"
+        """Generate the scored store filename based on jobs file."""
+        return scored_jobs_file(jobs_file)
     
-    def process_new_jobs(self, jobs_file=None):
+    def _get_batch_state_filename(self, jobs_file):
+        """Generate the Batch API state filename based on jobs file."""
+        directory, filename = os.path.split(jobs_file)
+        timestamp = os.path.splitext(filename)[0].replace('job_descriptions_', '')
+        return os.path.join(directory, f"batch_state_{timestamp}.json")
+
+    def _apply_prefilter(self, pending, scored_store):
+        """Score all pending jobs with the local pre-filter in one pass and, with PREFILTER_SKIP, drop the mismatches.
+
+        Skipped jobs are recorded in the scored store with their prefilter_score.
+        Returns the jobs that should still go to the LLM.
+        """
+        prefilter = RelevancePrefilter(
+            self.job_matcher._load_resume_text(),
+            skills=self.job_matcher.candidate_profile()["skills"]
+        )
+        scores, passed = prefilter.check_batch(job['job_description'] for job in pending.values())
+
+        remaining = {}
+        for (job_id, job_data), score, keep in zip(pending.items(), scores, passed):
+            job_data = {**job_data, 'prefilter_score': round(float(score), 4)}
+            if keep:
+                remaining[job_id] = job_data
+                continue
+            scored_job = {
+                **job_data,
+                'cluster_id': self.job_matcher.cluster_id(job_data['job_description']),
+                'match_score': None,
+                'skipped_by_prefilter': True,
+                'scored_at': datetime.now().isoformat()
+            }
+            self.scored_jobs[job_id] = scored_job
+            scored_store.append(job_id, scored_job)
+
+        print(prefilter.summary())
+        return remaining
+
+    def process_new_jobs(self, jobs_file=None, concurrency=None, batch=False):
         """Process new jobs from the jobs file and update scored jobs.
         
         Args:
             jobs_file (str, optional): Specific jobs file to process. If None, uses most recent.
+            concurrency (int, optional): Max concurrent scoring requests. Defaults to SCORING_CONCURRENCY.
+            batch (bool, optional): Score through the OpenAI Batch API instead of live requests.
+                Half the cost, but results can take up to the batch completion window.
         """
         # If no specific file provided, use the most recent one
         if jobs_file is None:
@@ -38,41 +78,75 @@ class JobScorer:
         print(f"\nProcessing jobs from: {jobs_file}")
         
         try:
-            with open(jobs_file, 'r') as f:
-                jobs = json.load(f)
+            jobs = read_jobs(jobs_file)
         except FileNotFoundError:
             print(f"No jobs file found at {jobs_file}")
             return
         
-        # Create new scored jobs file
+        # Open the scored store; jobs already in it (e.g. from a crashed run) are skipped
         scored_file = self._get_scored_filename(jobs_file)
+        scored_store = JobStore(scored_file, fsync=JOB_STORE_FSYNC)
+        self.scored_jobs = scored_store.load()
+        pending = {job_id: job_data for job_id, job_data in jobs.items() if job_id not in self.scored_jobs}
         print(f"Scored jobs will be saved to: {scored_file}")
+        if len(pending) < len(jobs):
+            print(f"Skipping {len(jobs) - len(pending)} jobs that are already scored")
+
+        if PREFILTER_ENABLED and pending:
+            pending = self._apply_prefilter(pending, scored_store)
         
-        for job_id, job_data in jobs.items():
-            print(f"\nScoring job: {job_data['job_title']} at {job_data['company_name']}")
-            try:
-                # Get match score
-                match_score = self.job_matcher.get_match_score(job_data['job_description'])
-                
-                # Add score and timestamp to job data
-                scored_job = {
-                    **job_data,
-                    'match_score': match_score,
-                    'scored_at': datetime.now().isoformat()
-                }
-                
-                # Update scored jobs
-                self.scored_jobs[job_id] = scored_job
-                
-                # Save after each successful scoring
-                with open(scored_file, 'w') as f:
-                    json.dump(self.scored_jobs, f, indent=2)
-                
-                print(f"Score: {match_score}/10")
-                time.sleep(1)  # Rate limiting
-                
-            except Exception as e:
-                print(f"Error scoring job {job_id}: {str(e)}")
-                continue
-        
-        print(f"\nFinished scoring jobs. Results saved to {scored_file}") 
\ No newline at end of file
+        over_budget = []
+
+        def save_result(job_id, result):
+            job_data = pending[job_id]
+            if isinstance(result, BudgetExceededError):
+                over_budget.append(job_id)
+                if len(over_budget) == 1:
+                    print(f"{str(result)}; the remaining jobs are left unscored")
+                return
+            if isinstance(result, Exception):
+                print(f"Error scoring job {job_id}: {str(result)}")
+                return
+
+            # Add score and timestamp to job data
+            scored_job = {
+                **job_data,
+                'cluster_id': self.job_matcher.cluster_id(job_data['job_description']),
+                'match_score': result,
+                'scored_at': datetime.now().isoformat()
+            }
+            self.scored_jobs[job_id] = scored_job
+
+            # Append after each successful scoring
+            scored_store.append(job_id, scored_job)
+
+            print(f"Scored {job_data['job_title']} at {job_data['company_name']}: {result}/10")
+
+        try:
+            if batch:
+                print(f"Scoring {len(pending)} jobs through the Batch API")
+                batch_scorer = BatchScorer(self.job_matcher, self._get_batch_state_filename(jobs_file))
+                batch_scorer.score(pending, on_result=save_result)
+            else:
+                # Score concurrently; the matcher's rate limiter replaces the old fixed sleep
+                print(f"Scoring {len(pending)} jobs with up to {concurrency or SCORING_CONCURRENCY} concurrent requests")
+                asyncio.run(self.job_matcher.score_many(
+                    {job_id: job_data['job_description'] for job_id, job_data in pending.items()},
+                    concurrency=concurrency,
+                    on_result=save_result
+                ))
+        finally:
+            scored_store.close()
+
+        cache_stats = self.job_matcher.cache_stats()
+        if cache_stats:
+            print(f"Score cache: {cache_stats['hits']} hits, {cache_stats['misses']} misses ({cache_stats['hits']} API calls avoided)")
+        near_duplicate_stats = self.job_matcher.near_duplicate_stats()
+        if near_duplicate_stats:
+            print(f"Near-duplicates: {near_duplicate_stats['clustered']} of {near_duplicate_stats['checked']} "
+                  f"new descriptions matched an earlier posting")
+        for line in self.job_matcher.usage.summary_lines():
+            print(line)
+        if over_budget:
+            print(f"{len(over_budget)} jobs left unscored; raise OPENAI_BUDGET_USD and run the scorer again to finish them")
+        print(f"\nFinished scoring jobs. Results saved to {scored_file}")
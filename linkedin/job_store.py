@@ -0,0 +1,139 @@
+import os
+import json
+import argparse
+import threading
+
+from config.config import DATA_DIR
+
+
+class JobStore:
+    """Append-only JSON Lines store with one `{"job_id": ..., **job_data}` record per line.
+
+    Each job costs a single small append instead of rewriting the whole file, and a
+    crash can at worst lose the line being written. When a job is appended more than
+    once, the last record wins.
+    """
+
+    def __init__(self, path, fsync=False):
+        self.path = path
+        self.fsync = fsync
+        self._lock = threading.Lock()
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._file = open(path, 'a+', encoding='utf-8')
+        self._repair_torn_tail()
+
+    def _repair_torn_tail(self):
+        """Start on a fresh line if a previous process died halfway through a write."""
+        self._file.seek(0, os.SEEK_END)
+        if self._file.tell() == 0:
+            return
+        with open(self.path, 'rb') as f:
+            f.seek(-1, os.SEEK_END)
+            if f.read(1) != b'\n':
+                self._file.write('\n')
+                self._file.flush()
+
+    def append(self, job_id, job_data):
+        """Append one job record and flush it to disk."""
+        line = json.dumps({"job_id": job_id, **job_data}, ensure_ascii=False)
+        with self._lock:
+            self._file.write(line + '\n')
+            self._file.flush()
+            if self.fsync:
+                os.fsync(self._file.fileno())
+
+    def load(self):
+        """Return all records as {job_id: job_data}."""
+        with self._lock:
+            self._file.flush()
+        return read_jobs(self.path)
+
+    def close(self):
+        with self._lock:
+            if not self._file.closed:
+                self._file.close()
+
+
+def read_jobs(path):
+    """Read a jobs file into {job_id: job_data}.
+
+    Accepts both JSON Lines stores and the legacy pretty-printed JSON files.
+    Unparseable lines (e.g. a write torn by a crash) are skipped.
+    """
+    if path.endswith('.json'):
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    jobs = {}
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            job_id = record.pop("job_id", None)
+            if job_id is not None:
+                jobs[job_id] = record
+    return jobs
+
+
+def latest_jobs_file(data_dir=DATA_DIR):
+    """Return the most recent raw jobs file (JSON Lines store or legacy JSON), or None."""
+    if not os.path.isdir(data_dir):
+        return None
+    job_files = [
+        f for f in os.listdir(data_dir)
+        if f.startswith('job_descriptions_')
+        and not f.startswith('job_descriptions_scored_')
+        and f.endswith(('.json', '.jsonl'))
+    ]
+    if not job_files:
+        return None
+    # This works because of the timestamp format YYYYMMDD_HHMMSS
+    latest = max(job_files, key=lambda f: os.path.splitext(f)[0])
+    return os.path.join(data_dir, latest)
+
+
+def scored_jobs_file(jobs_file):
+    """Path of the scored store that belongs to a raw jobs file."""
+    directory, filename = os.path.split(jobs_file)
+    timestamp = os.path.splitext(filename)[0].replace('job_descriptions_', '')
+    return os.path.join(directory, f"job_descriptions_scored_{timestamp}.jsonl")
+
+
+def export_json(store_path, output_path=None):
+    """Export a JSON Lines store to the legacy {job_id: job_data} JSON file.
+
+    Returns the path written to.
+    """
+    if output_path is None:
+        output_path = os.path.splitext(store_path)[0] + '.json'
+    jobs = read_jobs(store_path)
+    tmp_path = output_path + '.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(jobs, f, indent=2)
+    os.replace(tmp_path, output_path)
+    return output_path
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Job store utilities")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    export_parser = subparsers.add_parser("export", help="Export a .jsonl job store to the legacy JSON format")
+    export_parser.add_argument("store", help="Path to a job_descriptions_*.jsonl file")
+    export_parser.add_argument("-o", "--output", help="Output JSON path (defaults to the store path with .json)")
+    args = parser.parse_args()
+
+    if args.command == "export":
+        output_path = export_json(args.store, args.output)
+        print(f"Exported {args.store} to {output_path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,3 +1,4 @@
+import copy
 import json
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
@@ -8,23 +9,66 @@ from selenium.common.exceptions import (
     StaleElementReferenceException
 )
 from selenium.webdriver.support.ui import WebDriverWait
+import glob
 import hashlib
+import threading
 import time
+from contextlib import nullcontext
 from datetime import datetime
 import os
 from typing import Optional, Dict, Any
+from urllib.parse import urlencode, urlsplit, parse_qs
 
 from config.config import (
+    DATA_DIR,
+    LINKEDIN_BASE_URL,
     LINKEDIN_LOGIN_URL,
     LINKEDIN_JOBS_URL,
+    LINKEDIN_FEED_URL,
+    LINKEDIN_JOB_SEARCH_URL,
+    JOB_VIEW_PATH,
     LINKEDIN_EMAIL,
     LINKEDIN_PASSWORD,
     SELECTORS,
-    LOGIN_TIMEOUT
+    LOGIN_TIMEOUT,
+    SEARCH_MODE,
+    DATE_POSTED_URL_PARAMS,
+    INCREMENTAL_MODE,
+    INCREMENTAL_SEEN_THRESHOLD,
+    SESSION_PROBE_TIMEOUT,
+    SESSION_REUSE,
+    SESSION_COOKIES_PATH,
+    CHROME_PROFILE_DIR,
+    PIPELINE_SCORING,
+    SCORING_WORKERS,
+    SCORING_QUEUE_SIZE,
+    SCORING_BATCH_SIZE,
+    JOB_STORE_FSYNC,
+    PREFILTER_ENABLED,
+    PREFILTER_HISTORY_FILES,
+    SEEN_JOBS_ENABLED,
+    SEEN_JOBS_PATH,
+    SEEN_JOB_TTL_DAYS,
+    JOB_FETCH_MODE,
+    JOB_FETCH_WORKERS,
+    BROWSER_POOL_SIZE,
+    BROWSER_PAGE_RETRIES,
+    RESULTS_PAGE_SIZE,
+    METRICS_ENABLED
 )
 from config.logging_config import log_manager
-from .browser_manager import BrowserManager
+from .browser_manager import BrowserManager, StaleDetailPaneError
 from .ai_matcher import JobMatcher
+from .scoring_pipeline import ScoringPipeline
+from .job_store import JobStore
+from .prefilter import RelevancePrefilter
+from .seen_jobs import SeenJobIndex, linkedin_job_id_from_url
+from .job_fetcher import JobDetailFetcher, JobFetchError
+from .browser_pool import BrowserPool, PageScheduler, results_page_url
+from .search_scheduler import SearchScheduler, build_search_tasks
+from .checkpoint import RunCheckpoint
+from .metrics import RunMetrics
+from .usage import BudgetExceededError
 
 class LinkedInBotError(Exception):
     """Base exception class for LinkedInBot errors"""
@@ -38,13 +82,16 @@ class LinkedInBot:
         self.driver = None
         self.settings = self._load_settings()
         self.job_matcher = JobMatcher()
+        self.seen_jobs = SeenJobIndex(SEEN_JOBS_PATH) if SEEN_JOBS_ENABLED else None
+        self._metrics = None
+        self._incremental = False  # Set for each run by process_job_listings
         # Use the timestamp from log manager
         self.run_timestamp = log_manager.timestamp
 
     def _setup_directories(self):
         """Create necessary directories for logs and data"""
         # Create data directory for job descriptions and scores
-        os.makedirs('data', exist_ok=True)
+        os.makedirs(DATA_DIR, exist_ok=True)
 
     def _load_settings(self) -> Dict[str, Any]:
         """Load settings from Settings.json file."""
@@ -139,15 +186,55 @@ class LinkedInBot:
             self.logger.exception("Unexpected error during login")
             return False
 
-    def _apply_date_filter(self):
-        """Apply the date posted filter based on settings."""
+    def _session_is_valid(self) -> bool:
+        """Check with a single feed load whether the browser is already logged in."""
+        try:
+            self.driver.get(LINKEDIN_FEED_URL)
+            # LinkedIn redirects signed-out visitors to the login page or auth wall
+            if any(marker in self.driver.current_url for marker in ("/login", "/authwall", "/checkpoint", "/uas/")):
+                return False
+            return bool(self.browser.wait_for_element(
+                (By.XPATH, SELECTORS["login"]["feed_button"]),
+                SESSION_PROBE_TIMEOUT
+            ))
+        except WebDriverException as e:
+            self.logger.warning(f"Could not check saved session: {str(e)}")
+            return False
+
+    def ensure_logged_in(self) -> bool:
+        """Reuse a saved session if it is still valid, otherwise log in and save the new one.
+
+        The session comes from the persistent Chrome profile (CHROME_PROFILE_DIR) or the
+        cookie jar at SESSION_COOKIES_PATH.
+        """
+        if not SESSION_REUSE:
+            return self.login()
+
+        started = time.monotonic()
+        # Without a profile or any saved cookies there is no session to probe for
+        has_session = bool(CHROME_PROFILE_DIR) or self.browser.load_cookies(SESSION_COOKIES_PATH) > 0
+        if has_session and self._session_is_valid():
+            self.logger.info(f"Reused saved LinkedIn session in {time.monotonic() - started:.1f}s")
+            return True
+
+        self.logger.info("No valid saved session; logging in with credentials")
+        if not self.login():
+            return False
+        try:
+            self.browser.save_cookies(SESSION_COOKIES_PATH)
+        except (OSError, WebDriverException) as e:
+            self.logger.warning(f"Could not save session cookies: {str(e)}")
+        return True
+
+    def _apply_date_filter(self, date_filter=None):
+        """Apply the date posted filter (defaults to the one in settings)."""
         try:
             # Step 1: Open the date filter dropdown
             if not self._open_date_filter_dropdown():
                 raise Exception("Failed to open date filter dropdown")
 
             # Step 2: Select the date filter option
-            if not self._select_date_filter_option():
+            if not self._select_date_filter_option(date_filter):
                 raise Exception("Failed to select date filter option")
 
             # Step 3: Apply the filter
@@ -180,9 +267,9 @@ class LinkedInBot:
         print("[Date Filter] ✅ Dropdown opened")
         return True
 
-    def _select_date_filter_option(self):
+    def _select_date_filter_option(self, date_filter=None):
         """Select the date filter option from the dropdown."""
-        date_filter = self.settings.get("date_posted_filter", "any_time")
+        date_filter = date_filter or self.settings.get("date_posted_filter", "any_time")
         print(f"\n[Date Filter] Selecting option: {date_filter}")
         
         # Find the radio input
@@ -227,15 +314,80 @@ class LinkedInBot:
         print("[Date Filter] ✅ Filter applied")
         return True
 
-    def search_jobs(self, job_title: Optional[str] = None, location: Optional[str] = None) -> bool:
-        """Search for jobs with given criteria."""
+    def _build_search_url(self, keywords, location, date_posted=None, start=0, newest_first=False):
+        """Build a jobs search URL for the keywords, location, posted-date range and page offset."""
+        params = {"keywords": keywords, "location": location}
+        if newest_first:
+            params["sortBy"] = "DD"
+        time_range = DATE_POSTED_URL_PARAMS.get(date_posted or "any_time")
+        if time_range is None:
+            self.logger.warning(f"Invalid date filter option: {date_posted}; searching any time")
+        elif time_range:
+            params["f_TPR"] = time_range
+        if start:
+            params["start"] = start
+        return f"{LINKEDIN_JOB_SEARCH_URL}?{urlencode(params)}"
+
+    def search_jobs(self, job_title: Optional[str] = None, location: Optional[str] = None,
+                    start: int = 0, search_mode: Optional[str] = None, date_posted: Optional[str] = None) -> bool:
+        """Search for jobs with given criteria.
+
+        Args:
+            start: Offset of the first result (page N starts at (N - 1) * 25); URL mode only.
+            search_mode: "url" or "ui"; defaults to SEARCH_MODE from config.
+            date_posted: A DATE_POSTED_URL_PARAMS key; defaults to date_posted_filter in settings.
+        """
+        date_posted = date_posted or self.settings.get("date_posted_filter")
+        # Use provided job title or combine keywords from settings
+        search_query = job_title if job_title else self._format_search_query(self.settings["job_keywords"])
+        # Use provided location or first location from settings
+        location_to_use = location if location else self.settings["locations"][0] if self.settings["locations"] else "Worldwide"
+        self.logger.info(f"Using location: {location_to_use}")
+
+        if (search_mode or SEARCH_MODE) == "url":
+            found = self._search_by_url(search_query, location_to_use, date_posted, start)
+            if found is not None:
+                return found
+            if start:
+                # The search form always starts at page 1; leave this search for a retry instead
+                self.logger.error(f"Search URL did not load; not falling back to the search form at offset {start}")
+                return False
+            self.logger.warning("Search URL did not load; falling back to the search form")
+        return self._search_by_ui(search_query, location_to_use, date_posted)
+
+    def _search_by_url(self, search_query, location, date_posted=None, start=0) -> Optional[bool]:
+        """Open the search results directly from a built URL, with no typing or filter clicks.
+
+        Returns:
+            True when job cards are showing, False when the results page loaded but has
+            no results, and None when the page did not load.
+        """
+        try:
+            url = self._build_search_url(search_query, location, date_posted, start, newest_first=self._incremental)
+            self.logger.info(f"Opening search URL: {url}")
+            with self._span("page_load"):
+                self.driver.get(url)
+                job_cards = self.browser.wait_for_element(
+                    (By.XPATH, SELECTORS["jobs"]["job_cards"])
+                )
+            if job_cards:
+                self.logger.info("Successfully found job listings")
+                return True
+            if any(self.driver.find_elements(By.XPATH, SELECTORS["jobs"][name]) for name in ("no_results", "results_count")):
+                self.logger.info("The search has no results")
+                return False
+            return None
+
+        except WebDriverException as e:
+            self.logger.error(f"Browser error during URL search: {str(e)}")
+            return None
+
+    def _search_by_ui(self, search_query, location_to_use, date_posted=None) -> bool:
+        """Search by typing into the jobs page search form and applying the date filter."""
         try:
             # Navigate to jobs page
             self.driver.get(LINKEDIN_JOBS_URL)
             
-            # Use provided job title or combine keywords from settings
-            search_query = job_title if job_title else self._format_search_query(self.settings["job_keywords"])
-            
             # Wait for and fill in job title
             search_input = self.browser.wait_for_element(
                 (By.XPATH, SELECTORS["jobs"]["search_input"])
@@ -247,10 +399,6 @@ class LinkedInBot:
             search_input.clear()
             search_input.send_keys(search_query)
             
-            # Use provided location or first location from settings
-            location_to_use = location if location else self.settings["locations"][0] if self.settings["locations"] else "Worldwide"
-            self.logger.info(f"Using location: {location_to_use}")
-            
             # Wait for and fill in location
             location_input = self.browser.wait_for_element(
                 (By.XPATH, SELECTORS["jobs"]["location_input"])
@@ -266,9 +414,9 @@ class LinkedInBot:
             location_input.send_keys(Keys.RETURN)
             
             # Apply date filter if specified
-            if "date_posted_filter" in self.settings:
+            if date_posted:
                 try:
-                    if not self._apply_date_filter():
+                    if not self._apply_date_filter(date_posted):
                         self.logger.warning("Failed to apply date filter, continuing with unfiltered results")
                 except Exception as e:
                     self.logger.error(f"Error during date filter application: {str(e)}")
@@ -307,26 +455,68 @@ class LinkedInBot:
             self.logger.error(f"Error while closing browser: {str(e)}")
 
     def _load_all_job_cards(self):
-        """Scroll through the jobs container to load all available job cards."""
+        """Load all available job cards on the current page.
+
+        Returns:
+            list: LinkedIn job ids of the loaded cards in page order (None where unknown),
+                or an empty list if the ids could not be collected.
+        """
         self.logger.info("Loading all job cards...")
         
-        # 1) Wait for the scroll sentinel to appear
+        # Wait for the scroll sentinel to appear
         scroll_sentinel = self.browser.wait_for_element(
             (By.XPATH, SELECTORS["jobs"]["scroll_sentinel"])
         )
         if not scroll_sentinel:
             self.logger.error("Could not find scroll sentinel")
-            return
-            
-        # 2) Find the container (parent of the sentinel)
+            return []
+
+        # Scroll and watch the list in-page; one round trip instead of a polling loop
+        try:
+            result = self.browser.load_all_job_cards(
+                SELECTORS["jobs"]["scroll_sentinel"],
+                SELECTORS["jobs"]["job_cards"]
+            )
+        except WebDriverException as e:
+            result = {"error": str(e)}
+
+        if result.get("error"):
+            self.logger.warning(f"In-page card loader failed ({result['error']}); falling back to scroll polling")
+            card_count = self._scroll_load_job_cards(scroll_sentinel)
+            job_ids = []
+        else:
+            if result["timed_out"]:
+                self.logger.warning("Card loading timed out; continuing with the cards loaded so far")
+            card_count = result["count"]
+            job_ids = result["job_ids"]
+
+        # Pagination check (still expect 25 on non-last pages)
+        has_next = self._has_next_page()
+        
+        if has_next and card_count != 25:
+            self.logger.warning(f"Expected 25 cards on a page with next button, but found {card_count} cards")
+        elif not has_next:
+            self.logger.info(f"Last page contains {card_count} cards")
+        else:
+            self.logger.info(f"Verified: Found expected 25 cards on page")
+
+        self.logger.info(f"Final number of job cards after scrolling: {card_count}")
+        return job_ids
+
+    def _scroll_load_job_cards(self, scroll_sentinel):
+        """Scroll through the jobs container step by step to load all available job cards.
+
+        Fallback for when the in-page loader script cannot run. Returns the card count.
+        """
+        # 1) Find the container (parent of the sentinel)
         jobs_container = scroll_sentinel.find_element(By.XPATH, "./..")
         if not jobs_container:
             self.logger.error("Could not find jobs container")
-            return
+            return 0
             
         self.logger.info("Found jobs container, starting to scroll...")
         
-        # 3) Count how many cards are currently in that container
+        # 2) Count how many cards are currently in that container
         last_card_count = len(
             jobs_container.find_elements(By.XPATH, SELECTORS["jobs"]["job_cards"])
         )
@@ -338,14 +528,14 @@ class LinkedInBot:
         while scroll_attempt < max_scroll_attempts:
             scroll_attempt += 1
             
-            # 4) Measure viewport height and choose an overlap (20%)
+            # 3) Measure viewport height and choose an overlap (20%)
             viewport_height = int(self.driver.execute_script(
                 "return Math.round(arguments[0].clientHeight);", jobs_container
             ))
             overlap = int(viewport_height * 0.20)
             scroll_amount = viewport_height - overlap
 
-            # 5) Find current scroll and container height
+            # 4) Find current scroll and container height
             current_scroll = int(self.driver.execute_script(
                 "return Math.round(arguments[0].scrollTop);", jobs_container
             ))
@@ -353,14 +543,14 @@ class LinkedInBot:
                 "return Math.round(arguments[0].scrollHeight);", jobs_container
             ))
 
-            # 6) Compute next scroll target (don't exceed bottom)
+            # 5) Compute next scroll target (don't exceed bottom)
             target_scroll = min(current_scroll + scroll_amount, container_height)
             self.driver.execute_script(
                 "arguments[0].scrollTo(0, arguments[1]);", 
                 jobs_container, target_scroll
             )
 
-            # 7) Wait up to 2 s for at least one new card, then wait for another 2 for rest of them to load
+            # 6) Wait up to 2 s for at least one new card, then wait for another 2 for rest of them to load
             try:
                 WebDriverWait(self.driver, 2).until(
                     lambda drv: len(
@@ -384,7 +574,7 @@ class LinkedInBot:
                 continue  # Go to the next scroll iteration
 
             except TimeoutException:
-                # 8) If no card appeared in 2 s, check if we're truly at the bottom
+                # 7) If no card appeared in 2 s, check if we're truly at the bottom
                 new_scroll = int(self.driver.execute_script(
                     "return Math.round(arguments[0].scrollTop);", jobs_container
                 ))
@@ -400,37 +590,34 @@ class LinkedInBot:
                 # Otherwise, we're not at the bottom yet—loop again to scroll further
                 continue
 
-        # 9) Pagination check (still expect 25 on non‐last pages)
-        has_next = self._has_next_page()
-        
-        if has_next and last_card_count != 25:
-            self.logger.warning(f"Expected 25 cards on a page with next button, but found {last_card_count} cards")
-        elif not has_next:
-            self.logger.info(f"Last page contains {last_card_count} cards")
-        else:
-            self.logger.info(f"Verified: Found expected 25 cards on page")
-            
-        # 10) Scroll back to top for cleanliness
+        # 8) Scroll back to top for cleanliness
         self.driver.execute_script("arguments[0].scrollTo(0, 0);", jobs_container)
         time.sleep(1)
         
-        final_cards = len(
+        return len(
             jobs_container.find_elements(By.XPATH, SELECTORS["jobs"]["job_cards"])
         )
-        self.logger.info(f"Final number of job cards after scrolling: {final_cards}")
 
     def _get_job_cards_on_current_page(self):
-        """Get all job cards on the current page."""
-        # First load all job cards by scrolling
-        self._load_all_job_cards()
-        
-        # Then find all job cards
-        job_cards = self.driver.find_elements(
-            By.XPATH, SELECTORS["jobs"]["job_cards"]
-        )
+        """Get all job cards on the current page.
+
+        Returns:
+            list: (card element, LinkedIn job id or None) pairs in page order.
+        """
+        with self._span("load_cards"):
+            # First load all job cards by scrolling
+            job_ids = self._load_all_job_cards()
+
+            # Then find all job cards
+            job_cards = self.driver.find_elements(
+                By.XPATH, SELECTORS["jobs"]["job_cards"]
+            )
         
         print(f"Found {len(job_cards)} job cards on current page")
-        return job_cards if job_cards else []
+        if len(job_ids) != len(job_cards):
+            # The page changed after loading; read the ids card by card instead
+            job_ids = [self.browser.get_card_job_id(card) for card in job_cards]
+        return list(zip(job_cards, job_ids))
 
     def _has_next_page(self) -> bool:
         """Check if there is a next page of results."""
@@ -454,9 +641,10 @@ class LinkedInBot:
             (By.XPATH, SELECTORS["jobs"]["next_page_button"])
         )
         if next_button:
-            self.browser.ensure_element_in_viewport(next_button)
-            next_button.click()
-            time.sleep(2)  # Wait for page to load
+            with self._span("pagination"):
+                self.browser.ensure_element_in_viewport(next_button)
+                next_button.click()
+                time.sleep(2)  # Wait for page to load
             return True
         return False
 
@@ -523,136 +711,732 @@ class LinkedInBot:
             print(f"Error getting total job count: {str(e)}")
             return None
 
-    def process_job_listings(self) -> bool:
-        """Process all job listings and score them in real-time."""
+    def _extract_job_details(self):
+        """Extract all fields of the open job in one script call, falling back to per-field waits."""
         try:
-            # Initialize tracking variables
-            job_descriptions = {}
-            scored_jobs = {}
-            total_jobs = self._get_total_job_count()
-            processed_count = 0
-            failed_count = 0
+            with self._span("extract"):
+                return self.browser.extract_job_details(SELECTORS["jobs"])
+        except WebDriverException as e:
+            self.logger.warning(f"Batched extraction failed, extracting fields one by one: {str(e)}")
+
+        with self._span("extract_company"):
+            company_info = self._extract_company_info() or {}
+        with self._span("extract_title"):
+            job_info = self._extract_job_url_and_title() or {}
+        with self._span("extract_description"):
+            job_description = self._extract_job_description()
+        return {
+            "company_name": company_info.get("name"),
+            "company_url": company_info.get("url"),
+            "job_title": job_info.get("title"),
+            "job_url": job_info.get("url"),
+            "job_description": job_description,
+            "linkedin_job_id": linkedin_job_id_from_url(job_info.get("url"))
+        }
+
+    def _build_job_record(self, details, linkedin_job_id=None):
+        """Turn extracted job details into (job_id, job_data), or None if required fields are missing."""
+        if not details or not all(details.get(key) for key in ("company_name", "job_title", "job_description")):
+            return None
+
+        # Generate unique job ID
+        job_id = self._generate_job_id(
+            details["company_name"],
+            details["company_url"],
+            details["job_title"],
+            details["job_url"],
+            details["job_description"]
+        )
+
+        job_data = {
+            "company_name": details["company_name"],
+            "company_url": details["company_url"],
+            "job_title": details["job_title"],
+            "job_url": details["job_url"],
+            "linkedin_job_id": linkedin_job_id or details.get("linkedin_job_id"),
+            "job_description": details["job_description"],
+            "scraped_at": datetime.now().isoformat()
+        }
+        return job_id, job_data
+
+    def _scrape_job_card(self, card, linkedin_job_id=None):
+        """Click a job card and extract its details. Returns (job_id, job_data) or None."""
+        # Click the job card to load details
+        with self._span("viewport_scroll"):
+            self.browser.ensure_element_in_viewport(card)
+        with self._span("click"):
+            card.click()
+        if linkedin_job_id:
+            # Return as soon as the detail pane shows this card; raises StaleDetailPaneError
+            with self._span("detail_wait"):
+                details = self.browser.wait_for_job_detail(linkedin_job_id, SELECTORS["jobs"])
+        else:
+            with self._span("detail_wait"):
+                time.sleep(2)  # No job id to wait on; give job details time to load
+            details = self._extract_job_details()
+
+        return self._build_job_record(details, linkedin_job_id)
+
+    def _mark_seen(self, job_id, job_data):
+        """Add a job to the seen-job index once its outcome is persisted.
+
+        Jobs that were recorded but never scored (failures, a Ctrl-C, the budget)
+        stay out of it, so a later run picks them up again.
+        """
+        if self.seen_jobs and job_data.get('linkedin_job_id'):
+            self.seen_jobs.mark_seen(job_data['linkedin_job_id'], job_id)
+
+    def _save_scored_job(self, job_id, job_data, match_score):
+        """Append a scored job to the scored jobs store."""
+        with self._span("json_write"):
+            self._scored_store.append(job_id, {
+                **job_data,
+                'match_score': match_score,
+                'scored_at': datetime.now().isoformat()
+            })
+        self._mark_seen(job_id, job_data)
+
+    def _create_prefilter(self):
+        """Build the relevance pre-filter, seeded with descriptions from recent runs."""
+        if not PREFILTER_ENABLED:
+            return None
+        prefilter = RelevancePrefilter(
+            self.job_matcher._load_resume_text(),
+            skills=self.job_matcher.candidate_profile()["skills"]
+        )
+        history = sorted(glob.glob(os.path.join(DATA_DIR, 'job_descriptions_[0-9]*')))[-PREFILTER_HISTORY_FILES:]
+        prefilter.fit_files(history)
+        return prefilter
+
+    def _save_prefiltered_job(self, job_id, job_data):
+        """Record a job the pre-filter kept away from the LLM."""
+        self._scored_store.append(job_id, {
+            **job_data,
+            'match_score': None,
+            'skipped_by_prefilter': True,
+            'scored_at': datetime.now().isoformat()
+        })
+        self._mark_seen(job_id, job_data)
+
+    def _log_cache_stats(self):
+        """Log how many API calls the score cache avoided this run, and what the others cost."""
+        cache_stats = self.job_matcher.cache_stats()
+        if cache_stats:
+            self.logger.info(
+                f"Score cache: {cache_stats['hits']} hits, {cache_stats['misses']} misses "
+                f"({cache_stats['hits']} API calls avoided)"
+            )
+        near_duplicate_stats = self.job_matcher.near_duplicate_stats()
+        if near_duplicate_stats:
+            self.logger.info(
+                f"Near-duplicates: {near_duplicate_stats['clustered']} of {near_duplicate_stats['checked']} "
+                f"new descriptions matched an earlier posting"
+            )
+        for line in self.job_matcher.usage.summary_lines():
+            self.logger.info(line)
+
+    def _span(self, stage):
+        """Time a stage of the run in the run metrics (a no-op when metrics are off)."""
+        return self._metrics.span(stage) if self._metrics else nullcontext()
+
+    def _write_metrics(self, force=False):
+        """Write the run metrics with the current job counts, at most every METRICS_INTERVAL unless forced."""
+        if not self._metrics:
+            return
+        with self._stats_lock:
+            self._metrics.set_counters(self._run_stats)
+        try:
+            if force:
+                self._metrics.write()
+            else:
+                self._metrics.write_if_due()
+        except OSError as e:
+            self.logger.warning(f"Could not write run metrics: {str(e)}")
+
+    def _count(self, key, amount=1):
+        """Increment a run statistic and return its new value."""
+        with self._stats_lock:
+            self._run_stats[key] += amount
+            return self._run_stats[key]
+
+    def _record_job(self, job_id, job_data):
+        """Pre-filter, save and score (or queue for scoring) one extracted job.
+
+        Shared by every fetch mode; safe to call from several threads.
+        """
+        passed_prefilter = True
+        if self._prefilter:
+            with self._stats_lock, self._span("prefilter"):
+                job_data['prefilter_score'], passed_prefilter = self._prefilter.check(job_data['job_description'])
+
+        # Reposts and location variants share a cluster, and with it their score
+        job_data['cluster_id'] = self.job_matcher.cluster_id(job_data['job_description'])
+
+        # Save raw job data
+        with self._span("json_write"):
+            self._jobs_store.append(job_id, job_data)
+        if job_data['linkedin_job_id']:
+            with self._stats_lock:
+                self._run_job_ids.add(job_data['linkedin_job_id'])
+                self._search_new_ids.append(job_data['linkedin_job_id'])
+        if self._checkpoint:
+            self._checkpoint.job_recorded(job_data['linkedin_job_id'])
+
+        if not passed_prefilter:
+            self.logger.info(
+                f"Skipping LLM scoring for {job_data['job_title']} at {job_data['company_name']} "
+                f"(pre-filter score {job_data['prefilter_score']} < {self._prefilter.threshold})"
+            )
+            self._save_prefiltered_job(job_id, job_data)
+        else:
+            self._score_job(job_id, job_data)
+
+        processed_count = self._count("processed")
+        if self._total_jobs != "unknown":
+            self.logger.info(f"Processed {processed_count}/{self._total_jobs} jobs")
+        else:
+            self.logger.info(f"Processed {processed_count} jobs")
+        self._write_metrics()
+
+    def _score_job(self, job_id, job_data):
+        """Score a saved job now, or queue it for the scoring workers."""
+        if self._scoring_pipeline:
+            # Hand off to the scoring workers; blocks if they fall behind
+            self._scoring_pipeline.submit(job_id, job_data)
+        else:
+            # Score the job immediately
+            self.logger.info(f"Scoring job: {job_data['job_title']} at {job_data['company_name']}")
+            try:
+                with self._span("llm_call"):
+                    match_score = self.job_matcher.get_match_score(job_data['job_description'])
+            except BudgetExceededError as e:
+                # Keep scraping; the job stays unscored in the raw store for `python main.py score`
+                if self._count("over_budget") == 1:
+                    self.logger.warning(f"{str(e)}; remaining jobs will be saved without a score")
+                return
+            self._save_scored_job(job_id, job_data, match_score)
+            self.logger.info(f"Score: {match_score}/10")
+
+    def _restore_progress(self):
+        """Continue a resumed run: skip jobs it already recorded and re-queue the ones never scored."""
+        recorded = self._jobs_store.load()
+        scored = self._scored_store.load()
+        self._run_job_ids.update(self._checkpoint.processed_job_ids)
+        self._run_job_ids.update(job['linkedin_job_id'] for job in recorded.values() if job.get('linkedin_job_id'))
+
+        pending = [(job_id, job_data) for job_id, job_data in recorded.items() if job_id not in scored]
+        self.logger.info(
+            f"Resuming run {self.run_timestamp}: {len(recorded)} jobs already recorded, "
+            f"{len(pending)} still to be scored"
+        )
+        for job_id, job_data in pending:
+            self._score_job(job_id, job_data)
+
+    def _current_offset(self):
+        """Result offset (start= parameter) of the search page open in the browser."""
+        return int(parse_qs(urlsplit(self.driver.current_url).query).get("start", ["0"])[0])
+
+    def _record_scraped(self, scraped):
+        """Record a (job_id, job_data) pair, counting a failure if extraction came back empty."""
+        if not scraped:
+            self.logger.warning("Skipping job - missing required information")
+            self._count("failed")
+            return
+        self._record_job(*scraped)
+
+    def _is_known_job(self, linkedin_job_id):
+        """Whether a job was already recorded by another search this run, or in an earlier run."""
+        if not linkedin_job_id:
+            return False
+        with self._stats_lock:
+            if linkedin_job_id in self._run_job_ids:
+                self._run_stats["duplicates"] += 1
+                return True
+        if linkedin_job_id in self._high_water_ids or (
+                self.seen_jobs and self.seen_jobs.is_known(linkedin_job_id, SEEN_JOB_TTL_DAYS)):
+            self._count("known")
+            return True
+        return False
+
+    def _reached_seen_jobs(self, job_cards, consecutive=0):
+        """Incremental mode: whether pagination can stop after this page.
+
+        Checked before the page is processed. True when every identified job on the
+        page was seen before, or when INCREMENTAL_SEEN_THRESHOLD already-seen jobs
+        come in a row (counting from the consecutive carried over from earlier pages).
+        Only jobs seen before this run count: ones found by another search of this
+        run say nothing about how far back this search has new jobs.
+
+        Returns:
+            tuple: (stop, consecutive already-seen jobs at the end of this page)
+        """
+        job_ids = [linkedin_job_id for _, linkedin_job_id in job_cards if linkedin_job_id]
+        if not self._incremental or not job_ids:
+            return False, 0
+
+        with self._stats_lock:
+            found_this_run = {linkedin_job_id for linkedin_job_id in job_ids if linkedin_job_id in self._run_job_ids}
+        all_seen = True
+        threshold_hit = False
+        for linkedin_job_id in job_ids:
+            # The seen-jobs index also fills up with this run's jobs as they are scored
+            seen = linkedin_job_id not in found_this_run and (
+                linkedin_job_id in self._high_water_ids or
+                bool(self.seen_jobs and self.seen_jobs.is_known(linkedin_job_id, SEEN_JOB_TTL_DAYS))
+            )
+            if seen:
+                consecutive += 1
+                threshold_hit = threshold_hit or consecutive >= INCREMENTAL_SEEN_THRESHOLD
+            else:
+                consecutive = 0
+                all_seen = False
+        return all_seen or threshold_hit, consecutive
+
+    def _process_cards_by_clicking(self, job_cards):
+        """Click each new job card on the page and record its details."""
+        for card, linkedin_job_id in job_cards:
+            try:
+                # Skip jobs scraped in earlier runs without clicking them
+                if self._is_known_job(linkedin_job_id):
+                    continue
+                self._record_scraped(self._scrape_job_card(card, linkedin_job_id))
+            except StaleDetailPaneError as e:
+                self.logger.warning(f"Skipping job - stale detail pane: {str(e)}")
+                self._count("failed")
+            except Exception as e:
+                self.logger.error(f"Error processing job card: {str(e)}")
+                self._count("failed")
+
+    def _view_job_page(self, linkedin_job_id):
+        """Open a job's /jobs/view page in the browser and extract its details."""
+        with self._span("job_page_load"):
+            self.driver.get(f"{LINKEDIN_BASE_URL}{JOB_VIEW_PATH.format(job_id=linkedin_job_id)}")
+            if not self.browser.wait_for_element((By.XPATH, SELECTORS["jobs"]["job_description"])):
+                return None
+        details = self.browser.extract_job_details(
+            {**SELECTORS["jobs"], "job_title": SELECTORS["jobs"]["job_view_title"]}
+        )
+        details["job_url"] = details["job_url"] or self.driver.current_url
+        return self._build_job_record(details, linkedin_job_id)
+
+    def _process_cards_directly(self, job_cards, fetcher):
+        """Fetch the details of each new job on the page by id instead of clicking its card.
+
+        Jobs the HTTP fetch cannot handle are opened via /jobs/view/<id> in the browser,
+        and cards without a job id are clicked as before.
+        """
+        job_ids = []
+        unidentified_cards = []
+        for card, linkedin_job_id in job_cards:
+            if not linkedin_job_id:
+                unidentified_cards.append((card, None))
+            elif not self._is_known_job(linkedin_job_id):
+                job_ids.append(linkedin_job_id)
+
+        if unidentified_cards:
+            self._process_cards_by_clicking(unidentified_cards)
+
+        fallback_ids = []
+        for linkedin_job_id, details in fetcher.fetch_many(job_ids):
+            if isinstance(details, JobFetchError):
+                self.logger.warning(f"{str(details)}; opening the job page instead")
+                fallback_ids.append(linkedin_job_id)
+                continue
+            try:
+                self._record_scraped(self._build_job_record(details, linkedin_job_id))
+            except Exception as e:
+                self.logger.error(f"Error processing job {linkedin_job_id}: {str(e)}")
+                self._count("failed")
+
+        if not fallback_ids:
+            return
+        results_url = self.driver.current_url
+        for linkedin_job_id in fallback_ids:
+            try:
+                self._record_scraped(self._view_job_page(linkedin_job_id))
+            except Exception as e:
+                self.logger.error(f"Error processing job {linkedin_job_id}: {str(e)}")
+                self._count("failed")
+        # Return to the results list so pagination can continue
+        self.driver.get(results_url)
+        self.browser.wait_for_element((By.XPATH, SELECTORS["jobs"]["job_cards"]))
+
+    def _process_cards(self, job_cards, fetcher=None):
+        """Record every new job on a results page, fetching directly when a fetcher is given."""
+        if fetcher:
+            self._process_cards_directly(job_cards, fetcher)
+        else:
+            self._process_cards_by_clicking(job_cards)
+
+    def _process_pages_in_order(self, fetcher=None, offset=0):
+        """Walk the result pages one after another in the main browser, starting at offset."""
+        page_number = offset // RESULTS_PAGE_SIZE + 1
+        consecutive_seen = 0
+        while True:
+            self.logger.info(f"Processing page {page_number}...")
             
-            # Handle case where total jobs count is not available
-            if total_jobs is None or total_jobs == 0:
-                self.logger.warning("Could not determine total number of jobs. Will process all available jobs.")
-                total_jobs = "unknown"
+            # Get all job cards on current page
+            job_cards = self._get_job_cards_on_current_page()
+            
+            if not job_cards:
+                self.logger.info("No job cards found on current page. Ending processing.")
+                break
+
+            reached_seen, consecutive_seen = self._reached_seen_jobs(job_cards, consecutive_seen)
+            self._process_cards(job_cards, fetcher)
+            if self._checkpoint:
+                self._checkpoint.page_done((page_number - 1) * RESULTS_PAGE_SIZE)
+
+            if reached_seen:
+                self.logger.info(f"Reached jobs seen in earlier runs on page {page_number}; stopping pagination")
+                self._count("cutoffs")
+                break
+            
+            # Check if there's a next page
+            if not self._has_next_page():
+                break
+                
+            # Go to next page
+            if not self._go_to_next_page():
+                self.logger.error("Failed to navigate to next page")
+                break
+            
+            page_number += 1
+
+    def _with_browser(self, browser):
+        """Shallow copy of the bot that drives another browser.
+
+        Stores, stats, the pre-filter and the scoring pipeline are shared with this
+        bot, so every copy feeds the same sink.
+        """
+        worker = copy.copy(self)
+        worker.browser = browser
+        worker.driver = browser.driver
+        return worker
+
+    def _browser_alive(self) -> bool:
+        try:
+            self.driver.current_url
+            return True
+        except WebDriverException:
+            return False
+
+    def _open_results_page(self, search_url, offset):
+        """Open the results page starting at offset and return its (card, job id) pairs."""
+        with self._span("page_load"):
+            self.driver.get(results_page_url(search_url, offset))
+            if not self.browser.wait_for_element((By.XPATH, SELECTORS["jobs"]["job_cards"])):
+                return []
+        return self._get_job_cards_on_current_page()
+
+    def _run_page_worker(self, pool, index, scheduler, search_url, fetcher=None):
+        """Process result pages from the scheduler in one pooled browser until none are left.
+
+        Pages are processed out of order, so in incremental mode each page is judged
+        on its own: a run of already-seen jobs is not carried over to the next page
+        the way _process_pages_in_order does.
+        """
+        worker = self._with_browser(pool.browsers[index])
+        pages_done = 0
+        while True:
+            offset = scheduler.next_offset()
+            if offset is None:
+                break
+            page_number = offset // RESULTS_PAGE_SIZE + 1
+            self.logger.info(f"[Browser {index + 1}] Processing page {page_number}...")
+            try:
+                job_cards = worker._open_results_page(search_url, offset)
+                if not job_cards:
+                    if not worker._browser_alive():
+                        raise WebDriverException("Browser is not responding")
+                    self.logger.info(f"[Browser {index + 1}] No job cards on page {page_number}; no more results")
+                    scheduler.mark_end(offset)
+                    continue
+                if not worker._has_next_page():
+                    scheduler.mark_end(offset + RESULTS_PAGE_SIZE)
+                if worker._reached_seen_jobs(job_cards)[0]:
+                    self.logger.info(f"[Browser {index + 1}] Reached jobs seen in earlier runs on page {page_number}")
+                    scheduler.mark_end(offset + RESULTS_PAGE_SIZE)
+                    self._count("cutoffs")
+
+                worker._process_cards(job_cards, fetcher)
+                if not worker._browser_alive():
+                    raise WebDriverException("Browser stopped responding while processing the page")
+                pages_done += 1
+                if self._checkpoint:
+                    self._checkpoint.page_done(offset)
+
+            except WebDriverException as e:
+                if scheduler.cancelled:
+                    break
+                self.logger.error(f"[Browser {index + 1}] Browser failed on page {page_number}: {str(e)}")
+                if not scheduler.retry(offset):
+                    self.logger.error(f"Giving up on page {page_number} after {BROWSER_PAGE_RETRIES} retries")
+                try:
+                    worker = self._with_browser(pool.restart(index))
+                except Exception as e:
+                    self.logger.error(f"[Browser {index + 1}] Could not restart browser, stopping this worker: {str(e)}")
+                    break
+            except Exception as e:
+                self.logger.error(f"[Browser {index + 1}] Error processing page {page_number}: {str(e)}")
+                # The page is not checkpointed, so a resumed run picks it up even once out of retries
+                if not scheduler.retry(offset):
+                    self.logger.error(f"Giving up on page {page_number} after {BROWSER_PAGE_RETRIES} retries")
+
+        self.logger.info(f"[Browser {index + 1}] Finished after {pages_done} pages")
+
+    def _process_pages_with_pool(self, fetcher=None, total_jobs=None):
+        """Shard the result pages across BROWSER_POOL_SIZE browsers sharing this session.
+
+        The pool is started on first use and kept for the rest of the run.
+        """
+        search_url = self.driver.current_url
+        if self._browser_pool is None:
+            self._browser_pool = BrowserPool(self.browser, BROWSER_POOL_SIZE)
+            self._browser_pool.start()
+        pool = self._browser_pool
+        scheduler = PageScheduler(
+            None if total_jobs == "unknown" else total_jobs,
+            skip_offsets=self._checkpoint.completed_offsets if self._checkpoint else ()
+        )
+        try:
+            threads = [
+                threading.Thread(
+                    target=self._run_page_worker,
+                    args=(pool, index, scheduler, search_url, fetcher),
+                    name=f"browser-worker-{index + 1}",
+                    daemon=True
+                )
+                for index in range(len(pool.browsers))
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        finally:
+            scheduler.cancel()
+            # The main browser may have been restarted by its worker
+            self.browser = pool.browsers[0]
+            self.driver = self.browser.driver
+
+    def _process_search_results(self, fetcher=None):
+        """Process every result page of the search currently open in the browser."""
+        total_jobs = self._get_total_job_count()
+
+        # Handle case where total jobs count is not available
+        if total_jobs is None or total_jobs == 0:
+            self.logger.warning("Could not determine total number of jobs. Will process all available jobs.")
+            self._total_jobs = "unknown"
+        else:
+            # Progress is counted across all searches in the run
+            self._total_jobs = self._run_stats["processed"] + total_jobs
+        self.logger.info(f"Total jobs to process: {total_jobs or 'unknown'}")
+
+        if BROWSER_POOL_SIZE > 1:
+            self._process_pages_with_pool(fetcher, total_jobs or "unknown")
+        else:
+            self._process_pages_in_order(fetcher, self._current_offset())
+
+    def _run_searches(self, scheduler, fetcher=None):
+        """Run each scheduled search and process its results into the shared run stores."""
+        for number, task in enumerate(scheduler, start=1):
+            if self._checkpoint and task["key"] in self._checkpoint.completed_searches:
+                self.logger.info(f"Search {number}/{len(scheduler)}: {task['key']} already finished; skipping")
+                continue
+            self.logger.info(
+                f"Search {number}/{len(scheduler)}: {task['keywords']} in {task['location']} ({task['date_posted']})"
+            )
+            start = 0
+            if self._checkpoint:
+                self._checkpoint.start_search(task)
+                start = self._checkpoint.resume_offset(RESULTS_PAGE_SIZE)
+                if start:
+                    self.logger.info(f"Resuming this search at page {start // RESULTS_PAGE_SIZE + 1}")
+
+            before = dict(self._run_stats)
+            started = time.monotonic()
+            self._high_water_ids = scheduler.high_water_ids(task) if self._incremental else set()
+            self._search_new_ids = []
+            if self.search_jobs(task["keywords"], task["location"], start=start, date_posted=task["date_posted"]):
+                self._process_search_results(fetcher)
+                # Only a search that ran to the end is skipped by --resume
+                if self._checkpoint:
+                    self._checkpoint.search_done(task)
+            else:
+                self.logger.warning("No job listings found for this search")
+            scheduler.record(
+                task,
+                new_jobs=self._run_stats["processed"] - before["processed"],
+                seen_jobs=(self._run_stats["known"] - before["known"]) + (self._run_stats["duplicates"] - before["duplicates"]),
+                failed_jobs=self._run_stats["failed"] - before["failed"],
+                seconds=time.monotonic() - started,
+                new_job_ids=self._search_new_ids
+            )
+
+    def run_all_searches(self, pipeline: Optional[bool] = None, fetch_mode: Optional[str] = None,
+                         resume: bool = False, incremental: Optional[bool] = None) -> bool:
+        """Run every keyword group x location x date range search from the settings in one run.
+
+        Searches run highest historical yield first; jobs found by several searches
+        are only processed once, and all results go to the same run files.
+
+        Args:
+            resume: Continue the run recorded in the checkpoint file, if there is one.
+            incremental: See process_job_listings.
+        """
+        checkpoint = RunCheckpoint.load() if resume else None
+        if checkpoint:
+            # Append to the interrupted run's files instead of starting new ones
+            self.run_timestamp = checkpoint.run_timestamp
+        else:
+            if resume:
+                self.logger.info("No checkpoint to resume from; starting a new run")
+            checkpoint = RunCheckpoint(run_timestamp=self.run_timestamp)
+
+        scheduler = SearchScheduler(build_search_tasks(self.settings, self._format_search_query))
+        self.logger.info(f"Scheduled {len(scheduler)} searches")
+        try:
+            return self.process_job_listings(
+                pipeline, fetch_mode, searches=scheduler, checkpoint=checkpoint, incremental=incremental
+            )
+        finally:
+            scheduler.log_report()
+
+    def process_job_listings(self, pipeline: Optional[bool] = None, fetch_mode: Optional[str] = None,
+                             searches: Optional[SearchScheduler] = None,
+                             checkpoint: Optional[RunCheckpoint] = None,
+                             incremental: Optional[bool] = None) -> bool:
+        """Process all job listings and score them in real-time.
+
+        Args:
+            pipeline: Score jobs on background workers while scraping continues.
+                Defaults to PIPELINE_SCORING from config.
+            fetch_mode: "click" to open each card in the results list, or "direct" to
+                fetch job details by id over HTTP. Defaults to JOB_FETCH_MODE from config.
+            searches: Run these scheduled searches one after another; by default only
+                the search currently open in the browser is processed.
+            checkpoint: Save progress here as the run goes, and continue from it if it
+                holds a previous run's progress. The file is removed once the run finishes.
+            incremental: Sort results newest first and stop paginating a search once it
+                reaches jobs seen in earlier runs. Defaults to INCREMENTAL_MODE from config.
+        """
+        if pipeline is None:
+            pipeline = PIPELINE_SCORING
+        if fetch_mode is None:
+            fetch_mode = JOB_FETCH_MODE
+        if fetch_mode not in ("click", "direct"):
+            raise LinkedInBotError(f"Unknown job fetch mode: {fetch_mode}")
+
+        self._scoring_pipeline = None
+        self._jobs_store = None
+        self._stats_lock = threading.Lock()
+        self._run_stats = {"processed": 0, "failed": 0, "known": 0, "duplicates": 0, "cutoffs": 0, "over_budget": 0}
+        self._run_job_ids = set()
+        self._incremental = INCREMENTAL_MODE if incremental is None else incremental
+        self._high_water_ids = set()
+        self._search_new_ids = []
+        self._browser_pool = None
+        self._checkpoint = checkpoint
+        self._metrics = RunMetrics() if METRICS_ENABLED else None
+        completed = False
+        fetcher = None
+        interrupted = False
+        try:
+            # Initialize tracking variables
+            scrape_started = time.monotonic()
+            self._prefilter = self._create_prefilter()
             
             # Use the run timestamp for all files
-            jobs_file = f"data/job_descriptions_{self.run_timestamp}.json"
-            scored_file = f"data/job_descriptions_scored_{self.run_timestamp}.json"
+            jobs_file = os.path.join(DATA_DIR, f"job_descriptions_{self.run_timestamp}.jsonl")
+            scored_file = os.path.join(DATA_DIR, f"job_descriptions_scored_{self.run_timestamp}.jsonl")
+            self._jobs_store = JobStore(jobs_file, fsync=JOB_STORE_FSYNC)
+            self._scored_store = JobStore(scored_file, fsync=JOB_STORE_FSYNC)
             
             self.logger.info(f"Starting job processing at {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-            self.logger.info(f"Total jobs to process: {total_jobs}")
             self.logger.info(f"Raw jobs will be saved to: {jobs_file}")
             self.logger.info(f"Scored jobs will be saved to: {scored_file}")
+
+            if pipeline:
+                self.logger.info(f"Scoring with {SCORING_WORKERS} background workers (queue size {SCORING_QUEUE_SIZE})")
+                self._scoring_pipeline = ScoringPipeline(
+                    self.job_matcher,
+                    on_scored=self._save_scored_job,
+                    workers=SCORING_WORKERS,
+                    max_queue=SCORING_QUEUE_SIZE,
+                    batch_size=SCORING_BATCH_SIZE,
+                    metrics=self._metrics
+                )
+
+            if checkpoint and checkpoint.resumed:
+                self._restore_progress()
+
+            if fetch_mode == "direct":
+                self.logger.info(f"Fetching job details directly with {JOB_FETCH_WORKERS} concurrent requests")
+                fetcher = JobDetailFetcher.from_driver(self.driver, metrics=self._metrics)
             
-            # Process jobs page by page
-            page_number = 1
-            while True:
-                self.logger.info(f"Processing page {page_number}...")
-                
-                # Get all job cards on current page
-                job_cards = self._get_job_cards_on_current_page()
-                
-                if not job_cards:
-                    self.logger.info("No job cards found on current page. Ending processing.")
-                    break
-                
-                for card in job_cards:
-                    try:
-                        # Click the job card to load details
-                        self.browser.ensure_element_in_viewport(card)
-                        card.click()
-                        time.sleep(2)  # Wait for job details to load
-                        
-                        # Extract job information
-                        company_info = self._extract_company_info()
-                        job_info = self._extract_job_url_and_title()
-                        job_description = self._extract_job_description()
-                        
-                        if not all([company_info, job_info, job_description]):
-                            self.logger.warning("Skipping job - missing required information")
-                            failed_count += 1
-                            continue
-                        
-                        # Generate unique job ID
-                        job_id = self._generate_job_id(
-                            company_info["name"],
-                            company_info["url"],
-                            job_info["title"],
-                            job_info["url"],
-                            job_description
-                        )
-                        
-                        # Create job data
-                        job_data = {
-                            "company_name": company_info["name"],
-                            "company_url": company_info["url"],
-                            "job_title": job_info["title"],
-                            "job_url": job_info["url"],
-                            "job_description": job_description,
-                            "scraped_at": datetime.now().isoformat()
-                        }
-                        
-                        # Add to job descriptions
-                        job_descriptions[job_id] = job_data
-                        
-                        # Save raw job data
-                        with open(jobs_file, 'w') as f:
-                            json.dump(job_descriptions, f, indent=2)
-                        
-                        # Score the job immediately
-                        self.logger.info(f"Scoring job: {job_info['title']} at {company_info['name']}")
-                        match_score = self.job_matcher.get_match_score(job_description)
-                        
-                        # Create scored job data
-                        scored_job = {
-                            **job_data,
-                            'match_score': match_score,
-                            'scored_at': datetime.now().isoformat()
-                        }
-                        
-                        # Add to scored jobs
-                        scored_jobs[job_id] = scored_job
-                        
-                        # Save scored job data
-                        with open(scored_file, 'w') as f:
-                            json.dump(scored_jobs, f, indent=2)
-                        
-                        self.logger.info(f"Score: {match_score}/10")
-                        
-                        processed_count += 1
-                        if total_jobs != "unknown":
-                            self.logger.info(f"Processed {processed_count}/{total_jobs} jobs")
-                        else:
-                            self.logger.info(f"Processed {processed_count} jobs")
-                    
-                    except Exception as e:
-                        self.logger.error(f"Error processing job card: {str(e)}")
-                        failed_count += 1
-                        continue
-                
-                # Check if there's a next page
-                if not self._has_next_page():
-                    break
-                    
-                # Go to next page
-                if not self._go_to_next_page():
-                    self.logger.error("Failed to navigate to next page")
-                    break
-                
-                page_number += 1
+            if searches is None:
+                self._process_search_results(fetcher)
+            else:
+                self._run_searches(searches, fetcher)
+
+            scrape_seconds = time.monotonic() - scrape_started
+            if self._scoring_pipeline:
+                self._scoring_pipeline.close()
             
             # Print final statistics
+            prefilter = self._prefilter
             self.logger.info(f"\nJob processing completed at {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-            self.logger.info(f"Total jobs processed: {processed_count}")
-            self.logger.info(f"Failed jobs: {failed_count}")
+            self.logger.info(f"Total jobs processed: {self._run_stats['processed']}")
+            self.logger.info(f"Failed jobs: {self._run_stats['failed']}")
+            self.logger.info(f"Already-seen jobs skipped before fetching: {self._run_stats['known']}")
+            if self._run_stats['duplicates']:
+                self.logger.info(f"Jobs skipped as found by an earlier search this run: {self._run_stats['duplicates']}")
+            if self._incremental:
+                skipped = self._run_stats['known'] + self._run_stats['duplicates']
+                self.logger.info(
+                    f"Incremental run: {self._run_stats['processed']} new jobs, {skipped} skipped as already seen, "
+                    f"pagination stopped early in {self._run_stats['cutoffs']} searches"
+                )
+            self.logger.info(f"Scraping time ({fetch_mode} mode): {scrape_seconds:.1f}s, total time: {time.monotonic() - scrape_started:.1f}s")
+            if self._scoring_pipeline:
+                self._scoring_pipeline.log_stats()
+            if prefilter:
+                self.logger.info(prefilter.summary())
+            self._log_cache_stats()
+            if self._metrics:
+                self._metrics.log_summary(self.logger)
+                self.logger.info(f"Run metrics written to {self._metrics.json_path} and {self._metrics.prometheus_path}")
             self.logger.info(f"Raw jobs saved to: {jobs_file}")
             self.logger.info(f"Scored jobs saved to: {scored_file}")
+            self.logger.info(f"Export to the legacy JSON format with: python -m linkedin.job_store export {scored_file}")
             
+            completed = True
             return True
-            
+
+        except KeyboardInterrupt:
+            interrupted = True
+            self.logger.info("Interrupted; stopping job processing...")
+            raise
         except Exception as e:
             self.logger.exception("Fatal error during job processing")
-            return False 
\ No newline at end of file
+            return False
+        finally:
+            if fetcher:
+                fetcher.close()
+            if self._browser_pool:
+                self._browser_pool.quit()
+            if self._scoring_pipeline:
+                # Let in-flight API calls finish; drop queued work if we were interrupted
+                self._scoring_pipeline.close(cancel_pending=interrupted)
+                if interrupted:
+                    self._scoring_pipeline.log_stats()
+            self._write_metrics(force=True)
+            if self._jobs_store:
+                self._jobs_store.close()
+                self._scored_store.close()
+            if checkpoint:
+                if completed:
+                    checkpoint.clear()
+                else:
+                    checkpoint.save()
+                    self.logger.info("Progress saved; continue this run with: python main.py scrape --resume")
@@ -0,0 +1,149 @@
+import os
+import json
+import time
+import threading
+from contextlib import contextmanager
+from datetime import datetime
+
+from config.config import METRICS_JSON_PATH, METRICS_PROMETHEUS_PATH, METRICS_INTERVAL
+
+METRIC_PREFIX = "linkedin_bot"
+QUANTILES = (0.5, 0.95)
+
+
+def percentile(values, fraction):
+    """Nearest-rank percentile of a non-empty list."""
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(fraction * (len(ordered) - 1))))]
+
+
+def _label(value):
+    """Escape a Prometheus label value (backslash, double quote and newline)."""
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _write_atomic(path, text):
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'w') as f:
+        f.write(text)
+    os.replace(tmp_path, path)
+
+
+class RunMetrics:
+    """Timing spans and counters for one scraping run.
+
+    Each stage of the per-job loop is timed with span(); durations are kept per
+    stage and summarized as count, total, p50, p95 and max. The summary is written
+    as JSON and as a Prometheus textfile (for node exporter's textfile collector),
+    every interval seconds while the run goes on and once at the end. Safe to use
+    from several threads.
+    """
+
+    def __init__(self, json_path=METRICS_JSON_PATH, prometheus_path=METRICS_PROMETHEUS_PATH,
+                 interval=METRICS_INTERVAL):
+        self.json_path = json_path
+        self.prometheus_path = prometheus_path
+        self.interval = interval
+        self.started_at = datetime.now().isoformat()
+        self._samples = {}
+        self._counters = {}
+        self._lock = threading.Lock()
+        self._last_write = time.monotonic()
+
+    @contextmanager
+    def span(self, stage):
+        """Time the enclosed block as one sample of stage (also when it raises)."""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(stage, time.perf_counter() - started)
+
+    def observe(self, stage, seconds):
+        with self._lock:
+            self._samples.setdefault(stage, []).append(seconds)
+
+    def set_counters(self, counters):
+        """Replace the counters reported alongside the spans (e.g. the run's job stats)."""
+        with self._lock:
+            self._counters = dict(counters)
+
+    def summary(self):
+        """Per-stage count, total_seconds, p50, p95 and max, plus the counters."""
+        with self._lock:
+            samples = {stage: list(values) for stage, values in self._samples.items()}
+            counters = dict(self._counters)
+        stages = {}
+        for stage, values in samples.items():
+            stages[stage] = {
+                "count": len(values),
+                "total_seconds": round(sum(values), 4),
+                "p50": round(percentile(values, 0.5), 4),
+                "p95": round(percentile(values, 0.95), 4),
+                "max": round(max(values), 4)
+            }
+        return {
+            "started_at": self.started_at,
+            "updated_at": datetime.now().isoformat(),
+            "stages": stages,
+            "counters": counters
+        }
+
+    def prometheus_text(self, summary=None):
+        """Render a summary in the Prometheus text exposition format."""
+        summary = summary or self.summary()
+        name = f"{METRIC_PREFIX}_stage_seconds"
+        lines = [
+            f"# HELP {name} Seconds spent per stage of the job scraping loop.",
+            f"# TYPE {name} summary"
+        ]
+        for stage, stats in sorted(summary["stages"].items()):
+            for quantile, key in zip(QUANTILES, ("p50", "p95")):
+                lines.append(f'{name}{{stage="{_label(stage)}",quantile="{quantile}"}} {stats[key]}')
+            lines.append(f'{name}_sum{{stage="{_label(stage)}"}} {stats["total_seconds"]}')
+            lines.append(f'{name}_count{{stage="{_label(stage)}"}} {stats["count"]}')
+        lines += [
+            f"# HELP {name}_max Longest single sample per stage in this run.",
+            f"# TYPE {name}_max gauge"
+        ]
+        lines += [f'{name}_max{{stage="{_label(stage)}"}} {stats["max"]}' for stage, stats in sorted(summary["stages"].items())]
+        lines += [
+            f"# HELP {METRIC_PREFIX}_jobs Jobs handled by the current run, by outcome.",
+            f"# TYPE {METRIC_PREFIX}_jobs gauge"
+        ]
+        lines += [f'{METRIC_PREFIX}_jobs{{outcome="{_label(key)}"}} {value}' for key, value in sorted(summary["counters"].items())]
+        lines += [
+            f"# HELP {METRIC_PREFIX}_metrics_updated_timestamp_seconds When these metrics were last written.",
+            f"# TYPE {METRIC_PREFIX}_metrics_updated_timestamp_seconds gauge",
+            f"{METRIC_PREFIX}_metrics_updated_timestamp_seconds {time.time():.0f}"
+        ]
+        return "\n".join(lines) + "\n"
+
+    def write(self):
+        """Write the JSON summary and the Prometheus textfile atomically."""
+        summary = self.summary()
+        if self.json_path:
+            _write_atomic(self.json_path, json.dumps(summary, indent=2))
+        if self.prometheus_path:
+            _write_atomic(self.prometheus_path, self.prometheus_text(summary))
+        self._last_write = time.monotonic()
+
+    def write_if_due(self):
+        """Write if the last write was more than interval seconds ago."""
+        if time.monotonic() - self._last_write >= self.interval:
+            self.write()
+
+    def log_summary(self, logger):
+        """Log the stages ordered by total time spent."""
+        stages = self.summary()["stages"]
+        if not stages:
+            return
+        logger.info("Time per stage (count, p50 / p95 / max, total):")
+        for stage, stats in sorted(stages.items(), key=lambda item: item[1]["total_seconds"], reverse=True):
+            logger.info(
+                f"  {stage}: {stats['count']}x, {stats['p50']:.2f}s / {stats['p95']:.2f}s / {stats['max']:.2f}s, "
+                f"{stats['total_seconds']:.1f}s"
+            )
@@ -0,0 +1,188 @@
+import os
+import time
+import zlib
+import sqlite3
+import hashlib
+import threading
+
+import numpy as np
+
+from config.config import NEAR_DUPLICATE_THRESHOLD, NEAR_DUPLICATE_NUM_PERM, NEAR_DUPLICATE_SHINGLE_SIZE
+from .prefilter import tokenize
+
+MERSENNE_PRIME = np.uint64((1 << 61) - 1)
+MAX_HASH = np.uint64((1 << 32) - 1)
+# Fixed so signatures stored by earlier runs stay comparable
+PERMUTATION_SEED = 1
+# Bumped when what a doc_key identifies changes; an index of another version is rebuilt
+INDEX_VERSION = 2
+# Chance that a pair exactly at the threshold shares at least one LSH band
+MIN_CANDIDATE_PROBABILITY = 0.99
+
+
+def shingles(text, size=NEAR_DUPLICATE_SHINGLE_SIZE):
+    """Set of word n-grams of the normalized text, hashed to 32 bits."""
+    tokens = tokenize(text)
+    if len(tokens) <= size:
+        return {zlib.crc32(' '.join(tokens).encode())} if tokens else set()
+    return {zlib.crc32(' '.join(tokens[i:i + size]).encode()) for i in range(len(tokens) - size + 1)}
+
+
+def lsh_bands(num_perm, threshold):
+    """Pick (bands, rows) for banded LSH.
+
+    Takes the fewest bands (so the fewest false candidates to verify) that still
+    make a pair with exactly `threshold` similarity a candidate with probability
+    MIN_CANDIDATE_PROBABILITY.
+    """
+    for rows in sorted((r for r in range(1, num_perm + 1) if num_perm % r == 0), reverse=True):
+        bands = num_perm // rows
+        if 1 - (1 - threshold ** rows) ** bands >= MIN_CANDIDATE_PROBABILITY:
+            return bands, rows
+    return num_perm, 1
+
+
+class MinHasher:
+    """MinHash signatures with num_perm universal hash permutations."""
+
+    def __init__(self, num_perm=NEAR_DUPLICATE_NUM_PERM, seed=PERMUTATION_SEED):
+        rng = np.random.RandomState(seed)
+        self.num_perm = num_perm
+        self.a = rng.randint(1, (1 << 61) - 1, size=num_perm, dtype=np.uint64)
+        self.b = rng.randint(0, (1 << 61) - 1, size=num_perm, dtype=np.uint64)
+
+    def signature(self, text):
+        """MinHash signature of the text's shingles, or None for text without words."""
+        hashes = np.fromiter(shingles(text), dtype=np.uint64)
+        if not len(hashes):
+            return None
+        permuted = (np.outer(self.a, hashes) + self.b[:, None]) % MERSENNE_PRIME & MAX_HASH
+        return permuted.min(axis=1).astype(np.uint32)
+
+
+class NearDuplicateIndex:
+    """Persistent MinHash LSH index that groups near-identical job descriptions.
+
+    Agencies and multi-location postings often repeat the same description with
+    small edits, so exact content hashes miss them. Each description is added to a
+    cluster: the cluster of the most similar description already indexed whose
+    estimated Jaccard similarity is at least threshold, or a new cluster of its own.
+    A cluster's id is the key of its first member, so a posting that is first seen
+    keeps its own key and later near-duplicates map onto it.
+    """
+
+    def __init__(self, path, threshold=NEAR_DUPLICATE_THRESHOLD, num_perm=NEAR_DUPLICATE_NUM_PERM,
+                 max_age_days=None):
+        self.path = path
+        self.threshold = threshold
+        self.max_age_days = max_age_days
+        self.hasher = MinHasher(num_perm)
+        self.bands, self.rows = lsh_bands(num_perm, threshold)
+        self.stats = {"checked": 0, "clustered": 0}
+        self._lock = threading.Lock()
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        # Scoring workers and the scraper share one connection, guarded by the lock
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL)")
+        meta = {"version": str(INDEX_VERSION), "num_perm": str(num_perm)}
+        stored = dict(self._conn.execute("SELECT key, value FROM meta").fetchall())
+        if stored and stored != meta:
+            # Signatures of another length, or keys of another kind, can't be reused; start over
+            self._conn.execute("DROP TABLE IF EXISTS documents")
+            self._conn.execute("DROP TABLE IF EXISTS buckets")
+        self._conn.executemany("INSERT OR REPLACE INTO meta VALUES (?, ?)", meta.items())
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS documents (
+                doc_key TEXT PRIMARY KEY,
+                cluster_id TEXT NOT NULL,
+                signature BLOB NOT NULL,
+                created_at REAL NOT NULL
+            )
+        """)
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS buckets (
+                bucket TEXT NOT NULL,
+                doc_key TEXT NOT NULL
+            )
+        """)
+        self._conn.execute("CREATE INDEX IF NOT EXISTS buckets_by_bucket ON buckets (bucket)")
+        self._conn.commit()
+        self.evict()
+
+    def _bucket_keys(self, signature):
+        """One key per LSH band: the band number plus a hash of its rows."""
+        return [
+            f"{band}:{hashlib.blake2b(signature[band * self.rows:(band + 1) * self.rows].tobytes(), digest_size=8).hexdigest()}"
+            for band in range(self.bands)
+        ]
+
+    def _best_match(self, signature, buckets):
+        """(cluster_id, similarity) of the most similar indexed document in a shared bucket."""
+        placeholders = ",".join("?" * len(buckets))
+        candidates = self._conn.execute(f"""
+            SELECT d.cluster_id, d.signature FROM documents d
+            WHERE d.doc_key IN (SELECT DISTINCT doc_key FROM buckets WHERE bucket IN ({placeholders}))
+        """, buckets).fetchall()
+        best = (None, 0.0)
+        for cluster_id, blob in candidates:
+            similarity = float(np.mean(np.frombuffer(blob, dtype=np.uint32) == signature))
+            if similarity > best[1]:
+                best = (cluster_id, similarity)
+        return best
+
+    def assign(self, doc_key, text):
+        """Add a document and return its cluster id.
+
+        doc_key identifies the document, e.g. the content hash of the raw job
+        description whose compacted text is passed as text; a key that is already
+        indexed keeps the cluster it was given. Text without words is not indexed
+        and forms its own cluster.
+        """
+        with self._lock:
+            row = self._conn.execute("SELECT cluster_id FROM documents WHERE doc_key = ?", (doc_key,)).fetchone()
+            if row is not None:
+                return row[0]
+
+        signature = self.hasher.signature(text)
+        if signature is None:
+            return doc_key
+        buckets = self._bucket_keys(signature)
+
+        with self._lock:
+            row = self._conn.execute("SELECT cluster_id FROM documents WHERE doc_key = ?", (doc_key,)).fetchone()
+            if row is not None:  # Added by another thread meanwhile
+                return row[0]
+            self.stats["checked"] += 1
+            cluster_id, similarity = self._best_match(signature, buckets)
+            if cluster_id is None or similarity < self.threshold:
+                cluster_id = doc_key
+            else:
+                self.stats["clustered"] += 1
+            self._conn.execute(
+                "INSERT INTO documents VALUES (?, ?, ?, ?)",
+                (doc_key, cluster_id, signature.tobytes(), time.time())
+            )
+            self._conn.executemany("INSERT INTO buckets VALUES (?, ?)", [(bucket, doc_key) for bucket in buckets])
+            self._conn.commit()
+            return cluster_id
+
+    def evict(self):
+        """Drop documents indexed more than max_age_days ago."""
+        if self.max_age_days is None:
+            return
+        cutoff = time.time() - self.max_age_days * 86400
+        with self._lock:
+            self._conn.execute(
+                "DELETE FROM buckets WHERE doc_key IN (SELECT doc_key FROM documents WHERE created_at < ?)",
+                (cutoff,)
+            )
+            self._conn.execute("DELETE FROM documents WHERE created_at < ?", (cutoff,))
+            self._conn.commit()
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,178 @@
+import os
+import re
+import glob
+import argparse
+from collections import Counter
+
+import numpy as np
+
+from config.config import DATA_DIR, PREFILTER_THRESHOLD, PREFILTER_SKIP
+from .job_store import read_jobs
+
+TOKEN_PATTERN = re.compile(r"[a-z0-9][a-z0-9+#]*(?:\.[a-z0-9]+)*")
+
+STOP_WORDS = frozenset("""
+a about above after again all also am an and any are as at be because been before being below
+between both but by can could did do does doing down during each few for from further had has
+have having he her here hers him his how i if in into is it its itself just me more most my no
+nor not now of off on once only or other our ours out over own same she should so some such than
+that the their theirs them then there these they this those through to too under until up very
+was we were what when where which while who whom why will with would you your yours
+""".split())
+
+
+def tokenize(text):
+    """Lowercase word tokens, keeping things like c++, c#, node.js; stop words removed."""
+    return [token for token in TOKEN_PATTERN.findall((text or '').lower()) if token not in STOP_WORDS]
+
+
+class RelevancePrefilter:
+    """TF-IDF cosine similarity between the resume and job descriptions.
+
+    Cheap enough to run on every scraped job, so obvious mismatches can be recorded
+    and skipped before paying for a gpt-4o call. Document frequencies accumulate
+    over every description seen (and any history passed to fit()), so the IDF
+    weights improve as a run goes on. Skills from the candidate profile are added
+    to the resume side once more, so matching them counts for more than other words.
+
+    With skip=False (log-only) every job passes; the ones below the threshold are
+    only counted, so the threshold can be checked before it costs any jobs.
+    """
+
+    def __init__(self, resume_text, threshold=PREFILTER_THRESHOLD, skills=(), skip=PREFILTER_SKIP):
+        self.resume_tokens = tokenize(resume_text) + tokenize(' '.join(skills))
+        self.threshold = threshold
+        self.skip = skip
+        self._doc_freq = Counter()
+        self._num_docs = 0
+        self.stats = {"checked": 0, "below_threshold": 0, "skipped": 0}
+
+    def fit(self, descriptions):
+        """Add descriptions to the document-frequency statistics."""
+        for description in descriptions:
+            self._doc_freq.update(set(tokenize(description)))
+            self._num_docs += 1
+
+    def fit_files(self, paths):
+        """Add the descriptions stored in job files (e.g. earlier runs) to the statistics."""
+        for path in paths:
+            try:
+                jobs = read_jobs(path)
+            except (OSError, ValueError):
+                continue
+            self.fit(job.get('job_description', '') for job in jobs.values())
+
+    def score_batch(self, descriptions):
+        """Cosine similarity of each description to the resume, as a NumPy array."""
+        documents = [tokenize(description) for description in descriptions]
+        if not documents:
+            return np.zeros(0)
+
+        vocabulary = {}
+        rows, columns = [], []
+        for row, tokens in enumerate([self.resume_tokens] + documents):
+            for token in tokens:
+                rows.append(row)
+                columns.append(vocabulary.setdefault(token, len(vocabulary)))
+        if not vocabulary:
+            return np.zeros(len(documents))
+
+        counts = np.zeros((len(documents) + 1, len(vocabulary)))
+        np.add.at(counts, (np.array(rows, dtype=int), np.array(columns, dtype=int)), 1)
+
+        # Document frequency: everything fitted so far plus this batch (the resume is the query)
+        batch_doc_freq = (counts[1:] > 0).sum(axis=0)
+        fitted_doc_freq = np.array([self._doc_freq.get(term, 0) for term in vocabulary])
+        num_docs = self._num_docs + len(documents)
+        idf = np.log((1 + num_docs) / (1 + fitted_doc_freq + batch_doc_freq)) + 1
+
+        # Sublinear term frequency, TF-IDF weighting and L2 normalization
+        weights = np.zeros_like(counts)
+        nonzero = counts > 0
+        weights[nonzero] = 1 + np.log(counts[nonzero])
+        weights *= idf
+        norms = np.linalg.norm(weights, axis=1, keepdims=True)
+        weights = np.divide(weights, norms, out=np.zeros_like(weights), where=norms > 0)
+
+        return weights[1:] @ weights[0]
+
+    def check_batch(self, descriptions):
+        """Score descriptions, learn from them, and return (scores, passed mask)."""
+        descriptions = list(descriptions)
+        scores = self.score_batch(descriptions)
+        self.fit(descriptions)
+        below = scores < self.threshold
+        self.stats["checked"] += len(descriptions)
+        self.stats["below_threshold"] += int(below.sum())
+        if not self.skip:
+            return scores, np.ones(len(descriptions), dtype=bool)
+        self.stats["skipped"] += int(below.sum())
+        return scores, ~below
+
+    def summary(self):
+        """One-line summary of this run's pre-filter results."""
+        stats = self.stats
+        if self.skip:
+            return (f"Pre-filter: skipped {stats['skipped']} of {stats['checked']} jobs "
+                    f"({stats['skipped']} API calls saved)")
+        return (f"Pre-filter (log only): {stats['below_threshold']} of {stats['checked']} jobs scored below "
+                f"{self.threshold} and would have been skipped with PREFILTER_SKIP = True")
+
+    def check(self, description):
+        """Return (prefilter_score, passed) for one job description."""
+        scores, passed = self.check_batch([description])
+        return round(float(scores[0]), 4), bool(passed[0])
+
+
+def replay(resume_text, paths, thresholds, good_score=7, skills=()):
+    """Replay historical scored files to show what each threshold would have skipped.
+
+    For every threshold, reports how many LLM calls would have been saved and how
+    many jobs the LLM scored at or above good_score would have been lost.
+    """
+    jobs = {}
+    for path in paths:
+        for job_id, job in read_jobs(path).items():
+            if isinstance(job.get('match_score'), (int, float)):
+                jobs[job_id] = job
+    if not jobs:
+        print("No scored jobs found")
+        return []
+
+    prefilter = RelevancePrefilter(resume_text, skills=skills)
+    scores = prefilter.score_batch([job['job_description'] for job in jobs.values()])
+    match_scores = np.array([job['match_score'] for job in jobs.values()], dtype=float)
+    good = match_scores >= good_score
+
+    print(f"Replaying {len(jobs)} scored jobs ({int(good.sum())} scored >= {good_score})")
+    print(f"{'threshold':>10} {'skipped':>8} {'saved %':>8} {'good lost':>10}")
+    report = []
+    for threshold in thresholds:
+        skipped = scores < threshold
+        row = {
+            "threshold": threshold,
+            "skipped": int(skipped.sum()),
+            "saved_pct": 100.0 * skipped.mean(),
+            "good_lost": int((skipped & good).sum())
+        }
+        report.append(row)
+        print(f"{threshold:>10.3f} {row['skipped']:>8} {row['saved_pct']:>7.1f}% {row['good_lost']:>10}")
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Tune the relevance pre-filter threshold on historical scored jobs")
+    parser.add_argument("files", nargs="*", help="Scored job files (defaults to job_descriptions_scored_* in DATA_DIR)")
+    parser.add_argument("--thresholds", type=float, nargs="+",
+                        default=[round(0.01 * i, 2) for i in range(0, 21, 2)])
+    parser.add_argument("--good-score", type=float, default=7, help="LLM score counted as a job worth keeping")
+    args = parser.parse_args()
+
+    from .resume_profile import load_resume
+    paths = args.files or sorted(glob.glob(os.path.join(DATA_DIR, 'job_descriptions_scored_*')))
+    resume = load_resume()
+    replay(resume["text"], paths, args.thresholds, args.good_score, skills=resume["profile"]["skills"])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+import asyncio
+import random
+import threading
+import time
+
+
+class TokenBucket:
+    """Thread-safe token bucket that refills continuously at `per_minute` tokens/minute.
+
+    A reservation always succeeds and returns how long the caller has to wait
+    before it may proceed, so the same bucket works for threads and coroutines.
+    """
+
+    def __init__(self, per_minute, capacity=None, clock=time.monotonic):
+        self.rate = per_minute / 60.0
+        self.capacity = float(capacity if capacity is not None else per_minute)
+        self.clock = clock
+        self._tokens = self.capacity
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    def reserve(self, amount=1.0):
+        """Take `amount` tokens (possibly going into debt) and return the seconds to wait."""
+        # A single request bigger than the whole bucket would otherwise never fit
+        amount = min(float(amount), self.capacity)
+        with self._lock:
+            now = self.clock()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= amount
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate
+
+    def refund(self, amount):
+        """Give back tokens that were reserved but not used (e.g. an over-estimate)."""
+        with self._lock:
+            self._tokens = min(self.capacity, self._tokens + amount)
+
+
+class RateLimiter:
+    """Requests-per-minute and tokens-per-minute budgets for the OpenAI API."""
+
+    def __init__(self, requests_per_minute, tokens_per_minute, clock=time.monotonic):
+        self.requests = TokenBucket(requests_per_minute, clock=clock)
+        self.tokens = TokenBucket(tokens_per_minute, clock=clock)
+
+    def _reserve(self, estimated_tokens):
+        return max(self.requests.reserve(1), self.tokens.reserve(estimated_tokens))
+
+    def acquire(self, estimated_tokens):
+        """Block the calling thread until a request of this size fits in the budget."""
+        delay = self._reserve(estimated_tokens)
+        if delay > 0:
+            time.sleep(delay)
+
+    async def acquire_async(self, estimated_tokens):
+        """Wait (without blocking the event loop) until a request of this size fits."""
+        delay = self._reserve(estimated_tokens)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    def record_usage(self, estimated_tokens, actual_tokens):
+        """Correct the token budget once the real usage of a request is known."""
+        if actual_tokens is None:
+            return
+        difference = estimated_tokens - actual_tokens
+        if difference > 0:
+            self.tokens.refund(difference)
+        elif difference < 0:
+            self.tokens.reserve(-difference)
+
+
+def backoff_delay(attempt, base=1.0, maximum=60.0):
+    """Exponential backoff with full jitter for retry number `attempt` (0-based)."""
+    return random.uniform(0, min(maximum, base * (2 ** attempt)))
@@ -0,0 +1,214 @@
+import os
+import re
+import json
+import hashlib
+import argparse
+import threading
+from datetime import date
+
+from config.config import RESUME_PATH, RESUME_CACHE_PATH
+from config.logging_config import log_manager
+
+RESUME_CACHE_VERSION = 1
+
+MONTHS = {name: index for index, name in enumerate(
+    ["jan", "feb", "mar", "apr", "may", "jun", "jul", "aug", "sep", "oct", "nov", "dec"], start=1
+)}
+MONTH_PATTERN = r"(?:(jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)[a-z]*\.?\s+)?((?:19|20)\d{2})"
+DATE_RANGE_PATTERN = re.compile(
+    MONTH_PATTERN + r"\s*[-–—]+\s*(?:" + MONTH_PATTERN + r"|(present|current|now))",
+    re.IGNORECASE
+)
+TITLE_PATTERN = re.compile(
+    r"\b(engineer|scientist|developer|analyst|researcher|assistant|associate|manager|intern|"
+    r"consultant|architect|lead|specialist|administrator|designer)s?\b",
+    re.IGNORECASE
+)
+SECTION_PATTERN = re.compile(r"^[A-Z][A-Z &/-]{3,}$")
+BULLET_CHARACTERS = "•●▪-*"
+
+_lock = threading.Lock()
+_loaded = {}  # Resume path -> (file size and mtime, resume), shared by every JobMatcher in the process
+
+
+def file_hash(path):
+    """SHA-256 hex digest of a file's bytes."""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 16), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def extract_text(path):
+    """Extract the text of every page of a PDF."""
+    import pdfplumber
+
+    all_text = []
+    with pdfplumber.open(path) as pdf:
+        for page in pdf.pages:
+            text = page.extract_text()
+            if text:
+                all_text.append(text)
+    return '\n'.join(all_text)
+
+
+def _section_lines(lines, heading_word):
+    """Lines under the first all-caps heading containing heading_word, up to the next heading."""
+    section = None
+    for line in lines:
+        if SECTION_PATTERN.match(line):
+            if section is not None:
+                break
+            if heading_word in line:
+                section = []
+        elif section is not None:
+            section.append(line)
+    return section or []
+
+
+def _extract_skills(lines):
+    """Individual skills listed in the skills section, in order, without duplicates."""
+    text = ' '.join(_section_lines(lines, "SKILL"))
+    skills = {}
+    for item in re.split(r"[,;:()•]|\s-\s", text):
+        item = item.strip(" .\t" + BULLET_CHARACTERS)
+        if item and len(item.split()) <= 4:
+            skills.setdefault(item.lower(), item)
+    return list(skills.values())
+
+
+def _month_number(month, year, end_of_year=False):
+    month = MONTHS[month[:3].lower()] if month else (12 if end_of_year else 1)
+    return int(year) * 12 + month - 1
+
+
+def _extract_years(text, today=None):
+    """Years of experience covered by the date ranges in the resume, overlaps counted once."""
+    today = today or date.today()
+    periods = []
+    for start_month, start_year, end_month, end_year, ongoing in DATE_RANGE_PATTERN.findall(text):
+        start = _month_number(start_month, start_year)
+        if ongoing:
+            end = today.year * 12 + today.month - 1
+        else:
+            end = _month_number(end_month, end_year, end_of_year=True)
+        if end >= start:
+            periods.append((start, end))
+
+    months = 0
+    current_start = current_end = None
+    for start, end in sorted(periods):
+        if current_end is not None and start <= current_end + 1:
+            current_end = max(current_end, end)
+            continue
+        if current_end is not None:
+            months += current_end - current_start + 1
+        current_start, current_end = start, end
+    if current_end is not None:
+        months += current_end - current_start + 1
+    return round(months / 12, 1)
+
+
+def _extract_titles(lines):
+    """Short lines naming a role (e.g. "Machine Learning Engineer") outside bullet points."""
+    titles = []
+    for line in lines:
+        if (line[0] in BULLET_CHARACTERS or len(line.split()) > 6 or
+                DATE_RANGE_PATTERN.search(line) or not TITLE_PATTERN.search(line)):
+            continue
+        title = line.strip(" |,")
+        if title not in titles:
+            titles.append(title)
+    return titles
+
+
+def build_profile(text):
+    """Derive a compact candidate profile from resume text.
+
+    Returns:
+        dict: skills (from the skills section), years_experience (total length of
+            the dated positions) and titles (role names).
+    """
+    lines = [line.strip() for line in (text or '').splitlines() if line.strip()]
+    experience = _section_lines(lines, "EXPERIENCE") or lines
+    return {
+        "skills": _extract_skills(lines),
+        "years_experience": _extract_years('\n'.join(experience)),
+        "titles": _extract_titles(experience)
+    }
+
+
+def _read_cache(cache_path, sha256):
+    try:
+        with open(cache_path, 'r') as f:
+            cached = json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return None
+    if cached.get("version") != RESUME_CACHE_VERSION or cached.get("sha256") != sha256:
+        return None
+    return cached
+
+
+def _write_cache(cache_path, resume):
+    """Write the cache readable only by the current user, since it holds the resume's personal details."""
+    directory = os.path.dirname(cache_path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    tmp_path = f"{cache_path}.tmp"
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    with os.fdopen(fd, 'w') as f:
+        json.dump({"version": RESUME_CACHE_VERSION, **resume}, f, indent=2)
+    os.replace(tmp_path, cache_path)
+
+
+def load_resume(path=RESUME_PATH, cache_path=RESUME_CACHE_PATH):
+    """Return the resume's text and profile, parsing the PDF only when it has changed.
+
+    Results are kept in memory for the whole process and on disk in cache_path,
+    keyed by the SHA-256 of the PDF, so a new process skips pdfplumber unless the
+    file was edited.
+
+    Returns:
+        dict: sha256, text and profile (see build_profile).
+    """
+    stat = os.stat(path)
+    signature = (stat.st_size, stat.st_mtime_ns)
+    key = os.path.abspath(path)
+    with _lock:
+        loaded = _loaded.get(key)
+        if loaded and loaded[0] == signature:
+            return loaded[1]
+
+        sha256 = file_hash(path)
+        if loaded and loaded[1]["sha256"] == sha256:
+            _loaded[key] = (signature, loaded[1])
+            return loaded[1]
+
+        resume = _read_cache(cache_path, sha256) if cache_path else None
+        if resume:
+            resume = {"sha256": sha256, "text": resume["text"], "profile": resume["profile"]}
+        else:
+            logger = log_manager.get_logger(__name__)
+            logger.info(f"Extracting resume text from {path}")
+            text = extract_text(path)
+            resume = {"sha256": sha256, "text": text, "profile": build_profile(text)}
+            if cache_path:
+                try:
+                    _write_cache(cache_path, resume)
+                except OSError as e:
+                    logger.warning(f"Could not write resume cache {cache_path}: {str(e)}")
+
+        _loaded[key] = (signature, resume)
+        return resume
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Show the profile derived from the resume")
+    parser.add_argument("path", nargs="?", default=RESUME_PATH, help="Resume PDF")
+    args = parser.parse_args()
+    print(json.dumps(load_resume(args.path)["profile"], indent=2))
+
+
+if __name__ == "__main__":
+    main()
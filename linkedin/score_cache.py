@@ -0,0 +1,114 @@
+import os
+import json
+import time
+import sqlite3
+import hashlib
+import threading
+
+
+def content_hash(text):
+    """SHA-256 hex digest of a piece of text."""
+    return hashlib.sha256((text or '').encode()).hexdigest()
+
+
+class ScoreCache:
+    """On-disk cache of match scores keyed by job, resume, needs and model.
+
+    Each part of the key is stored in its own column, so changing the resume or
+    my_needs simply stops matching the old rows; they are never returned again and
+    age out through the eviction policy.
+    """
+
+    def __init__(self, path, max_entries=None, max_age_days=None):
+        self.path = path
+        self.max_entries = max_entries
+        self.max_age_days = max_age_days
+        self.hits = 0
+        self.misses = 0
+        self.stores = 0
+        self._lock = threading.Lock()
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        # Scoring workers share one connection, guarded by the lock
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS scores (
+                job_hash TEXT NOT NULL,
+                resume_hash TEXT NOT NULL,
+                needs_hash TEXT NOT NULL,
+                model TEXT NOT NULL,
+                match_score TEXT NOT NULL,
+                created_at REAL NOT NULL,
+                last_used_at REAL NOT NULL,
+                PRIMARY KEY (job_hash, resume_hash, needs_hash, model)
+            )
+        """)
+        self._conn.commit()
+        self.evict()
+
+    def get(self, key):
+        """Return the cached score for key, or None on a miss."""
+        return self.get_first([key])
+
+    def get_first(self, keys):
+        """Return the score of the first cached key, or None.
+
+        keys is consumed lazily, so later keys are only computed when the earlier ones
+        miss. However many keys are tried, it counts as a single hit or miss.
+        """
+        for key in keys:
+            with self._lock:
+                row = self._conn.execute(
+                    "SELECT match_score FROM scores WHERE job_hash = ? AND resume_hash = ? AND needs_hash = ? AND model = ?",
+                    key
+                ).fetchone()
+                if row is None:
+                    continue
+                self.hits += 1
+                self._conn.execute(
+                    "UPDATE scores SET last_used_at = ? WHERE job_hash = ? AND resume_hash = ? AND needs_hash = ? AND model = ?",
+                    (time.time(), *key)
+                )
+                self._conn.commit()
+                return json.loads(row[0])
+        with self._lock:
+            self.misses += 1
+        return None
+
+    def put(self, key, match_score):
+        """Store a score under key."""
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO scores VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (*key, json.dumps(match_score), now, now)
+            )
+            self._conn.commit()
+            self.stores += 1
+
+    def evict(self):
+        """Drop entries older than max_age_days, then the least recently used beyond max_entries."""
+        with self._lock:
+            if self.max_age_days is not None:
+                cutoff = time.time() - self.max_age_days * 86400
+                self._conn.execute("DELETE FROM scores WHERE created_at < ?", (cutoff,))
+            if self.max_entries is not None:
+                self._conn.execute("""
+                    DELETE FROM scores WHERE rowid IN (
+                        SELECT rowid FROM scores ORDER BY last_used_at DESC LIMIT -1 OFFSET ?
+                    )
+                """, (self.max_entries,))
+            self._conn.commit()
+
+    def stats(self):
+        """Hit/miss counters for this process."""
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses, "stores": self.stores}
+
+    def close(self):
+        self.evict()
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,180 @@
+import queue
+import threading
+import time
+from contextlib import nullcontext
+from typing import Any, Callable, Dict, Optional
+
+from config.logging_config import log_manager
+from .usage import BudgetExceededError
+
+# Sentinel pushed once per worker to tell it to exit
+_STOP = object()
+
+
+class ScoringPipeline:
+    """Bounded producer/consumer pipeline that scores scraped jobs in the background.
+
+    The scraping loop calls submit() for every extracted job. A pool of worker
+    threads drains the queue and calls the matcher, so the browser keeps moving
+    while gpt-4o is thinking. When the queue is full, submit() blocks, which keeps
+    the scraper from running arbitrarily far ahead of the scorers. A worker that
+    finds several jobs waiting scores up to batch_size of them in one request.
+    """
+
+    def __init__(
+        self,
+        job_matcher,
+        on_scored: Callable[[str, Dict[str, Any], Any], None],
+        workers: int = 4,
+        max_queue: int = 50,
+        batch_size: int = 1,
+        metrics=None,
+    ):
+        self.logger = log_manager.get_logger(__name__)
+        self.job_matcher = job_matcher
+        self.on_scored = on_scored
+        self.queue = queue.Queue(maxsize=max_queue)
+        self.batch_size = max(1, batch_size)
+        self.metrics = metrics
+        self._lock = threading.Lock()
+        self._cancelled = threading.Event()
+        self._threads = []
+        self._closed = False
+        self.stats = {
+            "submitted": 0,
+            "scored": 0,
+            "failed": 0,
+            "cancelled": 0,
+            "over_budget": 0,
+            "producer_wait_seconds": 0.0,
+            "scoring_seconds": 0.0,
+        }
+
+        for i in range(max(1, workers)):
+            thread = threading.Thread(
+                target=self._worker, name=f"scoring-worker-{i + 1}", daemon=True
+            )
+            thread.start()
+            self._threads.append(thread)
+
+    def _count(self, key, amount=1):
+        with self._lock:
+            self.stats[key] += amount
+            return self.stats[key]
+
+    def submit(self, job_id: str, job_data: Dict[str, Any]):
+        """Queue a job for scoring, blocking while the queue is full (backpressure)."""
+        if self._closed:
+            raise RuntimeError("Cannot submit to a closed scoring pipeline")
+        started = time.monotonic()
+        self.queue.put((job_id, job_data))
+        self._count("producer_wait_seconds", time.monotonic() - started)
+        self._count("submitted")
+
+    def _next_batch(self):
+        """Block for one job, then take up to batch_size - 1 more that are already queued.
+
+        Returns (batch, stop) where stop means this worker received its stop sentinel.
+        """
+        batch = []
+        item = self.queue.get()
+        while True:
+            if item is _STOP:
+                return batch, True
+            batch.append(item)
+            if len(batch) >= self.batch_size:
+                return batch, False
+            try:
+                item = self.queue.get_nowait()
+            except queue.Empty:
+                return batch, False
+
+    def _score_batch(self, batch):
+        if self._cancelled.is_set():
+            self._count("cancelled", len(batch))
+            return
+
+        started = time.monotonic()
+        try:
+            for _, job_data in batch:
+                self.logger.info(f"Scoring job: {job_data['job_title']} at {job_data['company_name']}")
+            try:
+                with self.metrics.span("llm_call") if self.metrics else nullcontext():
+                    results = self.job_matcher.get_match_scores(
+                        {job_id: job_data["job_description"] for job_id, job_data in batch}
+                    )
+            except Exception as e:
+                # Fail the batch instead of the worker thread, which would leave the queue undrained
+                results = {job_id: e for job_id, _ in batch}
+
+            for job_id, job_data in batch:
+                match_score = results[job_id]
+                if isinstance(match_score, BudgetExceededError):
+                    # Left unscored in the raw store; `python main.py score` can finish it later
+                    if self._count("over_budget") == 1:
+                        self.logger.warning(f"{str(match_score)}; remaining jobs will be saved without a score")
+                    continue
+                if isinstance(match_score, Exception):
+                    self.logger.error(f"Error scoring job {job_id}: {str(match_score)}")
+                    self._count("failed")
+                    continue
+                try:
+                    self.on_scored(job_id, job_data, match_score)
+                except Exception as e:
+                    self.logger.error(f"Error saving scored job {job_id}: {str(e)}")
+                    self._count("failed")
+                    continue
+                self._count("scored")
+                self.logger.info(f"Score: {match_score}/10")
+        finally:
+            self._count("scoring_seconds", time.monotonic() - started)
+
+    def _worker(self):
+        while True:
+            batch, stop = self._next_batch()
+            try:
+                if batch:
+                    self._score_batch(batch)
+            finally:
+                for _ in range(len(batch) + stop):
+                    self.queue.task_done()
+            if stop:
+                return
+
+    def close(self, cancel_pending: bool = False, timeout: Optional[float] = None):
+        """Stop accepting work and wait for the workers to finish.
+
+        With cancel_pending=True (e.g. after a KeyboardInterrupt), jobs still waiting
+        in the queue are dropped and only the in-flight API calls are allowed to finish.
+        This also works on a pipeline that is already closing, e.g. when Ctrl-C
+        interrupts a close() that was waiting for the queue to drain.
+        """
+        if cancel_pending and not self._cancelled.is_set():
+            self._cancelled.set()
+            self.logger.info("Cancelling pending scoring work...")
+
+        if not self._closed:
+            self._closed = True
+            if not cancel_pending:
+                self.logger.info(f"Waiting for {self.queue.qsize()} queued jobs to be scored...")
+            for _ in self._threads:
+                self.queue.put(_STOP)
+
+        deadline = None if timeout is None else time.monotonic() + timeout
+        for thread in self._threads:
+            remaining = None if deadline is None else max(0, deadline - time.monotonic())
+            thread.join(remaining)
+
+    def log_stats(self):
+        """Log a summary of the scoring stage."""
+        with self._lock:
+            stats = dict(self.stats)
+        self.logger.info(f"Jobs queued for scoring: {stats['submitted']}")
+        self.logger.info(f"Jobs scored: {stats['scored']}")
+        self.logger.info(f"Scoring failures: {stats['failed']}")
+        if stats["cancelled"]:
+            self.logger.info(f"Scoring cancelled for: {stats['cancelled']}")
+        if stats["over_budget"]:
+            self.logger.info(f"Left unscored after the OpenAI budget was reached: {stats['over_budget']}")
+        self.logger.info(f"Total scoring time across workers: {stats['scoring_seconds']:.1f}s")
+        self.logger.info(f"Time scraper spent blocked on a full queue: {stats['producer_wait_seconds']:.1f}s")
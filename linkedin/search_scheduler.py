@@ -0,0 +1,126 @@
+import os
+import json
+import itertools
+from datetime import datetime
+
+from config.config import QUERY_STATS_PATH, QUERY_YIELD_SMOOTHING, HIGH_WATER_MARK_SIZE
+from config.logging_config import log_manager
+
+
+def build_search_tasks(settings, format_query):
+    """Expand the settings into one search task per keyword group x location x date range.
+
+    Settings keys used:
+        keyword_groups: list of keyword lists (or strings); defaults to [job_keywords].
+        locations: defaults to ["Worldwide"].
+        date_ranges: date_posted_filter values; defaults to [date_posted_filter].
+
+    Returns:
+        list: Task dicts with keywords (the search query), location, date_posted and key.
+    """
+    keyword_groups = settings.get("keyword_groups") or [settings.get("job_keywords", [])]
+    locations = settings.get("locations") or ["Worldwide"]
+    date_ranges = settings.get("date_ranges") or [settings.get("date_posted_filter", "any_time")]
+
+    tasks = {}
+    for keywords, location, date_posted in itertools.product(keyword_groups, locations, date_ranges):
+        query = keywords if isinstance(keywords, str) else format_query(keywords)
+        key = f"{query} | {location} | {date_posted}"
+        tasks.setdefault(key, {"keywords": query, "location": location, "date_posted": date_posted, "key": key})
+    return list(tasks.values())
+
+
+class SearchScheduler:
+    """Runs search tasks highest historical yield first and records how each one did.
+
+    Yield is the number of new (not previously seen) jobs a query produced, kept as
+    a moving average in QUERY_STATS_PATH across runs. Queries that have never run
+    go first so their yield gets measured. Each query also keeps a high-water mark:
+    the newest job ids it has found and when, used by incremental runs.
+    """
+
+    def __init__(self, tasks, stats_path=QUERY_STATS_PATH):
+        self.logger = log_manager.get_logger(__name__)
+        self.stats_path = stats_path
+        self.history = self._load()
+        # sorted() is stable, so ties keep the order from the settings
+        self.tasks = sorted(tasks, key=self.expected_yield, reverse=True)
+        self.results = []
+
+    def _load(self):
+        try:
+            with open(self.stats_path, 'r') as f:
+                return json.load(f).get("queries", {})
+        except FileNotFoundError:
+            return {}
+        except (json.JSONDecodeError, AttributeError) as e:
+            self.logger.warning(f"Ignoring unreadable query stats {self.stats_path}: {str(e)}")
+            return {}
+
+    def save(self):
+        """Write the query history atomically."""
+        directory = os.path.dirname(self.stats_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp_path = f"{self.stats_path}.tmp"
+        with open(tmp_path, 'w') as f:
+            json.dump({"queries": self.history}, f, indent=2)
+        os.replace(tmp_path, self.stats_path)
+
+    def expected_yield(self, task):
+        """Average new jobs per run for a task; infinite for queries never run."""
+        history = self.history.get(task["key"])
+        if not history or not history.get("runs"):
+            return float("inf")
+        return history["yield"]
+
+    def __iter__(self):
+        return iter(self.tasks)
+
+    def __len__(self):
+        return len(self.tasks)
+
+    def high_water_ids(self, task):
+        """Newest job ids found by this query in earlier runs."""
+        mark = self.history.get(task["key"], {}).get("high_water_mark") or {}
+        return set(mark.get("job_ids", []))
+
+    def record(self, task, new_jobs, seen_jobs, failed_jobs, seconds, new_job_ids=()):
+        """Record one query's outcome in this run's report and the persistent history.
+
+        new_job_ids (newest first) are added to the front of the query's high-water mark.
+        """
+        history = self.history.setdefault(task["key"], {"runs": 0, "yield": 0.0, "new_jobs": 0})
+        if history["runs"]:
+            history["yield"] += QUERY_YIELD_SMOOTHING * (new_jobs - history["yield"])
+        else:
+            history["yield"] = float(new_jobs)
+        history["runs"] += 1
+        history["new_jobs"] += new_jobs
+        history["last_run"] = datetime.now().isoformat()
+        if new_job_ids:
+            previous = (history.get("high_water_mark") or {}).get("job_ids", [])
+            job_ids = list(dict.fromkeys(list(new_job_ids) + previous))[:HIGH_WATER_MARK_SIZE]
+            history["high_water_mark"] = {"job_ids": job_ids, "updated_at": history["last_run"]}
+
+        self.results.append({
+            "key": task["key"],
+            "new_jobs": new_jobs,
+            "seen_jobs": seen_jobs,
+            "failed_jobs": failed_jobs,
+            "seconds": seconds
+        })
+        self.save()
+
+    def log_report(self):
+        """Log per-query yield for this run."""
+        if not self.results:
+            return
+        self.logger.info(f"Per-query yield ({len(self.results)} of {len(self.tasks)} searches run):")
+        for result in self.results:
+            minutes = result["seconds"] / 60
+            rate = result["new_jobs"] / minutes if minutes else 0.0
+            self.logger.info(
+                f"  {result['key']}: {result['new_jobs']} new, {result['seen_jobs']} already seen, "
+                f"{result['failed_jobs']} failed in {result['seconds']:.0f}s ({rate:.1f} new jobs/min)"
+            )
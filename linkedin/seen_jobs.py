@@ -0,0 +1,77 @@
+import os
+import re
+import time
+import sqlite3
+import threading
+
+JOB_ID_PATTERNS = (
+    re.compile(r"/jobs/view/(?:[^/?#]*-)?(\d+)"),
+    re.compile(r"[?&]currentJobId=(\d+)"),
+)
+
+
+def linkedin_job_id_from_url(url):
+    """Parse LinkedIn's numeric job id out of a job URL, or return None."""
+    for pattern in JOB_ID_PATTERNS:
+        match = pattern.search(url or '')
+        if match:
+            return match.group(1)
+    return None
+
+
+class SeenJobIndex:
+    """Persistent index of LinkedIn job ids that have already been extracted.
+
+    Shared across runs, so a job card can be recognised and skipped before it is
+    clicked. With a TTL, jobs last scraped longer ago than that are treated as new
+    again so their details get re-checked.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._lock = threading.Lock()
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS seen_jobs (
+                linkedin_job_id TEXT PRIMARY KEY,
+                job_id TEXT,
+                first_seen REAL NOT NULL,
+                last_scraped REAL NOT NULL
+            )
+        """)
+        self._conn.commit()
+
+    def is_known(self, linkedin_job_id, ttl_days=None):
+        """Whether the job was scraped before (and, with a TTL, recently enough)."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT last_scraped FROM seen_jobs WHERE linkedin_job_id = ?",
+                (str(linkedin_job_id),)
+            ).fetchone()
+        if row is None:
+            return False
+        if ttl_days is None:
+            return True
+        return row[0] >= time.time() - ttl_days * 86400
+
+    def mark_seen(self, linkedin_job_id, job_id=None):
+        """Record that a job has just been scraped."""
+        now = time.time()
+        with self._lock:
+            self._conn.execute("""
+                INSERT INTO seen_jobs (linkedin_job_id, job_id, first_seen, last_scraped)
+                VALUES (?, ?, ?, ?)
+                ON CONFLICT(linkedin_job_id) DO UPDATE SET
+                    job_id = COALESCE(excluded.job_id, seen_jobs.job_id),
+                    last_scraped = excluded.last_scraped
+            """, (str(linkedin_job_id), job_id, now, now))
+            self._conn.commit()
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,119 @@
+import threading
+
+from config.config import MODEL_PRICING, OPENAI_BUDGET_USD
+
+# Characters per token, the same rough estimate the matcher uses to reserve rate limit budget
+CHARS_PER_TOKEN = 4
+
+
+class BudgetExceededError(Exception):
+    """Raised instead of sending a request once the run's API budget is spent."""
+
+
+def _field(obj, name, default=0):
+    """Read a usage field from an OpenAI response object or from its JSON dict (Batch API output)."""
+    if obj is None:
+        return default
+    value = obj.get(name) if isinstance(obj, dict) else getattr(obj, name, None)
+    return default if value is None else value
+
+
+class UsageTracker:
+    """Token and cost accounting for one run's OpenAI requests.
+
+    record() is called with the usage of every response; cost is computed from
+    MODEL_PRICING, with prompt tokens served from the provider's prompt cache
+    billed at the cached rate. Once the cost reaches budget_usd, check_budget()
+    raises BudgetExceededError so no further requests go out. Safe to use from
+    several threads.
+    """
+
+    def __init__(self, model, budget_usd=OPENAI_BUDGET_USD):
+        self.model = model
+        self.budget_usd = budget_usd
+        self.pricing = MODEL_PRICING.get(model)
+        self._lock = threading.Lock()
+        self.stats = {
+            "calls": 0,
+            "prompt_tokens": 0,
+            "cached_tokens": 0,
+            "completion_tokens": 0,
+            "cost_usd": 0.0,
+            "compacted_descriptions": 0,
+            "compaction_chars_saved": 0,
+        }
+
+    def cost(self, prompt_tokens, cached_tokens, completion_tokens):
+        """Cost in USD of one request, or 0 when the model has no entry in MODEL_PRICING."""
+        if not self.pricing:
+            return 0.0
+        return (
+            (prompt_tokens - cached_tokens) * self.pricing["input"]
+            + cached_tokens * self.pricing.get("cached_input", self.pricing["input"])
+            + completion_tokens * self.pricing["output"]
+        ) / 1_000_000
+
+    def record(self, usage):
+        """Add the usage of one response (its `usage` object or dict; None is ignored)."""
+        if usage is None:
+            return
+        prompt_tokens = _field(usage, "prompt_tokens")
+        cached_tokens = _field(_field(usage, "prompt_tokens_details", None), "cached_tokens")
+        completion_tokens = _field(usage, "completion_tokens")
+        with self._lock:
+            self.stats["calls"] += 1
+            self.stats["prompt_tokens"] += prompt_tokens
+            self.stats["cached_tokens"] += cached_tokens
+            self.stats["completion_tokens"] += completion_tokens
+            self.stats["cost_usd"] += self.cost(prompt_tokens, cached_tokens, completion_tokens)
+
+    def record_compaction(self, original_chars, compacted_chars):
+        """Count the characters compaction removed from one job description."""
+        with self._lock:
+            self.stats["compacted_descriptions"] += 1
+            self.stats["compaction_chars_saved"] += original_chars - compacted_chars
+
+    @property
+    def exceeded(self):
+        """Whether the run has spent its budget (always False without a budget)."""
+        return self.budget_usd is not None and self.stats["cost_usd"] >= self.budget_usd
+
+    def check_budget(self, estimated_cost=0.0):
+        """Raise BudgetExceededError if the budget is spent, or would be by work estimated to cost estimated_cost."""
+        if self.exceeded:
+            raise BudgetExceededError(
+                f"OpenAI budget of ${self.budget_usd:g} reached (spent ${self.stats['cost_usd']:.4f})"
+            )
+        if self.budget_usd is not None and self.stats["cost_usd"] + estimated_cost > self.budget_usd:
+            raise BudgetExceededError(
+                f"OpenAI budget of ${self.budget_usd:g} would be exceeded (spent ${self.stats['cost_usd']:.4f}, "
+                f"estimated ${estimated_cost:.4f} more)"
+            )
+
+    def summary(self):
+        """The counters plus an estimate of the prompt tokens compaction saved per scoring."""
+        with self._lock:
+            stats = dict(self.stats)
+        stats["tokens_saved_estimate"] = stats["compaction_chars_saved"] // CHARS_PER_TOKEN
+        return stats
+
+    def summary_lines(self):
+        """Human-readable run summary, shared by the scraper's log and the scorer's output."""
+        stats = self.summary()
+        lines = [
+            f"OpenAI usage: {stats['calls']} requests, {stats['prompt_tokens']} prompt tokens "
+            f"({stats['cached_tokens']} cached), {stats['completion_tokens']} completion tokens"
+        ]
+        if self.pricing:
+            budget = f" of ${self.budget_usd:g} budget" if self.budget_usd is not None else ""
+            lines.append(f"OpenAI cost: ${stats['cost_usd']:.4f}{budget} ({self.model})")
+        else:
+            lines.append(f"OpenAI cost: unknown, no MODEL_PRICING entry for {self.model}")
+        if stats["compacted_descriptions"]:
+            lines.append(
+                f"Description compaction: {stats['compaction_chars_saved']} characters removed from "
+                f"{stats['compacted_descriptions']} descriptions (~{stats['tokens_saved_estimate']} tokens saved)"
+            )
+        if self.exceeded:
+            lines.append("Scoring stopped early: the OpenAI budget was reached")
+        return lines
@@ -1,46 +1,59 @@
-from linkedin.linkedin_bot import LinkedInBot
-import time
-from config.logging_config import log_manager
+import sys
+import json
+import argparse
+import importlib
+
+from config.config import DATA_DIR
+
+# Module each subcommand needs. It is imported only when that command runs, so
+# score/export/stats never load Selenium, and export/stats never load OpenAI.
+COMMANDS = {
+    "scrape": "linkedin.linkedin_bot",
+    "score": "linkedin.job_scorer",
+    "export": "linkedin.job_store",
+    "stats": "linkedin.job_store",
+}
+
+
+def import_command(name):
+    """Import and return the module a subcommand runs from."""
+    return importlib.import_module(COMMANDS[name])
+
+
+def scrape(args):
+    from config.logging_config import log_manager
+    LinkedInBot = import_command("scrape").LinkedInBot
 
-def main():
     logger = log_manager.get_logger(__name__)
-    
+
     # Initialize the bot
     bot = LinkedInBot()
-    
+
     try:
         # Start the browser
         logger.info("Starting browser...")
         bot.start()
-        
+
         # Attempt to login
         logger.info("Attempting to log in to LinkedIn...")
-        if not bot.login():
+        if not bot.ensure_logged_in():
             logger.error("Failed to log in to LinkedIn")
             return
-        
+
         logger.info("Successfully logged in!")
-        
-        # Search for jobs using settings from Settings.json
-        logger.info("Searching for jobs using settings...")
-        if not bot.search_jobs():
-            logger.error("Failed to find job listings")
-            return
-        
-        logger.info("Successfully found job listings!")
-        
-        # Process job listings
-        logger.info("Starting to process job listings...")
-        if not bot.process_job_listings():
+
+        # Run every keyword group x location x date range search from Settings.json
+        logger.info("Searching for jobs and processing listings using settings...")
+        if not bot.run_all_searches(resume=args.resume, incremental=args.incremental):
             logger.error("Failed to process job listings")
             return
-        
+
         logger.info("Job processing completed successfully")
 
         ## Reaching out logic here
         logger.info("Browser will remain open. Press Enter to exit when you're done.")
         input()  # Wait for user input before closing
-            
+
     except KeyboardInterrupt:
         logger.info("Shutting down due to keyboard interrupt...")
     except Exception as e:
@@ -49,5 +62,89 @@ def main():
         logger.info("Cleaning up and closing browser...")
         bot.quit()
 
+
+def score(args):
+    JobScorer = import_command("score").JobScorer
+    JobScorer(data_dir=args.data_dir).process_new_jobs(args.jobs_file, concurrency=args.concurrency, batch=args.batch)
+
+
+def export(args):
+    job_store = import_command("export")
+    output_path = job_store.export_json(args.store, args.output)
+    print(f"Exported {args.store} to {output_path}")
+
+
+def stats(args):
+    job_store = import_command("stats")
+    jobs_file = args.jobs_file or job_store.latest_jobs_file(args.data_dir)
+    if jobs_file is None:
+        print("No job description files found")
+        return
+
+    jobs = job_store.read_jobs(jobs_file)
+    print(f"Jobs file: {jobs_file} ({len(jobs)} jobs)")
+    scored_file = job_store.scored_jobs_file(jobs_file)
+    try:
+        scored = job_store.read_jobs(scored_file)
+    except FileNotFoundError:
+        scored = {}
+    scores = [job['match_score'] for job in scored.values() if isinstance(job.get('match_score'), (int, float))]
+    skipped = sum(1 for job in scored.values() if job.get('skipped_by_prefilter'))
+    print(f"Scored: {len(scores)}, skipped by pre-filter: {skipped}, "
+          f"not scored yet: {len([job_id for job_id in jobs if job_id not in scored])}")
+    if scores:
+        print(f"Match score: mean {sum(scores) / len(scores):.1f}, "
+              f"{sum(1 for value in scores if value >= args.good_score)} jobs >= {args.good_score}")
+
+    from config.config import QUERY_STATS_PATH
+    try:
+        with open(QUERY_STATS_PATH, 'r') as f:
+            queries = json.load(f).get("queries", {})
+    except (FileNotFoundError, json.JSONDecodeError):
+        queries = {}
+    if queries:
+        print("Searches by yield (average new jobs per run):")
+        for key, history in sorted(queries.items(), key=lambda item: item[1].get("yield", 0), reverse=True):
+            print(f"  {key}: {history.get('yield', 0):.1f} over {history.get('runs', 0)} runs")
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description="Search LinkedIn jobs and score them against your resume")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    scrape_parser = subparsers.add_parser("scrape", help="Search LinkedIn and score the listings (default)")
+    scrape_parser.add_argument("--resume", action="store_true", help="Continue the last interrupted run from its checkpoint")
+    scrape_parser.add_argument("--incremental", action="store_true", default=None,
+                               help="Only look for jobs posted since the last run: stop paginating at already-seen jobs")
+    scrape_parser.set_defaults(handler=scrape)
+
+    score_parser = subparsers.add_parser("score", help="Score the jobs of a run that are not scored yet")
+    score_parser.add_argument("jobs_file", nargs="?", help="Raw jobs file (defaults to the latest one)")
+    score_parser.add_argument("--data-dir", default=str(DATA_DIR))
+    score_parser.add_argument("--concurrency", type=int, help="Max concurrent scoring requests")
+    score_parser.add_argument("--batch", action="store_true", help="Score through the OpenAI Batch API")
+    score_parser.set_defaults(handler=score)
+
+    export_parser = subparsers.add_parser("export", help="Export a .jsonl job store to the legacy JSON format")
+    export_parser.add_argument("store", help="Path to a job_descriptions_*.jsonl file")
+    export_parser.add_argument("-o", "--output", help="Output JSON path (defaults to the store path with .json)")
+    export_parser.set_defaults(handler=export)
+
+    stats_parser = subparsers.add_parser("stats", help="Summarize a run and the per-search yield history")
+    stats_parser.add_argument("jobs_file", nargs="?", help="Raw jobs file (defaults to the latest one)")
+    stats_parser.add_argument("--data-dir", default=str(DATA_DIR))
+    stats_parser.add_argument("--good-score", type=float, default=7, help="Match score counted as a good job")
+    stats_parser.set_defaults(handler=stats)
+    return parser
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    # Without a subcommand (e.g. "python main.py --resume") run a scrape, as before
+    if not argv or (argv[0].startswith('-') and argv[0] not in ('-h', '--help')):
+        argv = ["scrape"] + argv
+    args = build_parser().parse_args(argv)
+    args.handler(args)
+
 if __name__ == "__main__":
     main()
@@ -0,0 +1,52 @@
+import os
+import sys
+import shutil
+import tempfile
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+# Must happen before config is imported: keep caches, indexes and logs out of the real data directory
+WORKDIR = tempfile.mkdtemp(prefix="linkedin-bot-tests-")
+os.makedirs(os.path.join(WORKDIR, "config"))
+shutil.copy(os.path.join(ROOT, "config", "settings.json"), os.path.join(WORKDIR, "config", "settings.json"))
+os.environ["DATA_DIR"] = os.path.join(WORKDIR, "data")
+os.environ.setdefault("OPENAI_API_KEY", "test")
+os.chdir(WORKDIR)
+
+from benchmarks.fake_openai import FakeOpenAIServer
+
+RESUME_TEXT = "Machine learning engineer, 5 years of Python, PyTorch, NLP and LLM systems."
+
+
+@pytest.fixture
+def fake_openai(monkeypatch):
+    server = FakeOpenAIServer(batch_delay=0.05, seed=0)
+    monkeypatch.setenv("OPENAI_BASE_URL", server.start())
+    yield server
+    server.stop()
+
+
+@pytest.fixture
+def job_matcher(fake_openai, tmp_path):
+    """JobMatcher talking to the fake OpenAI server, with its own score cache and no PDF resume."""
+    from linkedin.ai_matcher import JobMatcher
+    from linkedin.score_cache import ScoreCache
+
+    matcher = JobMatcher()
+    matcher._resume_text = RESUME_TEXT
+    matcher._my_needs = "Remote ML roles"
+    matcher.score_cache = ScoreCache(str(tmp_path / "score_cache.sqlite3"))
+    return matcher
+
+
+def fixture_jobs(count, seed=0):
+    """{job_id: job data} built from the fake LinkedIn's generated postings."""
+    from benchmarks.fake_linkedin import synthetic_jobs
+
+    return {
+        f"job-{linkedin_job_id}": {**job, "linkedin_job_id": linkedin_job_id}
+        for linkedin_job_id, job in synthetic_jobs(count, seed).items()
+    }
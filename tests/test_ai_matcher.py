@@ -0,0 +1,79 @@
+import json
+import asyncio
+
+import pytest
+
+import benchmarks.fake_openai as fake_openai_module
+import linkedin.ai_matcher as ai_matcher
+from tests.conftest import fixture_jobs
+
+
+def descriptions(count, seed=0):
+    return {job_id: job["job_description"] for job_id, job in fixture_jobs(count, seed).items()}
+
+
+def test_multi_job_request_scores_every_job_in_one_call(job_matcher, fake_openai):
+    jobs = descriptions(4)
+    results = job_matcher.get_match_scores(jobs)
+
+    assert set(results) == set(jobs)
+    assert all(isinstance(score, int) for score in results.values())
+    assert fake_openai.stats["chat_completions"] == 1
+
+
+def test_malformed_entries_fall_back_to_single_requests(job_matcher, fake_openai, monkeypatch):
+    original = fake_openai_module.fake_completion
+
+    def drop_first_result(body):
+        response = original(body)
+        content = json.loads(response["choices"][0]["message"]["content"])
+        if "results" in content:
+            content["results"] = content["results"][1:]
+            response["choices"][0]["message"]["content"] = json.dumps(content)
+        return response
+
+    monkeypatch.setattr(fake_openai_module, "fake_completion", drop_first_result)
+    jobs = descriptions(3)
+    results = job_matcher.get_match_scores(jobs)
+
+    assert all(isinstance(score, int) for score in results.values())
+    assert fake_openai.stats["chat_completions"] == 2
+
+
+@pytest.mark.parametrize("use_async", [False, True])
+def test_failed_multi_job_request_is_not_fanned_out(job_matcher, fake_openai, monkeypatch, use_async):
+    monkeypatch.setattr(ai_matcher, "OPENAI_MAX_RETRIES", 0)
+    fake_openai.error_rate = 1.0
+    jobs = descriptions(4)
+    if use_async:
+        results = asyncio.run(job_matcher.get_match_scores_async(jobs))
+    else:
+        results = job_matcher.get_match_scores(jobs)
+
+    assert all(isinstance(result, Exception) for result in results.values())
+    assert fake_openai.stats["chat_completions"] == 1
+
+
+def test_compaction_savings_count_only_descriptions_sent_to_the_model(job_matcher):
+    description = "Requirements\n\n" + "Five years of Python and PyTorch in production. " * 10 + \
+        "\n\nBenefits\n\nHealth insurance, a learning budget and flexible hours for everyone."
+    job_matcher.cluster_id(description)  # What recording a scraped job does
+    assert job_matcher.usage.stats["compacted_descriptions"] == 0
+
+    job_matcher.get_match_score(description)
+    job_matcher.get_match_score(description)  # Cached: no second prompt
+
+    assert job_matcher.usage.stats["compacted_descriptions"] == 1
+    assert job_matcher.usage.stats["compaction_chars_saved"] > 0
+
+
+def test_malformed_reply_fallback_counts_one_cache_miss_per_job(job_matcher, monkeypatch):
+    monkeypatch.setattr(fake_openai_module, "fake_completion",
+                        lambda body: {"choices": [{"message": {"content": json.dumps({"match_score": 5})}}],
+                                      "usage": {"prompt_tokens": 1, "completion_tokens": 1}})
+    jobs = descriptions(3)
+
+    results = job_matcher.get_match_scores(jobs)
+
+    assert all(score == 5 for score in results.values())
+    assert job_matcher.cache_stats()["misses"] == 3
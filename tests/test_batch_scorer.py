@@ -0,0 +1,80 @@
+import os
+
+import pytest
+
+from linkedin.batch_scorer import BatchScorer, BatchScoringError
+from linkedin.usage import BudgetExceededError
+from tests.conftest import fixture_jobs
+
+
+def run_batch(job_matcher, tmp_path, jobs, **kwargs):
+    state_file = str(tmp_path / "batch_state.json")
+    scorer = BatchScorer(job_matcher, state_file, poll_interval=0.02, **kwargs)
+    results = {}
+    scorer.score(jobs, on_result=lambda job_id, result: results.__setitem__(job_id, result))
+    return scorer, results
+
+
+def test_submit_poll_and_merge_completed_batch(job_matcher, fake_openai, tmp_path):
+    jobs = fixture_jobs(6)
+    scorer, results = run_batch(job_matcher, tmp_path, jobs)
+
+    assert set(results) == set(jobs)
+    assert all(isinstance(score, (int, float)) and 0 <= score <= 10 for score in results.values())
+    assert fake_openai.stats["batch_creates"] == 1
+    assert fake_openai.stats["batch_requests"] == 6
+    assert not os.path.exists(scorer.state_file)
+    # Scores went into the cache, so a second run needs no batch at all
+    _, again = run_batch(job_matcher, tmp_path, jobs)
+    assert again == results
+    assert fake_openai.stats["batch_creates"] == 1
+
+
+def test_failed_batch_is_cleared_and_resubmitted(job_matcher, fake_openai, tmp_path):
+    fake_openai.batch_outcomes = ["failed"]
+    jobs = fixture_jobs(4)
+    scorer, results = run_batch(job_matcher, tmp_path, jobs)
+
+    assert set(results) == set(jobs)
+    assert fake_openai.stats["batch_creates"] == 2
+    assert not os.path.exists(scorer.state_file)
+
+
+def test_expired_batch_keeps_partial_results_and_resubmits_the_rest(job_matcher, fake_openai, tmp_path):
+    fake_openai.batch_outcomes = ["expired"]
+    jobs = fixture_jobs(6)
+    _, results = run_batch(job_matcher, tmp_path, jobs)
+
+    assert set(results) == set(jobs)
+    assert fake_openai.stats["batch_requests"] == 6  # 3 answered before expiry, 3 resubmitted
+
+
+def test_gives_up_after_max_resubmits_without_leaving_state(job_matcher, fake_openai, tmp_path):
+    fake_openai.batch_outcomes = ["failed", "failed"]
+    with pytest.raises(BatchScoringError):
+        run_batch(job_matcher, tmp_path, fixture_jobs(3), max_resubmits=1)
+    assert not os.path.exists(tmp_path / "batch_state.json")
+
+    # The next run starts a fresh batch instead of re-polling the dead one
+    _, results = run_batch(job_matcher, tmp_path, fixture_jobs(3))
+    assert len(results) == 3
+    assert fake_openai.stats["batch_creates"] == 3
+
+
+def test_batch_over_budget_is_not_submitted(job_matcher, fake_openai, tmp_path):
+    job_matcher.usage.budget_usd = 0.0001
+    jobs = fixture_jobs(4)
+    scorer, results = run_batch(job_matcher, tmp_path, jobs)
+
+    assert set(results) == set(jobs)
+    assert all(isinstance(error, BudgetExceededError) for error in results.values())
+    assert fake_openai.stats["batch_creates"] == 0
+    assert not os.path.exists(scorer.state_file)
+
+
+def test_batch_within_budget_is_submitted(job_matcher, fake_openai, tmp_path):
+    job_matcher.usage.budget_usd = 1.0
+    _, results = run_batch(job_matcher, tmp_path, fixture_jobs(4))
+
+    assert not any(isinstance(result, Exception) for result in results.values())
+    assert fake_openai.stats["batch_creates"] == 1
@@ -0,0 +1,41 @@
+from types import SimpleNamespace
+
+import pytest
+
+from linkedin.browser_manager import BrowserManager
+
+
+class RecordingDriver:
+    """Stand-in WebDriver that tracks the driver-wide script timeout."""
+
+    def __init__(self, script_timeout=30, error=None):
+        self.script_timeout = script_timeout
+        self.timeouts_during_script = []
+        self.error = error
+
+    @property
+    def timeouts(self):
+        return SimpleNamespace(script=self.script_timeout)
+
+    def set_script_timeout(self, seconds):
+        self.script_timeout = seconds
+
+    def execute_async_script(self, script, *args):
+        self.timeouts_during_script.append(self.script_timeout)
+        if self.error:
+            raise self.error
+        return {"count": 25, "job_ids": [], "timed_out": False}
+
+
+@pytest.mark.parametrize("error", [None, RuntimeError("script failed")])
+def test_card_loader_restores_the_script_timeout(error):
+    manager = BrowserManager()
+    manager.driver = RecordingDriver(script_timeout=30, error=error)
+
+    if error:
+        with pytest.raises(RuntimeError):
+            manager.load_all_job_cards("//ul", "//li", quiet_ms=100, timeout=10)
+    else:
+        assert manager.load_all_job_cards("//ul", "//li", quiet_ms=100, timeout=10)["count"] == 25
+    assert manager.driver.timeouts_during_script == [15]
+    assert manager.driver.script_timeout == 30
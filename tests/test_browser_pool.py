@@ -0,0 +1,70 @@
+import threading
+
+from linkedin.browser_pool import PageScheduler, results_page_url
+
+
+def drain(scheduler):
+    offsets = []
+    while (offset := scheduler.next_offset()) is not None:
+        offsets.append(offset)
+    return offsets
+
+
+def test_results_page_url_replaces_the_start_parameter():
+    url = "https://www.linkedin.com/jobs/search/?keywords=ml&start=50&location=NYC"
+    assert results_page_url(url, 0) == "https://www.linkedin.com/jobs/search/?keywords=ml&location=NYC"
+    assert results_page_url(url, 75).endswith("keywords=ml&location=NYC&start=75")
+
+
+def test_hands_out_every_page_up_to_the_total_once():
+    scheduler = PageScheduler(total_jobs=110, page_size=25, max_pages=40)
+    assert drain(scheduler) == [0, 25, 50, 75, 100]
+
+
+def test_max_pages_caps_the_pages_handed_out():
+    assert drain(PageScheduler(total_jobs=1000, page_size=25, max_pages=3)) == [0, 25, 50]
+
+
+def test_skips_completed_pages():
+    scheduler = PageScheduler(total_jobs=100, page_size=25, max_pages=40, skip_offsets={0, 50})
+    assert drain(scheduler) == [25, 75]
+
+
+def test_failed_pages_come_back_first_until_out_of_retries():
+    scheduler = PageScheduler(total_jobs=100, page_size=25, max_pages=40, max_retries=1)
+    assert scheduler.next_offset() == 0
+    assert scheduler.retry(0)
+    assert scheduler.next_offset() == 0
+    assert not scheduler.retry(0)
+    assert scheduler.next_offset() == 25
+
+
+def test_mark_end_stops_an_open_ended_search():
+    scheduler = PageScheduler(total_jobs=None, page_size=25, max_pages=40)
+    assert [scheduler.next_offset(), scheduler.next_offset()] == [0, 25]
+    scheduler.mark_end(25)
+    assert scheduler.next_offset() is None
+
+
+def test_cancel_stops_handing_out_pages():
+    scheduler = PageScheduler(total_jobs=100, page_size=25, max_pages=40)
+    scheduler.cancel()
+    assert scheduler.next_offset() is None
+
+
+def test_concurrent_workers_never_get_the_same_page():
+    scheduler = PageScheduler(total_jobs=25 * 200, page_size=25, max_pages=200)
+    taken = []
+    lock = threading.Lock()
+
+    def worker():
+        for offset in iter(scheduler.next_offset, None):
+            with lock:
+                taken.append(offset)
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert sorted(taken) == list(range(0, 25 * 200, 25))
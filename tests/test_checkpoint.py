@@ -0,0 +1,64 @@
+import json
+
+from linkedin.checkpoint import RunCheckpoint
+
+TASK = {"key": "python|Remote|r86400", "keywords": "python", "location": "Remote", "date_posted": "r86400"}
+OTHER_TASK = {"key": "ml|Remote|r86400", "keywords": "ml", "location": "Remote", "date_posted": "r86400"}
+
+
+def test_round_trip(tmp_path):
+    path = str(tmp_path / "checkpoint.json")
+    checkpoint = RunCheckpoint(path, run_timestamp="20260101_000000", interval=0)
+    checkpoint.start_search(TASK)
+    checkpoint.page_done(0)
+    checkpoint.page_done(25)
+    checkpoint.job_recorded("123")
+
+    loaded = RunCheckpoint.load(path)
+    assert loaded.resumed
+    assert loaded.run_timestamp == "20260101_000000"
+    assert loaded.current_search == TASK
+    assert loaded.completed_offsets == {0, 25}
+    assert loaded.processed_job_ids == {"123"}
+    assert loaded.resume_offset(25) == 50
+
+
+def test_start_search_keeps_pages_only_for_the_same_search(tmp_path):
+    checkpoint = RunCheckpoint(str(tmp_path / "checkpoint.json"))
+    checkpoint.start_search(TASK)
+    checkpoint.page_done(0)
+
+    checkpoint.start_search(TASK)
+    assert checkpoint.resume_offset(25) == 25
+    checkpoint.start_search(OTHER_TASK)
+    assert checkpoint.resume_offset(25) == 0
+
+
+def test_search_done(tmp_path):
+    checkpoint = RunCheckpoint(str(tmp_path / "checkpoint.json"))
+    checkpoint.start_search(TASK)
+    checkpoint.page_done(0)
+    checkpoint.search_done(TASK)
+    checkpoint.search_done(TASK)
+
+    assert checkpoint.completed_searches == [TASK["key"]]
+    assert checkpoint.current_search is None
+    assert checkpoint.completed_offsets == set()
+
+
+def test_unreadable_or_outdated_checkpoint_is_ignored(tmp_path):
+    path = tmp_path / "checkpoint.json"
+    assert RunCheckpoint.load(str(path)) is None
+    path.write_text("{not json")
+    assert RunCheckpoint.load(str(path)) is None
+    path.write_text(json.dumps({"version": 0, "run_timestamp": "x"}))
+    assert RunCheckpoint.load(str(path)) is None
+
+
+def test_clear(tmp_path):
+    path = tmp_path / "checkpoint.json"
+    checkpoint = RunCheckpoint(str(path))
+    checkpoint.save()
+    checkpoint.clear()
+    checkpoint.clear()
+    assert not path.exists()
@@ -0,0 +1,85 @@
+import pytest
+
+from benchmarks.fake_linkedin import load_fixtures
+from linkedin.description_compactor import compact_description, MIN_COMPACTED_WORDS
+from linkedin.job_fetcher import parse_job_posting
+
+ROLE = ("We are hiring a senior backend engineer to design and run the payment services that move money "
+        "for millions of customers, working closely with product, data and infrastructure teams.")
+
+
+def recorded_description(linkedin_job_id):
+    recorded, _ = load_fixtures()
+    return parse_job_posting(recorded[linkedin_job_id], linkedin_job_id)["job_description"]
+
+
+@pytest.mark.parametrize("heading", ["About the job", "About the role", "About you", "About Contoso"])
+def test_about_sections_describing_the_job_are_kept(heading):
+    description = f"{heading}\n\n{ROLE}\n\nAbout us\n\nContoso was founded in 1999 and has offices worldwide."
+
+    compacted = compact_description(description)
+
+    assert ROLE in compacted
+    assert "founded in 1999" not in compacted
+
+
+def test_recorded_posting_keeps_the_role_summary():
+    description = recorded_description("3912345678")
+
+    compacted = compact_description(description)
+
+    assert "Senior Machine Learning Engineer" in compacted
+    assert "5+ years of experience in Python" in compacted
+
+
+def test_recorded_posting_loses_its_eeo_sentence():
+    description = recorded_description("3912345679")
+
+    compacted = compact_description(description)
+
+    assert "equal opportunity employer" not in compacted
+    assert "8+ years of data engineering experience" in compacted
+    assert len(compacted) < len(description)
+
+
+def test_requirements_are_kept_when_the_description_is_cut():
+    filler = "Our team ships often and talks to customers every week. " * 40
+    description = f"Overview\n\n{filler}\n\nRequirements\n\n- 5+ years of Go\n- Kubernetes in production"
+
+    compacted = compact_description(description, max_chars=500)
+
+    assert len(compacted) <= 500
+    assert "- Kubernetes in production" in compacted
+
+
+def test_description_that_is_all_boilerplate_is_left_as_is():
+    description = ("About us\n\nWe build software.\n\nBenefits\n\nHealth insurance and a generous learning budget.\n\n"
+                   "Equal Opportunity\n\nWe welcome everyone.")
+
+    compacted = compact_description(description)
+
+    assert compacted == description
+    assert len(compacted.split()) < MIN_COMPACTED_WORDS
+
+
+@pytest.mark.parametrize("max_chars", range(150, 260, 7))
+def test_cutting_never_eats_into_requirements_that_fit(max_chars):
+    requirements = "Requirements\n\n- 5+ years of Go\n- Kubernetes in production\n- Postgres tuning"
+    description = (f"Overview\n\n{'Ourteamshipsoften' * 6} and talks to customers every single week.\n\n"
+                   f"{requirements}\n\nThe team\n\nWe work across three time zones with a small platform group.")
+
+    compacted = compact_description(description, max_chars=max_chars)
+
+    assert len(compacted) <= max_chars
+    assert "Requirements\n- 5+ years of Go\n- Kubernetes in production\n- Postgres tuning" in compacted
+
+
+def test_requirements_longer_than_the_limit_are_cut_last():
+    requirements = "Requirements\n\n" + " ".join(f"skill{i}" for i in range(100))
+    description = f"Overview\n\n{'Some context about the team. ' * 10}\n\n{requirements}"
+
+    compacted = compact_description(description, max_chars=300)
+
+    assert len(compacted) <= 300
+    assert compacted.startswith("Requirements\nskill0 skill1")
+    assert compacted.endswith(" ...")
@@ -0,0 +1,123 @@
+import os
+
+import pytest
+from selenium.common.exceptions import JavascriptException
+from selenium.webdriver.common.by import By
+
+from benchmarks.fake_linkedin import FakeLinkedInServer
+from config.config import CHROME_BINARY_PATH, SELECTORS
+from linkedin.browser_manager import BrowserManager, StaleDetailPaneError
+from linkedin.linkedin_bot import LinkedInBot
+
+SERVER = FakeLinkedInServer(seed=0, job_count=3)
+JOB_IDS = sorted(SERVER.jobs)
+
+
+def details(job_id):
+    job = SERVER.jobs[job_id]
+    return {"company_name": job["company_name"], "company_url": None, "job_title": job["job_title"],
+            "job_url": f"/jobs/view/{job_id}/", "job_description": job["job_description"],
+            "linkedin_job_id": job_id}
+
+
+class PaneDriver:
+    """Stands in for the fake LinkedIn search page's detail pane, evaluating the extraction scripts in Python.
+
+    The pane keeps showing the previous job for switch_after polls after a card was clicked.
+    """
+
+    def __init__(self, shown, switch_after=0, script_error=None):
+        self.shown = shown
+        self.next_job = None
+        self.switch_after = switch_after
+        self.script_error = script_error
+        self.calls = 0
+
+    def click(self, job_id):
+        self.next_job = job_id
+
+    def execute_script(self, script, selectors, *args):
+        self.calls += 1
+        if self.script_error:
+            raise self.script_error
+        if self.next_job and self.calls > self.switch_after:
+            self.shown, self.next_job = self.next_job, None
+        pane = details(self.shown)
+        if args:  # The readiness poll: only the requested job counts
+            return pane if pane["linkedin_job_id"] == args[0] else None
+        return pane
+
+
+def test_detail_wait_skips_the_previous_jobs_pane():
+    manager = BrowserManager()
+    manager.driver = PaneDriver(shown=JOB_IDS[0], switch_after=3)
+    manager.driver.click(JOB_IDS[1])
+
+    assert manager.wait_for_job_detail(JOB_IDS[1], SELECTORS["jobs"], timeout=5) == details(JOB_IDS[1])
+    assert manager.driver.calls == 4
+
+
+def test_detail_wait_gives_up_on_a_pane_that_never_switches():
+    manager = BrowserManager()
+    manager.driver = PaneDriver(shown=JOB_IDS[0])
+
+    with pytest.raises(StaleDetailPaneError):
+        manager.wait_for_job_detail(JOB_IDS[1], SELECTORS["jobs"], timeout=0.3)
+
+
+class Element:
+    def __init__(self, text, href=None):
+        self.text = text
+        self.href = href
+
+    def get_attribute(self, name):
+        return self.href if name == "href" else None
+
+
+class PaneBrowser(BrowserManager):
+    """BrowserManager whose per-field waits read the emulated pane."""
+
+    def wait_for_element(self, locator, timeout=None):
+        pane = details(self.driver.shown)
+        return {
+            SELECTORS["jobs"]["company_name"]: Element(pane["company_name"], "https://www.linkedin.com/company/x/"),
+            SELECTORS["jobs"]["job_title"]: Element(pane["job_title"], f"https://www.linkedin.com/jobs/view/{pane['linkedin_job_id']}/"),
+            SELECTORS["jobs"]["job_description"]: Element(pane["job_description"]),
+        }[locator[1]]
+
+
+def test_extraction_falls_back_to_per_field_reads_when_the_script_fails():
+    bot = LinkedInBot()
+    bot.browser = PaneBrowser()
+    bot.browser.driver = bot.driver = PaneDriver(shown=JOB_IDS[2], script_error=JavascriptException("CSP blocked eval"))
+
+    extracted = bot._extract_job_details()
+
+    assert bot.browser.driver.calls == 1
+    assert extracted["job_description"] == SERVER.jobs[JOB_IDS[2]]["job_description"]
+    assert extracted["linkedin_job_id"] == JOB_IDS[2]
+    assert extracted["company_url"] == "https://www.linkedin.com/company/x/"
+
+
+@pytest.mark.skipif(not os.path.exists(CHROME_BINARY_PATH), reason="Chrome for Testing is not installed")
+def test_detail_wait_in_chrome_against_the_fake_server():
+    server = FakeLinkedInServer(seed=0, job_count=10, pane_delay=0.5)
+    server.start()
+    browser = BrowserManager()
+    try:
+        browser.initialize_browser(profile_dir=None, lean=True)
+        browser.driver.get(f"{server.base_url}/jobs/search/?keywords=ml")
+        cards = browser.driver.find_elements(By.XPATH, SELECTORS["jobs"]["job_cards"])
+        first, second = (browser.get_card_job_id(card) for card in cards[:2])
+
+        cards[0].click()
+        assert browser.wait_for_job_detail(first, SELECTORS["jobs"])["linkedin_job_id"] == first
+        cards[1].click()
+        assert (browser.extract_job_details(SELECTORS["jobs"]) or {}).get("linkedin_job_id") != second  # Not rendered yet
+        assert browser.wait_for_job_detail(second, SELECTORS["jobs"])["linkedin_job_id"] == second
+        cards[0].click()
+        with pytest.raises(StaleDetailPaneError):
+            browser.wait_for_job_detail(first, SELECTORS["jobs"], timeout=0.1)
+    finally:
+        browser.quit()
+        server.stop()
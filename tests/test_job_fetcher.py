@@ -0,0 +1,62 @@
+import pytest
+
+from benchmarks.fake_linkedin import FakeLinkedInServer, load_fixtures
+from linkedin.job_fetcher import JobDetailFetcher, JobFetchError, parse_job_posting
+
+
+@pytest.fixture
+def fake_linkedin():
+    server = FakeLinkedInServer(seed=0)
+    server.start()
+    yield server
+    server.stop()
+
+
+@pytest.fixture
+def fetcher(fake_linkedin):
+    fetcher = JobDetailFetcher(base_url=fake_linkedin.base_url, workers=4, timeout=5)
+    yield fetcher
+    fetcher.close()
+
+
+def test_parses_a_recorded_linkedin_posting():
+    recorded, _ = load_fixtures()
+    details = parse_job_posting(recorded["3912345678"], "3912345678", "https://www.linkedin.com")
+
+    assert details["job_title"] == "Senior Machine Learning Engineer"
+    assert details["company_name"] == "Northwind Analytics"
+    assert details["company_url"].startswith("https://www.linkedin.com/company/northwind-analytics")
+    assert "3912345678" in details["job_url"]
+    assert details["linkedin_job_id"] == "3912345678"
+    # Block elements become line breaks and whitespace is collapsed like innerText
+    assert "About the role\n\nWe are looking for" in details["job_description"]
+    assert "  " not in details["job_description"]
+
+
+def test_missing_fields_parse_as_none():
+    details = parse_job_posting("<html><body><p>Nothing here</p></body></html>", 1)
+    assert details["job_title"] is None and details["job_description"] is None
+
+
+def test_fetches_recorded_and_templated_jobs(fetcher, fake_linkedin):
+    for job_id in ("3912345679", "3912345681"):
+        details = fetcher.fetch(job_id)
+        assert details["job_title"] and details["company_name"] and details["job_description"]
+        assert details["linkedin_job_id"] == job_id
+    assert fake_linkedin.stats["job_postings"] == 2
+
+
+def test_http_errors_and_empty_pages_raise_job_fetch_error(fetcher, fake_linkedin):
+    with pytest.raises(JobFetchError):
+        fetcher.fetch("1")  # 404
+    fake_linkedin.error_rate = 1.0
+    with pytest.raises(JobFetchError):
+        fetcher.fetch("3912345678")
+
+
+def test_fetch_many_yields_details_or_errors(fetcher):
+    results = dict(fetcher.fetch_many(["3912345678", "3912345680", "1"]))
+
+    assert results["3912345678"]["company_name"] == "Northwind Analytics"
+    assert results["3912345680"]["job_title"] == "Frontend Engineer (React)"
+    assert isinstance(results["1"], JobFetchError)
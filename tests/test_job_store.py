@@ -0,0 +1,52 @@
+import json
+import os
+
+from config.config import DATA_DIR
+from linkedin.job_store import JobStore, export_json, latest_jobs_file, read_jobs
+from main import build_parser
+
+
+def test_run_files_are_found_in_data_dir_from_any_working_directory(tmp_path, monkeypatch):
+    path = os.path.join(DATA_DIR, "job_descriptions_20990101_000000.jsonl")
+    store = JobStore(path)
+    store.close()
+    monkeypatch.chdir(tmp_path)
+    try:
+        assert latest_jobs_file() == path
+        assert build_parser().parse_args(["stats"]).data_dir == str(DATA_DIR)
+    finally:
+        os.remove(path)
+
+
+def test_a_torn_tail_is_skipped_and_the_next_append_starts_a_new_line(tmp_path):
+    path = str(tmp_path / "jobs.jsonl")
+    store = JobStore(path)
+    store.append("1", {"job_title": "Engineer"})
+    store.close()
+    with open(path, "a", encoding="utf-8") as f:
+        f.write('{"job_id": "2", "job_ti')
+
+    store = JobStore(path)
+    store.append("3", {"job_title": "Scientist"})
+    store.close()
+
+    with open(path, encoding="utf-8") as f:
+        assert f.read().splitlines()[-1] == '{"job_id": "3", "job_title": "Scientist"}'
+    assert read_jobs(path) == {"1": {"job_title": "Engineer"}, "3": {"job_title": "Scientist"}}
+
+
+def test_export_json_writes_the_last_record_per_job(tmp_path):
+    path = str(tmp_path / "job_descriptions_20990101_000000.jsonl")
+    store = JobStore(path)
+    store.append("1", {"job_title": "Engineer"})
+    store.append("2", {"job_title": "Ingénieur"})
+    store.append("1", {"job_title": "Senior Engineer"})
+    store.close()
+
+    output_path = export_json(path)
+
+    assert output_path == str(tmp_path / "job_descriptions_20990101_000000.json")
+    assert not os.path.exists(output_path + ".tmp")
+    with open(output_path, encoding="utf-8") as f:
+        assert json.load(f) == {"1": {"job_title": "Senior Engineer"}, "2": {"job_title": "Ingénieur"}}
+    assert read_jobs(output_path) == read_jobs(path)
@@ -0,0 +1,318 @@
+import threading
+
+import pytest
+
+from linkedin.linkedin_bot import LinkedInBot
+from linkedin.job_store import JobStore, read_jobs
+from linkedin.seen_jobs import SeenJobIndex
+from tests.conftest import fixture_jobs
+
+
+@pytest.fixture
+def bot(job_matcher, tmp_path):
+    """A bot without a browser, set up the way process_job_listings sets up a run (inline scoring)."""
+    bot = LinkedInBot()
+    bot.job_matcher = job_matcher
+    bot.seen_jobs = SeenJobIndex(str(tmp_path / "seen_jobs.sqlite3"))
+    bot._scoring_pipeline = None
+    bot._prefilter = None
+    bot._checkpoint = None
+    bot._stats_lock = threading.Lock()
+    bot._run_stats = {"processed": 0, "failed": 0, "known": 0, "duplicates": 0, "cutoffs": 0, "over_budget": 0}
+    bot._run_job_ids = set()
+    bot._high_water_ids = set()
+    bot._search_new_ids = []
+    bot._total_jobs = "unknown"
+    bot._jobs_store = JobStore(str(tmp_path / "jobs.jsonl"))
+    bot._scored_store = JobStore(str(tmp_path / "scored.jsonl"))
+    yield bot
+    bot._jobs_store.close()
+    bot._scored_store.close()
+
+
+def test_scored_job_is_marked_seen(bot, tmp_path):
+    job_id, job = next(iter(fixture_jobs(1).items()))
+    bot._record_job(job_id, job)
+
+    assert bot.seen_jobs.is_known(job["linkedin_job_id"])
+    assert read_jobs(str(tmp_path / "scored.jsonl"))[job_id]["match_score"] is not None
+
+
+def test_job_whose_scoring_fails_is_not_marked_seen(bot, fake_openai, monkeypatch):
+    import linkedin.ai_matcher as ai_matcher
+    monkeypatch.setattr(ai_matcher, "OPENAI_MAX_RETRIES", 0)
+    fake_openai.error_rate = 1.0
+    job_id, job = next(iter(fixture_jobs(1).items()))
+
+    with pytest.raises(Exception):
+        bot._record_job(job_id, job)
+    assert not bot.seen_jobs.is_known(job["linkedin_job_id"])
+
+
+def test_job_left_unscored_by_the_budget_is_not_marked_seen(bot):
+    bot.job_matcher.usage.budget_usd = 0
+    job_id, job = next(iter(fixture_jobs(1).items()))
+    bot._record_job(job_id, job)
+
+    assert bot._run_stats["over_budget"] == 1
+    assert not bot.seen_jobs.is_known(job["linkedin_job_id"])
+
+
+class FakeDriver:
+    def __init__(self, current_url):
+        self.current_url = current_url
+        self.visited = []
+
+    def get(self, url):
+        self.visited.append(url)
+        self.current_url = url
+
+
+class FakeBrowser:
+    """Renders whichever job's /jobs/view page the driver is on, from the fake LinkedIn's jobs."""
+
+    def __init__(self, driver, jobs):
+        self.driver = driver
+        self.jobs = jobs
+
+    def wait_for_element(self, locator):
+        return True
+
+    def extract_job_details(self, selectors):
+        job = self.jobs[self.driver.current_url.rstrip("/").rsplit("/", 1)[-1]]
+        return {"company_name": job["company_name"], "company_url": None, "job_title": job["job_title"],
+                "job_url": None, "job_description": job["job_description"]}
+
+
+def test_direct_fetch_falls_back_to_the_job_page(bot, monkeypatch):
+    from benchmarks.fake_linkedin import FakeLinkedInServer
+    from linkedin.job_fetcher import JobDetailFetcher
+    import linkedin.linkedin_bot as linkedin_bot
+
+    server = FakeLinkedInServer(seed=0, job_count=4)
+    server.start()
+    monkeypatch.setattr(linkedin_bot, "LINKEDIN_BASE_URL", server.base_url)
+    results_url = f"{server.base_url}/jobs/search/?keywords=ml"
+    bot.driver = FakeDriver(results_url)
+    bot.browser = FakeBrowser(bot.driver, server.jobs)
+    fetcher = JobDetailFetcher(base_url=server.base_url, timeout=5)
+    try:
+        fetched_id, failing_id = sorted(server.jobs)[:2]
+        # No posting fragment for this job, so the HTTP fetch 404s
+        monkeypatch.setattr(server, "render_job_posting",
+                            lambda job_id: None if job_id == failing_id else FakeLinkedInServer.render_job_posting(server, job_id))
+        bot._process_cards_directly([(None, fetched_id), (None, failing_id)], fetcher)
+    finally:
+        fetcher.close()
+        server.stop()
+
+    recorded = {job["linkedin_job_id"] for job in read_jobs(bot._jobs_store.path).values()}
+    assert recorded == {fetched_id, failing_id}
+    assert bot.driver.visited[0].endswith(f"/jobs/view/{failing_id}/")
+    assert bot.driver.current_url == results_url  # Back on the results list for pagination
+    assert bot._run_stats["failed"] == 0
+
+
+class ListScheduler:
+    def __init__(self, tasks):
+        self.tasks = tasks
+        self.recorded = []
+
+    def __iter__(self):
+        return iter(self.tasks)
+
+    def __len__(self):
+        return len(self.tasks)
+
+    def high_water_ids(self, task):
+        return set()
+
+    def record(self, task, **counts):
+        self.recorded.append(task["key"])
+
+
+def test_search_that_found_nothing_is_not_marked_finished(bot, tmp_path, monkeypatch):
+    from linkedin.checkpoint import RunCheckpoint
+    tasks = [
+        {"key": key, "keywords": key, "location": "Remote", "date_posted": "r86400"}
+        for key in ("works", "fails")
+    ]
+    bot._checkpoint = RunCheckpoint(str(tmp_path / "checkpoint.json"))
+    bot._incremental = False
+    monkeypatch.setattr(bot, "search_jobs", lambda keywords, *args, **kwargs: keywords == "works")
+    monkeypatch.setattr(bot, "_process_search_results", lambda fetcher: None)
+    scheduler = ListScheduler(tasks)
+
+    bot._run_searches(scheduler)
+
+    assert bot._checkpoint.completed_searches == ["works"]
+    assert scheduler.recorded == ["works", "fails"]
+
+
+def test_search_jobs_works_outside_a_run():
+    bot = LinkedInBot()
+    bot.driver = FakeDriver("about:blank")
+    bot.browser = FakeBrowser(bot.driver, {})
+
+    assert bot.search_jobs("python", "Remote", search_mode="url", date_posted="past_24_hours")
+    assert "keywords=python" in bot.driver.visited[0]
+    assert "sortBy" not in bot.driver.visited[0]
+
+
+class CookieJarBrowser:
+    def __init__(self, cookies_loaded):
+        self.cookies_loaded = cookies_loaded
+        self.saved = []
+
+    def load_cookies(self, path):
+        return self.cookies_loaded
+
+    def save_cookies(self, path):
+        self.saved.append(path)
+
+
+def test_login_skips_the_session_probe_without_saved_cookies(monkeypatch):
+    import linkedin.linkedin_bot as linkedin_bot
+    monkeypatch.setattr(linkedin_bot, "SESSION_REUSE", True)
+    monkeypatch.setattr(linkedin_bot, "CHROME_PROFILE_DIR", None)
+    bot = LinkedInBot()
+    bot.browser = CookieJarBrowser(cookies_loaded=0)
+    monkeypatch.setattr(bot, "_session_is_valid", lambda: pytest.fail("probed the feed without a session"))
+    monkeypatch.setattr(bot, "login", lambda: True)
+
+    assert bot.ensure_logged_in()
+    assert bot.browser.saved
+
+
+def test_login_reuses_a_saved_session(monkeypatch):
+    import linkedin.linkedin_bot as linkedin_bot
+    monkeypatch.setattr(linkedin_bot, "SESSION_REUSE", True)
+    monkeypatch.setattr(linkedin_bot, "CHROME_PROFILE_DIR", None)
+    bot = LinkedInBot()
+    bot.browser = CookieJarBrowser(cookies_loaded=3)
+    monkeypatch.setattr(bot, "_session_is_valid", lambda: True)
+    monkeypatch.setattr(bot, "login", lambda: pytest.fail("logged in again"))
+
+    assert bot.ensure_logged_in()
+    assert not bot.browser.saved
+
+
+def cards(*job_ids):
+    return [(None, job_id) for job_id in job_ids]
+
+
+def test_incremental_search_stops_at_jobs_from_earlier_runs(bot, monkeypatch):
+    import linkedin.linkedin_bot as linkedin_bot
+    monkeypatch.setattr(linkedin_bot, "INCREMENTAL_SEEN_THRESHOLD", 3)
+    bot._incremental = True
+    bot._high_water_ids = {"h1", "h2", "h3"}
+    bot.seen_jobs.mark_seen("s1")
+    pages = [cards("n1", "n2", "h1"), cards("h2", "s1", "n3"), cards("n4"), cards("n5")]
+    processed = []
+    monkeypatch.setattr(bot, "_get_job_cards_on_current_page", lambda: pages[len(processed)])
+    monkeypatch.setattr(bot, "_process_cards", lambda job_cards, fetcher=None: processed.append(job_cards))
+    monkeypatch.setattr(bot, "_has_next_page", lambda: True)
+    monkeypatch.setattr(bot, "_go_to_next_page", lambda: True)
+
+    bot._process_pages_in_order()
+
+    # h1 at the end of page 1 plus h2, s1 on page 2 make three seen jobs in a row
+    assert processed == pages[:2]
+    assert bot._run_stats["cutoffs"] == 1
+
+
+def test_jobs_found_by_another_search_this_run_do_not_stop_pagination(bot):
+    bot._incremental = True
+    bot._run_job_ids = {"a", "b"}
+    bot.seen_jobs.mark_seen("a")  # Marked once scored earlier in this run
+    bot.seen_jobs.mark_seen("b")
+
+    assert bot._reached_seen_jobs(cards("a", "b")) == (False, 0)
+    assert bot._reached_seen_jobs(cards("a", "old"), 0) == (False, 0)
+    bot.seen_jobs.mark_seen("old")
+    assert bot._reached_seen_jobs(cards("old")) == (True, 1)
+
+
+def test_search_url_parameters(monkeypatch):
+    from urllib.parse import urlsplit, parse_qs
+    bot = LinkedInBot()
+
+    url = bot._build_search_url("ML OR AI", "Berlin, Germany", "past_week", start=50, newest_first=True)
+    assert parse_qs(urlsplit(url).query) == {
+        "keywords": ["ML OR AI"], "location": ["Berlin, Germany"], "sortBy": ["DD"], "f_TPR": ["r604800"], "start": ["50"]
+    }
+    assert parse_qs(urlsplit(bot._build_search_url("ML", "Remote", "any_time")).query) == {
+        "keywords": ["ML"], "location": ["Remote"]
+    }
+    assert "f_TPR" not in bot._build_search_url("ML", "Remote", "yesterday-ish")
+
+
+class SearchPageDriver(FakeDriver):
+    """A results page that has no job cards, and optionally failed to load at all."""
+
+    def __init__(self, loaded):
+        super().__init__("about:blank")
+        self.loaded = loaded
+
+    def get(self, url):
+        if self.loaded is None:
+            from selenium.common.exceptions import WebDriverException
+            raise WebDriverException("net::ERR_CONNECTION_RESET")
+        super().get(url)
+
+    def find_elements(self, by, locator):
+        return ["subtitle"] if self.loaded and "subtitle" in locator else []
+
+
+class NoCardsBrowser:
+    def wait_for_element(self, locator, timeout=None):
+        return None
+
+
+@pytest.mark.parametrize("loaded, start, falls_back", [
+    (True, 0, False),   # Loaded without results: nothing to search for in the form either
+    (False, 0, True),   # Neither cards nor a results page: the URL didn't work
+    (None, 0, True),    # Browser error
+    (None, 50, False),  # The form can't open page 3, so a paginated search isn't restarted at page 1
+])
+def test_search_form_is_only_a_fallback_for_urls_that_did_not_load(monkeypatch, loaded, start, falls_back):
+    bot = LinkedInBot()
+    bot.driver = SearchPageDriver(loaded)
+    bot.browser = NoCardsBrowser()
+    form_searches = []
+    monkeypatch.setattr(bot, "_search_by_ui", lambda *args: form_searches.append(args) or True)
+
+    assert bot.search_jobs("python", "Remote", start=start, search_mode="url") == falls_back
+    assert bool(form_searches) == falls_back
+
+
+@pytest.mark.parametrize("failures, completed", [
+    (1, {0, 25, 50}),  # Processed again on its retry
+    (5, {0, 50}),      # Out of retries: not checkpointed, so a resumed run picks it up
+])
+def test_page_that_fails_with_an_error_is_retried_and_not_checkpointed(bot, tmp_path, monkeypatch, failures, completed):
+    from types import SimpleNamespace
+    from linkedin.browser_pool import PageScheduler
+    from linkedin.checkpoint import RunCheckpoint
+
+    bot._checkpoint = RunCheckpoint(str(tmp_path / "checkpoint.json"), "20990101_000000")
+    pages = {0: cards("a"), 25: cards("b"), 50: cards("c")}
+    attempts = []
+
+    def process_cards(job_cards, fetcher=None):
+        attempts.append(job_cards)
+        if job_cards == pages[25] and attempts.count(job_cards) <= failures:
+            raise ValueError("card layout changed")
+
+    monkeypatch.setattr(bot, "_open_results_page", lambda search_url, offset: pages[offset])
+    monkeypatch.setattr(bot, "_has_next_page", lambda: True)
+    monkeypatch.setattr(bot, "_reached_seen_jobs", lambda job_cards: (False, 0))
+    monkeypatch.setattr(bot, "_browser_alive", lambda: True)
+    monkeypatch.setattr(bot, "_process_cards", process_cards)
+    pool = SimpleNamespace(browsers=[SimpleNamespace(driver=FakeDriver("about:blank"))])
+    scheduler = PageScheduler(total_jobs=75, page_size=25, max_retries=1)
+
+    bot._run_page_worker(pool, 0, scheduler, "https://www.linkedin.com/jobs/search/?keywords=ml")
+
+    assert attempts.count(pages[25]) == 2
+    assert bot._checkpoint.completed_offsets == completed
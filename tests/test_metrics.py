@@ -0,0 +1,79 @@
+import json
+import os
+import re
+
+from linkedin.metrics import RunMetrics, percentile
+
+SAMPLE = re.compile(r'^([a-zA-Z_:][a-zA-Z0-9_:]*)(?:\{(.*)\})? (\S+)$')
+LABEL = re.compile(r'([a-zA-Z_][a-zA-Z0-9_]*)="((?:[^"\\]|\\.)*)",?')
+
+
+def parse_prometheus(text):
+    """{(metric name, frozenset of labels): value} from the text exposition format."""
+    samples = {}
+    for line in text.splitlines():
+        if not line or line.startswith("#"):
+            continue
+        match = SAMPLE.match(line)
+        assert match, f"Unparseable line: {line!r}"
+        name, labels, value = match.groups()
+        parsed = {}
+        for key, raw in LABEL.findall(labels or ""):
+            parsed[key] = re.sub(r'\\(.)', lambda m: {"n": "\n"}.get(m.group(1), m.group(1)), raw)
+        samples[(name, frozenset(parsed.items()))] = float(value)
+    return samples
+
+
+def metrics_with_samples(tmp_path):
+    metrics = RunMetrics(str(tmp_path / "metrics.json"), str(tmp_path / "prom" / "bot.prom"), interval=3600)
+    for seconds in (0.1, 0.2, 0.3, 0.4):
+        metrics.observe("page_load", seconds)
+    metrics.observe('odd "stage"\\name', 1.0)
+    metrics.set_counters({"processed": 4, "failed": 1})
+    return metrics
+
+
+def test_percentile_is_nearest_rank():
+    assert percentile([3, 1, 2], 0.5) == 2
+    assert percentile([1, 2, 3, 4], 0.95) == 4
+    assert percentile([7], 0.5) == 7
+
+
+def test_json_snapshot(tmp_path):
+    metrics = metrics_with_samples(tmp_path)
+    metrics.write()
+
+    with open(tmp_path / "metrics.json") as f:
+        summary = json.load(f)
+    assert summary["stages"]["page_load"] == {"count": 4, "total_seconds": 1.0, "p50": 0.3, "p95": 0.4, "max": 0.4}
+    assert summary["counters"] == {"processed": 4, "failed": 1}
+
+
+def test_prometheus_textfile(tmp_path):
+    metrics = metrics_with_samples(tmp_path)
+    metrics.write()
+
+    path = tmp_path / "prom" / "bot.prom"
+    samples = parse_prometheus(path.read_text())
+    stage = frozenset({("stage", "page_load")})
+    assert samples[("linkedin_bot_stage_seconds", stage | {("quantile", "0.95")})] == 0.4
+    assert samples[("linkedin_bot_stage_seconds_count", stage)] == 4
+    assert samples[("linkedin_bot_stage_seconds_sum", stage)] == 1.0
+    assert samples[("linkedin_bot_stage_seconds_max", stage)] == 0.4
+    assert samples[("linkedin_bot_stage_seconds_count", frozenset({("stage", 'odd "stage"\\name')}))] == 1
+    assert samples[("linkedin_bot_jobs", frozenset({("outcome", "failed")}))] == 1
+    assert ("linkedin_bot_metrics_updated_timestamp_seconds", frozenset()) in samples
+    assert os.listdir(path.parent) == ["bot.prom"]  # Written through a temporary file that was renamed
+
+
+def test_span_times_blocks_that_raise_and_writes_only_when_due(tmp_path):
+    metrics = metrics_with_samples(tmp_path)
+    try:
+        with metrics.span("extract"):
+            raise ValueError
+    except ValueError:
+        pass
+    metrics.write_if_due()
+
+    assert metrics.summary()["stages"]["extract"]["count"] == 1
+    assert not (tmp_path / "metrics.json").exists()
@@ -0,0 +1,94 @@
+import sqlite3
+
+from linkedin.ai_matcher import BoundedMemo
+from linkedin.near_duplicates import NearDuplicateIndex, lsh_bands
+from linkedin.score_cache import content_hash
+
+POSTING = " ".join(
+    f"Senior machine learning engineer role number {i} building ranking retrieval and evaluation systems "
+    f"with Python PyTorch Spark and Kubernetes for team {i}."
+    for i in range(12)
+)
+REPOST = POSTING.replace("team 11.", "team 11 in Berlin.")
+OTHER = " ".join(f"Staff data engineer {i} owning Kafka dbt and Snowflake pipelines for analytics group {i}."
+                 for i in range(12))
+
+
+def test_band_split_keeps_threshold_pairs_as_candidates():
+    assert lsh_bands(128, 0.9) == (16, 8)
+
+
+def test_near_duplicates_join_the_first_postings_cluster(tmp_path):
+    index = NearDuplicateIndex(str(tmp_path / "index.sqlite3"))
+
+    assert index.assign("first", POSTING) == "first"
+    assert index.assign("repost", REPOST) == "first"
+    assert index.assign("other", OTHER) == "other"
+    assert index.stats == {"checked": 3, "clustered": 1}
+
+
+def test_text_without_words_keeps_its_own_key(tmp_path):
+    index = NearDuplicateIndex(str(tmp_path / "index.sqlite3"))
+
+    assert index.assign("a", "") == "a"
+    assert index.assign("b", " -- ") == "b"
+
+
+def test_clusters_persist_across_instances(tmp_path):
+    path = str(tmp_path / "index.sqlite3")
+    index = NearDuplicateIndex(path)
+    index.assign("first", POSTING)
+    index.close()
+
+    assert NearDuplicateIndex(path).assign("repost", REPOST) == "first"
+
+
+def test_index_of_another_shape_or_version_is_rebuilt(tmp_path):
+    path = str(tmp_path / "index.sqlite3")
+    index = NearDuplicateIndex(path)
+    index.assign("first", POSTING)
+    index.close()
+
+    assert NearDuplicateIndex(path, num_perm=64).assign("repost", REPOST) == "repost"
+
+    conn = sqlite3.connect(path)
+    conn.execute("DELETE FROM meta WHERE key = 'version'")
+    conn.commit()
+    conn.close()
+    index = NearDuplicateIndex(path, num_perm=64)
+    assert index._conn.execute("SELECT COUNT(*) FROM documents").fetchone()[0] == 0
+
+
+def test_repost_reuses_the_cached_score(job_matcher, fake_openai, tmp_path):
+    job_matcher.near_duplicates = NearDuplicateIndex(str(tmp_path / "index.sqlite3"))
+
+    score = job_matcher.get_match_score(POSTING)
+    assert job_matcher.get_match_score(REPOST) == score
+    assert fake_openai.stats["chat_completions"] == 1
+    assert job_matcher.cluster_id(REPOST) == content_hash(POSTING)
+
+
+def test_scores_are_cached_under_the_raw_description_hash(job_matcher, tmp_path):
+    job_matcher.near_duplicates = NearDuplicateIndex(str(tmp_path / "index.sqlite3"))
+    job_matcher.cache_score(POSTING, 6)
+
+    assert job_matcher.score_cache.get(job_matcher._cache_key(content_hash(POSTING))) == 6
+
+
+def test_bounded_memo_drops_the_oldest_items():
+    memo = BoundedMemo(max_entries=2)
+    for key in "abc":
+        memo.put(key, key.upper())
+
+    assert len(memo) == 2
+    assert memo.get("a") is None
+    assert memo.get("c") == "C"
+
+
+def test_each_uncached_job_counts_one_miss(job_matcher, tmp_path):
+    job_matcher.near_duplicates = NearDuplicateIndex(str(tmp_path / "index.sqlite3"))
+    job_matcher.get_match_score(POSTING)
+    job_matcher.get_match_score(REPOST)
+    job_matcher.get_match_score(OTHER)
+
+    assert job_matcher.cache_stats() == {"hits": 1, "misses": 2, "stores": 2}
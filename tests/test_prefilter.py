@@ -0,0 +1,52 @@
+from linkedin.prefilter import RelevancePrefilter, tokenize, replay
+from linkedin.job_store import JobStore
+
+RESUME = "Machine learning engineer: Python, PyTorch, NLP, LLM fine-tuning, C++ inference, node.js tooling."
+ML_JOB = "We need a machine learning engineer with Python and PyTorch to build NLP and LLM systems."
+UNRELATED_JOB = "Registered nurse for our night shift. Patient care, medication administration, charting."
+
+
+def test_tokenize_keeps_technical_tokens_and_drops_stop_words():
+    assert tokenize("The C++ and C# devs use node.js") == ["c++", "c#", "devs", "use", "node.js"]
+
+
+def test_relevant_jobs_score_higher_than_unrelated_ones():
+    scores = RelevancePrefilter(RESUME).score_batch([ML_JOB, UNRELATED_JOB])
+    assert scores[0] > 0.1
+    assert scores[1] == 0
+
+
+def test_log_only_mode_passes_every_job_but_counts_the_low_ones():
+    prefilter = RelevancePrefilter(RESUME, threshold=0.05, skip=False)
+    scores, passed = prefilter.check_batch([ML_JOB, UNRELATED_JOB])
+
+    assert passed.tolist() == [True, True]
+    assert prefilter.stats == {"checked": 2, "below_threshold": 1, "skipped": 0}
+    assert "log only" in prefilter.summary()
+
+
+def test_skip_mode_drops_jobs_below_the_threshold():
+    prefilter = RelevancePrefilter(RESUME, threshold=0.05, skip=True)
+    score, passed = prefilter.check(UNRELATED_JOB)
+
+    assert not passed
+    assert prefilter.check(ML_JOB)[1]
+    assert prefilter.stats["skipped"] == 1
+
+
+def test_skills_weigh_in_on_the_resume_side():
+    job = "Kubernetes operator experience required"
+    assert RelevancePrefilter(RESUME).score_batch([job])[0] == 0
+    assert RelevancePrefilter(RESUME, skills=["kubernetes"]).score_batch([job])[0] > 0
+
+
+def test_replay_reports_savings_and_lost_good_jobs(tmp_path):
+    path = str(tmp_path / "job_descriptions_scored_1.jsonl")
+    store = JobStore(path)
+    store.append("a", {"job_description": ML_JOB, "match_score": 9})
+    store.append("b", {"job_description": UNRELATED_JOB, "match_score": 1})
+    store.close()
+
+    report = replay(RESUME, [path], thresholds=[0.0, 0.05, 1.0])
+    assert [row["skipped"] for row in report] == [0, 1, 2]
+    assert [row["good_lost"] for row in report] == [0, 0, 1]
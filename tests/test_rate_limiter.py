@@ -0,0 +1,92 @@
+import asyncio
+
+import pytest
+
+import linkedin.ai_matcher as ai_matcher
+import linkedin.rate_limiter as rate_limiter
+from linkedin.rate_limiter import RateLimiter, TokenBucket
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_bucket_makes_callers_wait_once_empty_and_refills_over_time():
+    clock = FakeClock()
+    bucket = TokenBucket(60, clock=clock)  # One token per second
+
+    assert all(bucket.reserve() == 0 for _ in range(60))
+    assert bucket.reserve() == pytest.approx(1.0)
+    assert bucket.reserve() == pytest.approx(2.0)  # Queued behind the previous reservation
+    clock.now += 10
+    assert bucket.reserve() == 0
+
+
+def test_request_bigger_than_the_bucket_only_waits_for_a_full_bucket():
+    clock = FakeClock()
+    bucket = TokenBucket(600, clock=clock)
+    bucket.reserve(600)
+
+    assert bucket.reserve(10_000) == pytest.approx(60.0)
+
+
+def test_limiter_waits_for_the_tighter_budget(monkeypatch):
+    clock = FakeClock()
+    sleeps = []
+    monkeypatch.setattr(rate_limiter.time, "sleep", sleeps.append)
+    limiter = RateLimiter(requests_per_minute=600, tokens_per_minute=6000, clock=clock)
+
+    limiter.acquire(6000)  # Spends the whole token budget
+    limiter.acquire(100)
+    assert sleeps == [pytest.approx(1.0)]  # 100 tokens at 100 tokens/second
+
+    limiter.record_usage(estimated_tokens=100, actual_tokens=40)  # Over-estimate refunded
+    assert limiter.tokens.reserve(60) == pytest.approx(1.0)
+
+
+@pytest.mark.parametrize("use_async", [False, True])
+def test_failed_requests_are_retried_with_backoff(job_matcher, fake_openai, monkeypatch, use_async):
+    attempts = []
+
+    def backoff_delay(attempt):
+        attempts.append(attempt)
+        fake_openai.error_rate = 0.0  # The retry succeeds
+        return 0.0
+
+    monkeypatch.setattr(ai_matcher, "backoff_delay", backoff_delay)
+    fake_openai.error_rate = 1.0
+    if use_async:
+        score = asyncio.run(job_matcher.get_match_score_async("Python engineer"))
+    else:
+        score = job_matcher.get_match_score("Python engineer")
+
+    assert isinstance(score, int)
+    assert attempts == [0]
+    assert fake_openai.stats["injected_errors"] == 1
+    assert fake_openai.stats["chat_completions"] == 2
+
+
+def test_score_many_keeps_at_most_concurrency_requests_in_flight(job_matcher, monkeypatch):
+    in_flight = []
+    peak = []
+
+    async def get_match_scores_async(job_descriptions):
+        in_flight.append(1)
+        peak.append(len(in_flight))
+        await asyncio.sleep(0.01)
+        in_flight.pop()
+        return {job_id: 5 for job_id in job_descriptions}
+
+    monkeypatch.setattr(job_matcher, "get_match_scores_async", get_match_scores_async)
+    reported = {}
+    results = asyncio.run(job_matcher.score_many(
+        {f"job-{i}": "description" for i in range(20)},
+        concurrency=3, batch_size=2, on_result=reported.__setitem__
+    ))
+
+    assert max(peak) == 3
+    assert results == reported == {f"job-{i}": 5 for i in range(20)}
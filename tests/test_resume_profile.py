@@ -0,0 +1,74 @@
+import os
+import stat
+from datetime import date
+
+import pytest
+
+import linkedin.resume_profile as resume_profile
+from linkedin.resume_profile import build_profile, load_resume
+
+RESUME = """JANE DOE
+jane@example.com
+
+EXPERIENCE
+Machine Learning Engineer
+Contoso | Jan 2020 - Dec 2022
+• Built ranking models with PyTorch
+Data Scientist
+Fabrikam | Jan 2022 - Present
+
+SKILLS
+Python, PyTorch, SQL; Kubernetes
+"""
+
+
+@pytest.fixture
+def extractions(monkeypatch):
+    """Texts handed out by a stubbed PDF extractor, recording each path it was called for."""
+    calls = []
+
+    def extract_text(path):
+        calls.append(path)
+        with open(path) as f:
+            return f.read()
+
+    monkeypatch.setattr(resume_profile, "extract_text", extract_text)
+    monkeypatch.setattr(resume_profile, "_loaded", {})
+    return calls
+
+
+def test_build_profile():
+    profile = build_profile(RESUME)
+
+    assert profile["skills"] == ["Python", "PyTorch", "SQL", "Kubernetes"]
+    assert profile["titles"] == ["Machine Learning Engineer", "Data Scientist"]
+    today = date.today()
+    months = (today.year - 2020) * 12 + today.month
+    assert profile["years_experience"] == round(months / 12, 1)
+
+
+def test_resume_is_parsed_once_and_cached_by_hash(tmp_path, extractions):
+    pdf = tmp_path / "resume.pdf"
+    pdf.write_text(RESUME)
+    cache_path = str(tmp_path / "resume_cache.json")
+
+    first = load_resume(str(pdf), cache_path)
+    assert load_resume(str(pdf), cache_path) is first
+    resume_profile._loaded.clear()  # A new process: only the file cache is left
+    assert load_resume(str(pdf), cache_path) == first
+    assert len(extractions) == 1
+    assert stat.S_IMODE(os.stat(cache_path).st_mode) == 0o600
+
+
+def test_edited_resume_is_parsed_again(tmp_path, extractions):
+    pdf = tmp_path / "resume.pdf"
+    pdf.write_text(RESUME)
+    cache_path = str(tmp_path / "resume_cache.json")
+    load_resume(str(pdf), cache_path)
+
+    pdf.write_text(RESUME.replace("SQL", "SQL, Rust"))
+    resume_profile._loaded.clear()
+    resume = load_resume(str(pdf), cache_path)
+
+    assert len(extractions) == 2
+    assert "Rust" in resume["profile"]["skills"]
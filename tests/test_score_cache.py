@@ -0,0 +1,67 @@
+import time
+
+from linkedin.score_cache import ScoreCache, content_hash
+
+
+def key(job="job", resume="resume", needs="needs", model="gpt-4o"):
+    return (content_hash(job), content_hash(resume), content_hash(needs), model)
+
+
+def test_round_trips_scores_and_counts_hits(tmp_path):
+    cache = ScoreCache(str(tmp_path / "cache.sqlite3"))
+    assert cache.get(key()) is None
+    cache.put(key(), 7.5)
+
+    assert cache.get(key()) == 7.5
+    assert cache.stats() == {"hits": 1, "misses": 1, "stores": 1}
+
+
+def test_any_part_of_the_key_changing_is_a_miss(tmp_path):
+    cache = ScoreCache(str(tmp_path / "cache.sqlite3"))
+    cache.put(key(), 8)
+
+    assert cache.get(key(job="other job")) is None
+    assert cache.get(key(resume="new resume")) is None
+    assert cache.get(key(needs="new needs")) is None
+    assert cache.get(key(model="gpt-4o-mini")) is None
+
+
+def test_persists_across_instances(tmp_path):
+    path = str(tmp_path / "cache.sqlite3")
+    cache = ScoreCache(path)
+    cache.put(key(), 6)
+    cache.close()
+
+    assert ScoreCache(path).get(key()) == 6
+
+
+def test_evicts_least_recently_used_beyond_max_entries(tmp_path):
+    cache = ScoreCache(str(tmp_path / "cache.sqlite3"), max_entries=2)
+    for job in ("a", "b", "c"):
+        cache.put(key(job), 5)
+        time.sleep(0.01)
+    cache.get(key("a"))  # Most recently used now
+    cache.evict()
+
+    assert cache.get(key("a")) == 5
+    assert cache.get(key("b")) is None
+    assert cache.get(key("c")) == 5
+
+
+def test_evicts_entries_older_than_max_age(tmp_path):
+    path = str(tmp_path / "cache.sqlite3")
+    cache = ScoreCache(path, max_age_days=1)
+    cache.put(key(), 9)
+    cache._conn.execute("UPDATE scores SET created_at = ?", (time.time() - 2 * 86400,))
+    cache._conn.commit()
+    cache.evict()
+
+    assert cache.get(key()) is None
+
+
+def test_matcher_scores_each_description_once(job_matcher, fake_openai):
+    description = "Senior ML engineer, Python and PyTorch, remote."
+    first = job_matcher.get_match_score(description)
+
+    assert job_matcher.get_match_score(description) == first
+    assert fake_openai.stats["chat_completions"] == 1
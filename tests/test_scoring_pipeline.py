@@ -0,0 +1,151 @@
+import threading
+import time
+
+import pytest
+
+from linkedin.scoring_pipeline import ScoringPipeline
+from linkedin.usage import BudgetExceededError
+
+
+class StubMatcher:
+    """Scores each description by its length; calls can be held until release() to pile up work."""
+
+    def __init__(self, results=None, hold=False):
+        self.results = results or {}
+        self.batches = []
+        self.started = threading.Event()
+        self._released = threading.Event()
+        if not hold:
+            self._released.set()
+
+    def release(self):
+        self._released.set()
+
+    def get_match_scores(self, job_descriptions):
+        self.batches.append(list(job_descriptions))
+        self.started.set()
+        self._released.wait(5)
+        if "raise" in job_descriptions:
+            raise RuntimeError("matcher crashed")
+        return {job_id: self.results.get(job_id, len(description))
+                for job_id, description in job_descriptions.items()}
+
+
+def job(description="desc"):
+    return {"job_title": "Engineer", "company_name": "Contoso", "job_description": description}
+
+
+def collect():
+    scored = []
+    return scored, lambda job_id, job_data, score: scored.append((job_id, score))
+
+
+def wait_until(condition, timeout=5):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "timed out"
+        time.sleep(0.01)
+
+
+def test_scores_every_job_in_order_with_one_worker():
+    scored, on_scored = collect()
+    pipeline = ScoringPipeline(StubMatcher(), on_scored, workers=1)
+    for i in range(5):
+        pipeline.submit(f"job-{i}", job("x" * i))
+    pipeline.close()
+
+    assert scored == [(f"job-{i}", i) for i in range(5)]
+    assert pipeline.stats["submitted"] == pipeline.stats["scored"] == 5
+    assert pipeline.stats["failed"] == 0
+
+
+def test_waiting_jobs_are_scored_together_up_to_batch_size():
+    matcher = StubMatcher(hold=True)
+    scored, on_scored = collect()
+    pipeline = ScoringPipeline(matcher, on_scored, workers=1, batch_size=3)
+    pipeline.submit("first", job())
+    matcher.started.wait(5)
+    for i in range(4):
+        pipeline.submit(f"job-{i}", job())
+    matcher.release()
+    pipeline.close()
+
+    assert matcher.batches == [["first"], ["job-0", "job-1", "job-2"], ["job-3"]]
+    assert len(scored) == 5
+
+
+def test_full_queue_blocks_the_producer():
+    matcher = StubMatcher(hold=True)
+    pipeline = ScoringPipeline(matcher, lambda *args: None, workers=1, max_queue=1)
+    pipeline.submit("in-flight", job())
+    matcher.started.wait(5)
+    pipeline.submit("queued", job())
+
+    blocked = threading.Thread(target=pipeline.submit, args=("blocked", job()))
+    blocked.start()
+    blocked.join(0.2)
+    assert blocked.is_alive()
+
+    matcher.release()
+    blocked.join(5)
+    assert not blocked.is_alive()
+    pipeline.close()
+    assert pipeline.stats["scored"] == 3
+    assert pipeline.stats["producer_wait_seconds"] >= 0.2
+
+
+def test_failures_are_counted_and_do_not_stop_the_workers():
+    matcher = StubMatcher(results={"error": ValueError("bad reply"), "budget": BudgetExceededError("spent")})
+
+    def on_scored(job_id, job_data, score):
+        if job_id == "unsaved":
+            raise OSError("disk full")
+
+    pipeline = ScoringPipeline(matcher, on_scored, workers=1)
+    for job_id in ("error", "budget", "unsaved", "raise", "ok"):
+        pipeline.submit(job_id, job())
+    pipeline.close()
+
+    assert pipeline.stats["failed"] == 3
+    assert pipeline.stats["over_budget"] == 1
+    assert pipeline.stats["scored"] == 1
+
+
+def test_cancel_drops_queued_jobs_and_lets_in_flight_ones_finish():
+    matcher = StubMatcher(hold=True)
+    scored, on_scored = collect()
+    pipeline = ScoringPipeline(matcher, on_scored, workers=1)
+    pipeline.submit("in-flight", job())
+    matcher.started.wait(5)
+    for i in range(3):
+        pipeline.submit(f"job-{i}", job())
+
+    threading.Timer(0.1, matcher.release).start()
+    pipeline.close(cancel_pending=True)
+
+    assert [job_id for job_id, _ in scored] == ["in-flight"]
+    assert pipeline.stats["cancelled"] == 3
+    with pytest.raises(RuntimeError):
+        pipeline.submit("late", job())
+
+
+def test_cancel_works_while_a_close_is_already_draining():
+    matcher = StubMatcher(hold=True)
+    scored, on_scored = collect()
+    pipeline = ScoringPipeline(matcher, on_scored, workers=1)
+    pipeline.submit("in-flight", job())
+    matcher.started.wait(5)
+    for i in range(3):
+        pipeline.submit(f"job-{i}", job())
+
+    # The final drain, interrupted by Ctrl-C, then the cleanup's cancelling close
+    draining = threading.Thread(target=pipeline.close, daemon=True)
+    draining.start()
+    wait_until(lambda: pipeline._closed)
+    threading.Timer(0.1, matcher.release).start()
+    pipeline.close(cancel_pending=True)
+
+    assert pipeline._cancelled.is_set()
+    assert not any(thread.is_alive() for thread in pipeline._threads)
+    assert pipeline.stats["cancelled"] == 3
+    assert len(scored) == 1
@@ -0,0 +1,75 @@
+from linkedin.search_scheduler import SearchScheduler, build_search_tasks
+
+TASK = {"keywords": "python", "location": "Remote", "date_posted": "past_week", "key": "python | Remote | past_week"}
+
+
+def test_high_water_mark_is_saved_and_loaded(tmp_path, monkeypatch):
+    import linkedin.search_scheduler as search_scheduler
+    monkeypatch.setattr(search_scheduler, "HIGH_WATER_MARK_SIZE", 3)
+    path = str(tmp_path / "query_stats.json")
+    scheduler = SearchScheduler([TASK], path)
+    scheduler.record(TASK, new_jobs=2, seen_jobs=0, failed_jobs=0, seconds=1, new_job_ids=["2", "1"])
+    scheduler.record(TASK, new_jobs=2, seen_jobs=0, failed_jobs=0, seconds=1, new_job_ids=["4", "3"])
+
+    reloaded = SearchScheduler([TASK], path)
+    assert reloaded.high_water_ids(TASK) == {"4", "3", "2"}
+    assert reloaded.high_water_ids({**TASK, "key": "other"}) == set()
+
+
+def format_query(keywords):
+    return " OR ".join(keywords)
+
+
+def test_build_search_tasks_expands_and_deduplicates_settings():
+    settings = {
+        "keyword_groups": [["AI", "LLM"], "python", "python"],
+        "locations": ["Remote", "Berlin"],
+        "date_ranges": ["past_week"],
+    }
+
+    tasks = build_search_tasks(settings, format_query)
+
+    assert [task["key"] for task in tasks] == [
+        "AI OR LLM | Remote | past_week", "AI OR LLM | Berlin | past_week",
+        "python | Remote | past_week", "python | Berlin | past_week",
+    ]
+
+
+def test_build_search_tasks_falls_back_to_the_single_search_settings():
+    tasks = build_search_tasks({"job_keywords": ["ML"], "date_posted_filter": "past_24_hours"}, format_query)
+
+    assert tasks == [{"keywords": "ML", "location": "Worldwide", "date_posted": "past_24_hours",
+                      "key": "ML | Worldwide | past_24_hours"}]
+
+
+def test_searches_run_new_first_then_by_historical_yield(tmp_path):
+    path = str(tmp_path / "query_stats.json")
+    low, high, new = (dict(TASK, key=key) for key in ("low", "high", "new"))
+    scheduler = SearchScheduler([low, high], path)
+    scheduler.record(low, new_jobs=1, seen_jobs=5, failed_jobs=0, seconds=10)
+    scheduler.record(high, new_jobs=8, seen_jobs=0, failed_jobs=0, seconds=10)
+
+    reloaded = SearchScheduler([low, high, new], path)
+
+    assert [task["key"] for task in reloaded] == ["new", "high", "low"]
+    assert reloaded.expected_yield(high) == 8
+
+
+def test_yield_is_a_moving_average(tmp_path, monkeypatch):
+    import linkedin.search_scheduler as search_scheduler
+    monkeypatch.setattr(search_scheduler, "QUERY_YIELD_SMOOTHING", 0.5)
+    scheduler = SearchScheduler([TASK], str(tmp_path / "query_stats.json"))
+    scheduler.record(TASK, new_jobs=10, seen_jobs=0, failed_jobs=0, seconds=1)
+    scheduler.record(TASK, new_jobs=0, seen_jobs=0, failed_jobs=0, seconds=1)
+
+    assert scheduler.expected_yield(TASK) == 5
+
+
+def test_unreadable_history_is_ignored(tmp_path):
+    path = tmp_path / "query_stats.json"
+    for content in ("{not json", "[1, 2]"):
+        path.write_text(content)
+        scheduler = SearchScheduler([TASK], str(path))
+        assert scheduler.history == {}
+        scheduler.record(TASK, new_jobs=1, seen_jobs=0, failed_jobs=0, seconds=1)
+        assert SearchScheduler([TASK], str(path)).expected_yield(TASK) == 1
@@ -0,0 +1,46 @@
+import pytest
+
+from linkedin.usage import UsageTracker, BudgetExceededError
+
+
+def test_cached_prompt_tokens_are_billed_at_the_cached_rate():
+    tracker = UsageTracker("gpt-4o", budget_usd=None)
+    tracker.record({"prompt_tokens": 1_000_000, "completion_tokens": 0,
+                    "prompt_tokens_details": {"cached_tokens": 400_000}})
+
+    assert tracker.stats["cost_usd"] == pytest.approx(600_000 * 2.50 / 1e6 + 400_000 * 1.25 / 1e6)
+    assert tracker.stats["cached_tokens"] == 400_000
+
+
+def test_budget_stops_further_requests():
+    tracker = UsageTracker("gpt-4o-mini", budget_usd=0.01)
+    tracker.check_budget()
+    tracker.record({"prompt_tokens": 100_000, "completion_tokens": 0})
+
+    with pytest.raises(BudgetExceededError):
+        tracker.check_budget()
+
+
+def test_unknown_model_costs_nothing_and_is_reported():
+    tracker = UsageTracker("some-new-model")
+    tracker.record({"prompt_tokens": 10, "completion_tokens": 5})
+
+    assert tracker.stats["cost_usd"] == 0.0
+    assert any("no MODEL_PRICING entry" in line for line in tracker.summary_lines())
+
+
+def test_compaction_savings_are_summarized():
+    tracker = UsageTracker("gpt-4o")
+    tracker.record_compaction(1000, 600)
+
+    assert tracker.summary()["tokens_saved_estimate"] == 100
+    assert any("400 characters removed" in line for line in tracker.summary_lines())
+
+
+def test_budget_check_counts_the_estimated_cost():
+    tracker = UsageTracker("gpt-4o", budget_usd=0.01)
+    tracker.record({"prompt_tokens": 2_000, "completion_tokens": 0})
+    tracker.check_budget(estimated_cost=0.005)
+
+    with pytest.raises(BudgetExceededError, match="would be exceeded"):
+        tracker.check_budget(estimated_cost=0.006)